@@ -0,0 +1,232 @@
+'''
+Teste de estresse do repositório concorrente: várias threads cadastrando e
+várias threads chamando pacientes sobre o mesmo repositório
+
+Verifica que:
+- nenhum paciente é perdido nem chamado duas vezes
+- pacientes do mesmo cadastrador e da mesma cor saem na ordem de chegada (FIFO)
+- com cadastros simultâneos, nenhuma chamada devolve uma cor menos urgente enquanto
+  um paciente mais urgente, cadastrado antes de ela começar, continua esperando
+- na fase de esvaziamento, cada consultório recebe pacientes em ordem de prioridade
+
+Uso (na raiz do projeto):
+    python -m benchmarks.concurrency_stress [--writers 8] [--callers 8] [--patients 20000]
+    python -m benchmarks.concurrency_stress --repository in-memory   # referência sem locks
+
+Termina com código 1 se alguma verificação falhar
+'''
+import argparse
+import bisect
+import itertools
+import random
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.application.interfaces.i_queue_repository import IQueueRepository
+from src.infrastructure.repositories.concurrent_repository import ConcurrentQueueRepository
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+
+REPOSITORIES = {
+    "concurrent": ConcurrentQueueRepository,
+    "in-memory": InMemoryQueueRepository,
+}
+
+# Cada paciente do teste carrega (cadastrador, sequência) no nome: "w3-1571"
+def _origin(patient: Patient) -> Tuple[int, int]:
+    writer, sequence = patient.name[1:].split("-")
+    return int(writer), int(sequence)
+
+
+def _run_threads(targets) -> List[BaseException]:
+    errors: List[BaseException] = []
+
+    def guarded(target):
+        try:
+            target()
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=guarded, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def mixed_phase(repo: IQueueRepository, writers: int, callers: int, per_writer: int, seed: int) -> List[str]:
+    '''
+    Cadastros e chamadas simultâneos. Retorna a lista de falhas encontradas
+    '''
+    failures: List[str] = []
+    classification_of: Dict[Tuple[int, int], Classification] = {}
+    writers_done = threading.Event()
+    remaining_writers = [writers]
+    remaining_lock = threading.Lock()
+    dispatched: List[List[Patient]] = [[] for _ in range(callers)]
+    # Relógio lógico compartilhado (next() de itertools.count é atômico): marca o fim de
+    # cada cadastro e o início/fim de cada chamada, para a verificação de prioridade
+    clock = itertools.count()
+    registered_at: Dict[Tuple[int, int], int] = {}
+    calls: List[List[Tuple[int, int, Optional[Patient]]]] = [[] for _ in range(callers)]
+
+    def writer(index: int):
+        rng = random.Random(seed + index)
+        classifications = list(Classification)
+        for sequence in range(per_writer):
+            classification = rng.choice(classifications)
+            classification_of[(index, sequence)] = classification
+            repo.add_patient(Patient(f"w{index}-{sequence}"), classification)
+            registered_at[(index, sequence)] = next(clock)
+        with remaining_lock:
+            remaining_writers[0] -= 1
+            if remaining_writers[0] == 0:
+                writers_done.set()
+
+    def caller(index: int):
+        local = dispatched[index]
+        local_calls = calls[index]
+        while True:
+            started = next(clock)
+            patient = repo.get_next_patient()
+            local_calls.append((started, next(clock), patient))
+            if patient is not None:
+                local.append(patient)
+            elif writers_done.is_set() and sum(repo.get_status().values()) == 0:
+                return
+
+    errors = _run_threads([lambda i=i: writer(i) for i in range(writers)] +
+                          [lambda i=i: caller(i) for i in range(callers)])
+    failures.extend(f"exceção em thread: {e!r}" for e in errors)
+
+    every = [patient for local in dispatched for patient in local]
+    expected = writers * per_writer
+    if len(every) != expected:
+        failures.append(f"{len(every)} pacientes chamados, esperado {expected} (perdidos ou duplicados)")
+    if len({patient.id for patient in every}) != len(every):
+        failures.append("paciente chamado mais de uma vez")
+
+    # FIFO: para o mesmo consultório, mesmo cadastrador e mesma cor, a sequência deve crescer
+    for local in dispatched:
+        last_seen: Dict[Tuple[int, Classification], int] = {}
+        for patient in local:
+            writer_index, sequence = _origin(patient)
+            key = (writer_index, classification_of[(writer_index, sequence)])
+            if last_seen.get(key, -1) > sequence:
+                failures.append(f"ordem FIFO violada na fila {key[1].name} do cadastrador {writer_index}")
+                break
+            last_seen[key] = sequence
+
+    failures.extend(_priority_violations(calls, classification_of, registered_at))
+    return failures
+
+
+def _priority_violations(calls: List[List[Tuple[int, int, Optional[Patient]]]],
+                         classification_of: Dict[Tuple[int, int], Classification],
+                         registered_at: Dict[Tuple[int, int], int]) -> List[str]:
+    '''
+    Ordem de prioridade válida com concorrência: uma chamada [início, fim] que devolveu
+    a cor P (ou nenhum paciente) é uma violação se algum paciente de cor mais urgente
+    terminou de ser cadastrado antes do início e só foi chamado por uma chamada que
+    começou depois do fim, ou seja, esperou durante a chamada inteira
+    '''
+    # Para cada paciente chamado: o início da chamada que o retirou
+    taken_at: Dict[Tuple[int, int], int] = {}
+    for local_calls in calls:
+        for started, _, patient in local_calls:
+            if patient is not None:
+                taken_at[_origin(patient)] = started
+
+    # Por prioridade: cadastros ordenados e o maior "chamado em" entre os cadastrados até cada ponto
+    by_priority: Dict[int, Tuple[List[int], List[int]]] = {}
+    for priority in sorted({cls.priority for cls in Classification}):
+        pairs = sorted((registered_at[key], taken_at.get(key, float("inf")))
+                       for key, cls in classification_of.items() if cls.priority == priority and key in registered_at)
+        registrations = [registered for registered, _ in pairs]
+        latest_taken = list(itertools.accumulate((taken for _, taken in pairs), max))
+        by_priority[priority] = (registrations, latest_taken)
+
+    least_urgent = max(by_priority) + 1
+    for index, local_calls in enumerate(calls):
+        for started, finished, patient in local_calls:
+            returned = classification_of[_origin(patient)].priority if patient is not None else least_urgent
+            for priority in range(returned):
+                if priority not in by_priority:
+                    continue
+                registrations, latest_taken = by_priority[priority]
+                count = bisect.bisect_left(registrations, started)
+                if count and latest_taken[count - 1] > finished:
+                    return [f"consultório {index} recebeu prioridade {returned} enquanto a prioridade "
+                            f"{priority}, cadastrada antes da chamada, esperava"]
+    return []
+
+
+def drain_phase(repo: IQueueRepository, callers: int, patients: int, seed: int) -> List[str]:
+    '''
+    Filas pré-carregadas e esvaziadas por vários consultórios ao mesmo tempo.
+    Sem novos cadastros, cada consultório deve receber prioridades não decrescentes
+    '''
+    failures: List[str] = []
+    rng = random.Random(seed)
+    classifications = list(Classification)
+    priority_of: Dict[int, int] = {}
+    for sequence in range(patients):
+        classification = rng.choice(classifications)
+        priority_of[sequence] = classification.priority
+        repo.add_patient(Patient(f"w0-{sequence}"), classification)
+
+    seen: List[List[Patient]] = [[] for _ in range(callers)]
+
+    def caller(index: int):
+        local = seen[index]
+        while True:
+            patient = repo.get_next_patient()
+            if patient is None:
+                return
+            local.append(patient)
+
+    errors = _run_threads([lambda i=i: caller(i) for i in range(callers)])
+    failures.extend(f"exceção em thread: {e!r}" for e in errors)
+
+    every = [patient for local in seen for patient in local]
+    if len(every) != patients or len({patient.id for patient in every}) != patients:
+        failures.append(f"esvaziamento: {len(every)} chamados, {len({p.id for p in every})} distintos, esperado {patients}")
+    for index, local in enumerate(seen):
+        local = [priority_of[_origin(patient)[1]] for patient in local]
+        if any(later < earlier for earlier, later in zip(local, local[1:])):
+            failures.append(f"consultório {index} recebeu pacientes fora da ordem de prioridade")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estresse multi-thread do repositório de filas")
+    parser.add_argument("--repository", choices=sorted(REPOSITORIES), default="concurrent")
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--callers", type=int, default=8)
+    parser.add_argument("--patients", type=int, default=20_000, help="pacientes por cadastrador")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Trocas de thread mais frequentes aumentam a chance de expor corridas
+    sys.setswitchinterval(1e-6)
+
+    start = time.perf_counter()
+    failures = mixed_phase(REPOSITORIES[args.repository](), args.writers, args.callers, args.patients, args.seed)
+    failures += drain_phase(REPOSITORIES[args.repository](), args.callers, args.writers * args.patients, args.seed)
+    elapsed = time.perf_counter() - start
+
+    if failures:
+        print(f"[FALHOU] {args.repository} ({elapsed:.1f}s):")
+        for failure in sorted(set(failures)):
+            print(f"  - {failure}")
+        sys.exit(1)
+    print(f"[OK] {args.repository}: {args.writers} cadastradores x {args.patients} pacientes, "
+          f"{args.callers} consultórios ({elapsed:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
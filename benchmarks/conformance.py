@@ -0,0 +1,327 @@
+'''
+Conformidade e carga comparativa entre implementações de IQueueRepository
+
+Para cada tamanho de fila (pacientes já esperando antes da medição), cada backend
+é pré-carregado e recebe a mesma carga mista e semeada: rajadas de cadastros
+(add_patient / add_patients), chamadas (get_next_patient / get_next_patients) e
+leituras de status. Cada resposta é comparada com a do modelo de referência
+(InMemoryQueueRepository executando a mesma carga) e, no fim, as filas são
+esvaziadas e a ordem de saída também é conferida
+
+O relatório mostra, lado a lado, a vazão e as latências p50/p99/p999 de cada tipo
+de operação. Qualquer implementação entra no teste por uma fábrica que recebe um
+diretório temporário e devolve o repositório vazio:
+
+    # meu_pacote/fabricas.py
+    def meu_repo(directory: str) -> IQueueRepository:
+        return MeuRepositorio(os.path.join(directory, "dados"))
+
+Uso (na raiz do projeto):
+    python -m benchmarks.conformance
+    python -m benchmarks.conformance --sizes 1000 100000 1000000 10000000 --operations 200000
+    python -m benchmarks.conformance --backend in-memory sqlite --backend meu_pacote.fabricas:meu_repo
+
+Termina com código 1 se algum backend divergir da referência
+'''
+import argparse
+import hashlib
+import importlib
+import math
+import random
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.application.interfaces.i_queue_repository import IQueueRepository
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+from src.infrastructure.repositories.concurrent_repository import ConcurrentQueueRepository
+from src.infrastructure.repositories.deadline_repository import DeadlineQueueRepository, POLICY_STRICT
+from src.infrastructure.repositories.journaled_repository import JournaledQueueRepository
+from src.infrastructure.repositories.sqlite_repository import SqliteQueueRepository
+
+# Uma fábrica recebe um diretório temporário (que pode ignorar) e devolve um repositório vazio
+RepositoryFactory = Callable[[str], IQueueRepository]
+
+BACKENDS: Dict[str, RepositoryFactory] = {
+    "in-memory": lambda directory: InMemoryQueueRepository(),
+    "concurrent": lambda directory: ConcurrentQueueRepository(),
+    # Sem escalonamento, a política "strict" tem a mesma ordem da referência
+    "deadline-strict": lambda directory: DeadlineQueueRepository(POLICY_STRICT, escalate=False),
+    "journaled": lambda directory: JournaledQueueRepository(directory, fsync_policy="never", group_size=1024),
+    "sqlite": lambda directory: SqliteQueueRepository(f"{directory}/queue.db", commit_every=1024, synchronous="OFF"),
+}
+
+# Tipos de operação da carga
+REGISTER = "cadastro"
+CALL = "chamada"
+STATUS = "status"
+KINDS = (REGISTER, CALL, STATUS)
+
+_COLORS: Tuple[Classification, ...] = tuple(sorted(Classification, key=lambda c: c.priority))
+_PRELOAD_CHUNK = 50_000
+
+
+def _patient(patient_id: int) -> Patient:
+    # Pacientes com id determinístico: referência e backend recebem os mesmos ids
+    return Patient.restore(f"P{patient_id}", patient_id)
+
+
+def _status_tuple(repo: IQueueRepository) -> Tuple[int, ...]:
+    status = repo.get_status()
+    return tuple(status[cls] for cls in _COLORS)
+
+
+def build_workload(operations: int, first_id: int, seed: int) -> List[Tuple[str, Any]]:
+    '''
+    Gera a carga mista: ~45% rajadas de cadastro, ~45% chamadas e ~10% leituras de status
+
+    Cadastros e chamadas usam a mesma distribuição de tamanhos (quase sempre 1, às vezes
+    um lote de 2 a 64), então o número de pacientes em espera fica estável. Cada
+    cadastro é uma lista de (id, prioridade); cada chamada é a quantidade pedida
+    '''
+    rng = random.Random(seed)
+    weights = (2, 8, 25, 45, 20)
+    next_id = first_id
+    workload = []
+    for _ in range(operations):
+        roll = rng.random()
+        size = rng.randint(2, 64) if rng.random() < 0.05 else 1
+        if roll < 0.45:
+            priorities = rng.choices(range(len(_COLORS)), weights, k=size)
+            workload.append((REGISTER, [(next_id + i, priority) for i, priority in enumerate(priorities)]))
+            next_id += size
+        elif roll < 0.90:
+            workload.append((CALL, size))
+        else:
+            workload.append((STATUS, None))
+    return workload
+
+
+def _preload(repo: IQueueRepository, count: int, seed: int):
+    # Carrega 'count' pacientes em lotes (sem nunca materializar todos de uma vez aqui)
+    rng = random.Random(seed)
+    for start in range(0, count, _PRELOAD_CHUNK):
+        end = min(count, start + _PRELOAD_CHUNK)
+        colors = rng.choices(_COLORS, (2, 8, 25, 45, 20), k=end - start)
+        repo.add_patients(zip(map(_patient, range(start, end)), colors))
+
+
+def _drain_digest(repo: IQueueRepository) -> Tuple[int, str]:
+    # Esvazia o repositório e resume a ordem de saída (quantidade + hash dos ids)
+    digest = hashlib.blake2b(digest_size=16)
+    total = 0
+    while True:
+        patients = repo.get_next_patients(_PRELOAD_CHUNK)
+        if not patients:
+            return total, digest.hexdigest()
+        total += len(patients)
+        digest.update(",".join(str(patient.id) for patient in patients).encode())
+        digest.update(b";")
+
+
+def _replay(repo: IQueueRepository, workload: List[Tuple[str, Any]],
+            latencies: Optional[Dict[str, List[int]]] = None) -> Iterator[Any]:
+    '''
+    Aplica a carga ao repositório, produzindo a resposta de cada operação
+
+    A preparação dos pacientes e a conversão das respostas ficam fora da medição;
+    se 'latencies' for informado, recebe o tempo (ns) de cada chamada ao repositório
+    '''
+    clock = time.perf_counter_ns
+    for kind, argument in workload:
+        if kind == REGISTER:
+            entries = [(_patient(patient_id), _COLORS[priority]) for patient_id, priority in argument]
+            if len(entries) == 1:
+                patient, classification = entries[0]
+                start = clock()
+                repo.add_patient(patient, classification)
+            else:
+                start = clock()
+                repo.add_patients(entries)
+            elapsed = clock() - start
+            answer = None
+        elif kind == CALL:
+            if argument == 1:
+                start = clock()
+                patient = repo.get_next_patient()
+                elapsed = clock() - start
+                answer = (patient.id,) if patient is not None else ()
+            else:
+                start = clock()
+                patients = repo.get_next_patients(argument)
+                elapsed = clock() - start
+                answer = tuple(patient.id for patient in patients)
+        else:
+            start = clock()
+            status = repo.get_status()
+            elapsed = clock() - start
+            answer = tuple(status[cls] for cls in _COLORS)
+
+        if latencies is not None:
+            latencies[kind].append(elapsed)
+        yield answer
+
+
+@dataclass
+class Expected:
+    # Respostas do modelo de referência para uma carga
+    answers: List[Any]
+    final_status: Tuple[int, ...]
+    drain: Tuple[int, str]
+
+
+def reference_run(size: int, workload: List[Tuple[str, Any]], seed: int) -> Expected:
+    repo = InMemoryQueueRepository()
+    _preload(repo, size, seed)
+    answers = list(_replay(repo, workload))
+    final_status = _status_tuple(repo)
+    return Expected(answers, final_status, _drain_digest(repo))
+
+
+@dataclass
+class BackendReport:
+    backend: str
+    size: int
+    failures: List[str] = field(default_factory=list)
+    latencies: Dict[str, List[int]] = field(default_factory=lambda: {kind: [] for kind in KINDS})
+    preload_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def ops_per_second(self) -> float:
+        total_ns = sum(sum(values) for values in self.latencies.values())
+        operations = sum(len(values) for values in self.latencies.values())
+        return operations / (total_ns / 1e9) if total_ns else math.nan
+
+    def percentile_us(self, kind: str, q: float) -> float:
+        # Percentil pelo método do posto mais próximo, em microssegundos
+        ordered = sorted(self.latencies[kind])
+        if not ordered:
+            return math.nan
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)] / 1000
+
+
+def _describe_mismatch(index: int, kind: str, wanted: Any, answer: Any) -> str:
+    if kind == CALL:
+        # Aponta só o primeiro paciente fora de ordem (os lotes podem ser longos)
+        position = next((i for i, (a, b) in enumerate(zip(wanted, answer)) if a != b), min(len(wanted), len(answer)))
+        wanted_id = wanted[position] if position < len(wanted) else None
+        answer_id = answer[position] if position < len(answer) else None
+        return (f"operação {index} ({kind}): posição {position} do lote, esperado paciente {wanted_id}, "
+                f"obtido {answer_id} ({len(answer)} de {len(wanted)} chamados)")
+    return f"operação {index} ({kind}): esperado {wanted}, obtido {answer}"
+
+
+def run_conformance(name: str, factory: RepositoryFactory, size: int, workload: List[Tuple[str, Any]],
+                    expected: Expected, seed: int, max_failures: int = 5) -> BackendReport:
+    '''
+    Executa a carga em um backend, medindo cada operação e comparando com a referência
+
+    Args:
+        name (str): Nome do backend no relatório
+        factory (RepositoryFactory): Cria o repositório vazio a partir de um diretório temporário
+        size (int): Pacientes pré-carregados antes da carga
+        workload (List[Tuple[str, Any]]): A carga (ver build_workload)
+        expected (Expected): Respostas da referência para o mesmo tamanho e carga
+        seed (int): Semente da pré-carga (a mesma usada na referência)
+        max_failures (int): Divergências registradas antes de interromper a comparação
+    '''
+    report = BackendReport(name, size)
+    directory = tempfile.mkdtemp(prefix="conformance-")
+    repo = None
+    try:
+        repo = factory(directory)
+        if not isinstance(repo, IQueueRepository):
+            raise TypeError(f"A fábrica de '{name}' não devolveu um IQueueRepository.")
+
+        start = time.perf_counter()
+        _preload(repo, size, seed)
+        report.preload_seconds = time.perf_counter() - start
+
+        for index, (answer, wanted) in enumerate(zip(_replay(repo, workload, report.latencies), expected.answers)):
+            if answer != wanted:
+                report.failures.append(_describe_mismatch(index, workload[index][0], wanted, answer))
+                if len(report.failures) >= max_failures:
+                    report.failures.append("comparação interrompida")
+                    return report
+
+        final_status = _status_tuple(repo)
+        if final_status != expected.final_status:
+            report.failures.append(f"status final: esperado {expected.final_status}, obtido {final_status}")
+        drain = _drain_digest(repo)
+        if drain != expected.drain:
+            report.failures.append(f"esvaziamento: {drain[0]} pacientes em ordem diferente da referência "
+                                   f"(esperado {expected.drain[0]})")
+    except Exception as e:
+        report.failures.append(f"exceção: {e!r}")
+    finally:
+        close = getattr(repo, "close", None)
+        if callable(close):
+            close()
+        shutil.rmtree(directory, ignore_errors=True)
+    return report
+
+
+def _print_reports(size: int, reports: Sequence[BackendReport]):
+    header = " | ".join(f"{kind + ' p50/p99/p999 (µs)':^27}" for kind in KINDS)
+    print(f"\n{size:,} pacientes em espera")
+    print(f"{'Backend':<16} {'Conf.':<6} {'pré-carga':>9} {'ops/s':>10} | {header}")
+    print("-" * (45 + 30 * len(KINDS)))
+    for report in reports:
+        cells = " | ".join(
+            f"{report.percentile_us(kind, 0.50):>7.1f} {report.percentile_us(kind, 0.99):>8.1f} "
+            f"{report.percentile_us(kind, 0.999):>9.1f}  "
+            for kind in KINDS
+        )
+        print(f"{report.backend:<16} {'OK' if report.ok else 'FALHOU':<6} {report.preload_seconds:>8.1f}s "
+              f"{report.ops_per_second():>10,.0f} | {cells}")
+    for report in reports:
+        for failure in report.failures:
+            print(f"  [{report.backend}] {failure}")
+
+
+def _resolve_backend(spec: str) -> Tuple[str, RepositoryFactory]:
+    # Um nome de BACKENDS ou "modulo:fabrica"
+    if spec in BACKENDS:
+        return spec, BACKENDS[spec]
+    module_name, separator, attribute = spec.partition(":")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Backend '{spec}' desconhecido. Use {sorted(BACKENDS)} ou modulo:fabrica.")
+    try:
+        return spec, getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as e:
+        raise argparse.ArgumentTypeError(f"Não foi possível carregar '{spec}': {e}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Conformidade e carga comparativa de repositórios de filas")
+    parser.add_argument("--backend", type=_resolve_backend, nargs="+", action="extend",
+                        help=f"backends ({', '.join(BACKENDS)}) ou modulo:fabrica (padrão: todos)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="pacientes em espera antes da carga (ex: até 10000000)")
+    parser.add_argument("--operations", type=int, default=100_000, help="operações da carga mista")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args(argv)
+
+    backends = args.backend or list(BACKENDS.items())
+    failed = False
+    for size in args.sizes:
+        workload = build_workload(args.operations, size, args.seed)
+        expected = reference_run(size, workload, args.seed)
+        reports = [run_conformance(name, factory, size, workload, expected, args.seed) for name, factory in backends]
+        _print_reports(size, reports)
+        failed = failed or any(not report.ok for report in reports)
+
+    print("\nDivergências encontradas." if failed else "\nTodos os backends conferem com a referência.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+'''
+Mede o custo por operação do DeadlineQueueRepository conforme a quantidade de
+pacientes em espera cresce (deve crescer apenas com log n)
+
+Para cada tamanho, pré-carrega as filas e mede ciclos de cadastro + chamada
+em regime estacionário. O relógio simulado avança 1 ms por cadastro, então
+ninguém estoura o tempo-alvo e a medição isola o custo de despacho (cada
+escalonamento é um O(log n) a mais, no máximo três vezes por paciente)
+
+Uso (na raiz do projeto):
+    python -m benchmarks.deadline_dispatch [--sizes 1000 10000 100000 500000] [--cycles 50000]
+'''
+import argparse
+import random
+import time
+
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.infrastructure.repositories.deadline_repository import DeadlineQueueRepository, POLICY_DEADLINE, POLICY_STRICT
+
+
+def _measure(policy: str, waiting: int, cycles: int, seed: int) -> float:
+    rng = random.Random(seed)
+    classifications = list(Classification)
+    now = [0.0]
+    repo = DeadlineQueueRepository(policy, clock=lambda: now[0])
+    for i in range(waiting):
+        now[0] += 0.001
+        repo.add_patient(Patient(f"Paciente {i}"), rng.choice(classifications))
+    start = time.perf_counter()
+    for i in range(cycles):
+        now[0] += 0.001
+        repo.add_patient(Patient(f"Novo {i}"), rng.choice(classifications))
+        repo.get_next_patient()
+    return (time.perf_counter() - start) / cycles * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo de despacho do repositório por prazo")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 500_000])
+    parser.add_argument("--cycles", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'Em espera':>10} | {'deadline (µs/ciclo)':>19} | {'strict (µs/ciclo)':>17}")
+    print("-" * 54)
+    for size in args.sizes:
+        deadline = _measure(POLICY_DEADLINE, size, args.cycles, args.seed)
+        strict = _measure(POLICY_STRICT, size, args.cycles, args.seed)
+        print(f"{size:>10,} | {deadline:>19.2f} | {strict:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
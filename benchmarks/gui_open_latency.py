@@ -0,0 +1,158 @@
+'''
+Latência de abertura das janelas "popup" da GUI: criar a janela a cada clique
+(comportamento antigo) contra exibir a janela pré-montada e reaproveitada
+
+O "antes" é uma cópia fiel da montagem antiga (_legacy_triage_window e
+_legacy_call_window): a janela inteira é criada no clique, cada label cria os
+seus próprios CTkFont e a App chama grab_set() em seguida. Ela não usa o cache
+de fontes nem as classes novas, então a comparação não fica favorável ao "antes"
+
+Cada amostra mede do clique até o Tk terminar de processar os eventos pendentes
+(update()), ou seja, até a janela estar desenhada. Precisa de um display (no
+Linux sem monitor, use xvfb-run) e do customtkinter instalado
+
+Uso (na raiz do projeto):
+    python -m benchmarks.gui_open_latency
+    python -m benchmarks.gui_open_latency --repeats 50
+'''
+import argparse
+import contextlib
+import os
+import statistics
+import sys
+import time
+from typing import Callable, List, Optional
+
+from src.domain.patient import Patient
+from src.infrastructure.triage_builder import montar_arvore
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+from src.application.use_cases.register_patient import RegisterPatientUseCase
+
+
+def _sample(root, open_window: Callable[[], object], close_window: Callable[[object], None]) -> float:
+    # Uma abertura, em milissegundos; o fechamento fica fora da medição
+    root.update()
+    start = time.perf_counter()
+    window = open_window()
+    root.update()
+    elapsed = (time.perf_counter() - start) * 1000
+    close_window(window)
+    root.update()
+    return elapsed
+
+
+def _legacy_triage_window(customtkinter, master):
+    # Montagem da TriageWindow antes do reaproveitamento (criada a cada clique, fontes novas)
+    window = customtkinter.CTkToplevel(master)
+    window.title("1. Cadastrar e Iniciar Triagem")
+    window.geometry("450x300")
+    window.minsize(400, 250)
+    window.emoji_font = customtkinter.CTkFont(family="Segoe UI Emoji", size=18, weight="bold")
+
+    name_frame = customtkinter.CTkFrame(window)
+    name_frame.pack(padx=20, pady=20, fill="x")
+    customtkinter.CTkLabel(name_frame, text="Nome do Paciente:").pack(pady=(5, 5))
+    customtkinter.CTkEntry(name_frame, width=250).pack(pady=(0, 10))
+    customtkinter.CTkButton(name_frame, text="Iniciar Triagem", command=lambda: None).pack(pady=(0, 10))
+
+    triage_frame = customtkinter.CTkFrame(window, fg_color="transparent")
+    customtkinter.CTkLabel(triage_frame, text="Pergunta...", font=customtkinter.CTkFont(size=16),
+                           wraplength=380).pack(pady=(10, 20))
+    button_frame = customtkinter.CTkFrame(triage_frame, fg_color="transparent")
+    button_frame.pack(pady=10)
+    customtkinter.CTkButton(button_frame, text="SIM", width=100, command=lambda: None).pack(side="left", padx=10)
+    customtkinter.CTkButton(button_frame, text="NÃO", width=100, command=lambda: None).pack(side="right", padx=10)
+
+    result_frame = customtkinter.CTkFrame(window, fg_color="transparent")
+    customtkinter.CTkLabel(result_frame, text="Resultado:",
+                           font=customtkinter.CTkFont(size=18, weight="bold")).pack(pady=(10, 10))
+    customtkinter.CTkButton(result_frame, text="Fechar", command=window.destroy).pack(pady=10)
+
+    window.grab_set()
+    return window
+
+
+def _legacy_call_window(customtkinter, master, patient: Patient):
+    # Montagem da CallResultWindow antes do reaproveitamento (criada a cada chamada, fontes novas)
+    window = customtkinter.CTkToplevel(master)
+    window.title("2. Próximo Paciente")
+    window.geometry("400x200")
+    window.minsize(350, 180)
+
+    main_frame = customtkinter.CTkFrame(window, fg_color="transparent")
+    main_frame.pack(padx=20, pady=20, fill="both", expand=True)
+    main_frame.grid_columnconfigure(0, weight=1)
+    customtkinter.CTkLabel(main_frame, text="Próximo Paciente:",
+                           font=customtkinter.CTkFont(size=16)).grid(row=0, column=0, padx=10, pady=(10, 5))
+    customtkinter.CTkLabel(main_frame, text=patient.name.upper(), font=customtkinter.CTkFont(size=24, weight="bold"),
+                           text_color="#3182CE").grid(row=1, column=0, padx=10, pady=(5, 20))
+    customtkinter.CTkButton(window, text="OK", command=window.destroy, width=100).pack(pady=(0, 20), side="bottom")
+
+    window.grab_set()
+    return window
+
+
+def _summary(name: str, samples: List[float]):
+    ordered = sorted(samples)
+    p90 = ordered[min(len(ordered) - 1, int(0.9 * len(ordered)))]
+    print(f"{name:<46} mediana {statistics.median(ordered):8.2f} ms   p90 {p90:8.2f} ms   máx {ordered[-1]:8.2f} ms")
+
+
+def run(repeats: int) -> int:
+    try:
+        import customtkinter
+        from src.presentation.gui.background import BackgroundDispatcher
+        from src.presentation.gui.triage_window import TriageWindow
+        from src.presentation.gui.call_result_window import CallResultWindow
+        root = customtkinter.CTk()
+    except ImportError as e:
+        print(f"customtkinter não está disponível: {e}")
+        return 2
+    except Exception as e:
+        print(f"Não foi possível abrir a janela principal (há um display?): {e}")
+        return 2
+
+    root.withdraw()
+    background = BackgroundDispatcher(root)
+    register_uc = RegisterPatientUseCase(InMemoryQueueRepository())
+    tree = montar_arvore()
+    patient = Patient("Paciente Benchmark")
+
+    triage = TriageWindow(root, register_uc, tree, background)
+    call = CallResultWindow(root)
+
+    variants = [
+        ("TriageWindow: antes (criada a cada clique)", lambda: _legacy_triage_window(customtkinter, root),
+         lambda w: w.destroy()),
+        ("TriageWindow: reaproveitada", lambda: (triage.show(), triage)[1], lambda w: w.hide()),
+        ("CallResultWindow: antes (criada a cada clique)", lambda: _legacy_call_window(customtkinter, root, patient),
+         lambda w: w.destroy()),
+        ("CallResultWindow: reaproveitada", lambda: (call.show(patient), call)[1], lambda w: w.hide()),
+    ]
+
+    print(f"Latência de abertura ({repeats} amostras por variante, após 3 de aquecimento)\n")
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = []
+        for name, open_window, close_window in variants:
+            for _ in range(3):
+                _sample(root, open_window, close_window)
+            results.append((name, [_sample(root, open_window, close_window) for _ in range(repeats)]))
+    for name, samples in results:
+        _summary(name, samples)
+
+    background.shutdown()
+    root.destroy()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Latência de abertura das janelas da GUI (antes x reaproveitada)")
+    parser.add_argument("--repeats", type=int, default=30)
+    args = parser.parse_args(argv)
+    if args.repeats < 1:
+        parser.error("São necessárias --repeats >= 1.")
+    return run(args.repeats)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
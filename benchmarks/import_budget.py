@@ -0,0 +1,176 @@
+'''
+Orçamento de tempo de importação dos pontos de entrada (console e GUI)
+
+Cada ponto de entrada é importado em um interpretador novo com -X importtime; o
+tempo é a soma dos tempos cumulativos dos módulos de primeiro nível que não são
+importados por um 'python -c pass' (ou seja, sem o custo fixo do interpretador).
+A primeira execução é descartada (compila os .pyc) e o resultado é a mediana de
+--runs execuções. Termina com código 1 se algum ponto de entrada passar do orçamento
+
+Uso (na raiz do projeto):
+    python -m benchmarks.import_budget
+    python -m benchmarks.import_budget --only console --runs 9
+    python -m benchmarks.import_budget --budget console=40 gui=300
+
+Um ponto de entrada cuja dependência externa não está instalada (ex: customtkinter)
+é ignorado, não reprovado
+'''
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+# Ponto de entrada -> (módulo, orçamento em milissegundos)
+ENTRY_POINTS: Dict[str, Tuple[str, float]] = {
+    "console": ("src.presentation.console.main", 60.0),
+    "gui": ("src.presentation.gui.app", 400.0),
+}
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    # Uma linha do -X importtime (tempos em microssegundos)
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    '''
+    Extrai as linhas "import time: self | cumulative | nome" da saída de -X importtime
+
+    A profundidade vem da indentação do nome (2 espaços por nível); o cabeçalho e
+    qualquer outra linha do stderr são ignorados
+    '''
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        raw_name = fields[2].rstrip()
+        name = raw_name.lstrip()
+        records.append(ImportRecord(name, int(fields[0]), int(fields[1]), (len(raw_name) - len(name) - 1) // 2))
+    return records
+
+
+def _importtime(code: str) -> Tuple[int, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = _PROJECT_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                               cwd=_PROJECT_ROOT, env=env, capture_output=True, text=True)
+    return completed.returncode, completed.stderr
+
+
+def _startup_modules() -> Set[str]:
+    # Módulos que o interpretador já importa sozinho (não contam no orçamento)
+    _, stderr = _importtime("pass")
+    return {record.name for record in parse_importtime(stderr)}
+
+
+@dataclass(frozen=True)
+class Measurement:
+    entry_point: str
+    module: str
+    budget_ms: float
+    median_ms: Optional[float]             # None se o ponto de entrada foi ignorado
+    runs_ms: Tuple[float, ...]
+    heaviest: Tuple[ImportRecord, ...]     # Módulos com maior tempo próprio (última execução)
+    skipped_reason: str = ""
+
+    @property
+    def over_budget(self) -> bool:
+        return self.median_ms is not None and self.median_ms > self.budget_ms
+
+
+def measure(entry_point: str, module: str, budget_ms: float, runs: int, top: int, startup: Set[str]) -> Measurement:
+    '''
+    Mede o tempo de importação de 'module' (mediana de 'runs' execuções, após uma de aquecimento)
+
+    Raises:
+        RuntimeError: Se a importação falhar por outro motivo que não uma dependência ausente
+    '''
+    code = f"import {module}"
+    samples: List[float] = []
+    records: List[ImportRecord] = []
+    for attempt in range(runs + 1):
+        returncode, stderr = _importtime(code)
+        if returncode != 0:
+            last_line = stderr.strip().splitlines()[-1] if stderr.strip() else f"código {returncode}"
+            if "ModuleNotFoundError" in last_line and "'src" not in last_line:
+                return Measurement(entry_point, module, budget_ms, None, (), (), skipped_reason=last_line)
+            raise RuntimeError(f"Falha ao importar {module}: {last_line}")
+        records = [record for record in parse_importtime(stderr) if record.name not in startup]
+        if attempt:
+            samples.append(sum(record.cumulative_us for record in records if record.depth == 0) / 1000)
+
+    heaviest = tuple(sorted(records, key=lambda record: record.self_us, reverse=True)[:top])
+    return Measurement(entry_point, module, budget_ms, statistics.median(samples), tuple(samples), heaviest)
+
+
+def _parse_budgets(values: Sequence[str]) -> Dict[str, float]:
+    budgets = {}
+    for value in values:
+        name, _, milliseconds = value.partition("=")
+        if name not in ENTRY_POINTS or not milliseconds:
+            raise ValueError(f"Orçamento inválido '{value}' (use nome=ms; nomes: {', '.join(ENTRY_POINTS)}).")
+        budgets[name] = float(milliseconds)
+    return budgets
+
+
+def _print_measurement(result: Measurement):
+    if result.median_ms is None:
+        print(f"{result.entry_point:<8} {result.module:<34} ignorado ({result.skipped_reason})")
+        return
+    status = "ESTOUROU" if result.over_budget else "ok"
+    spread = f"{min(result.runs_ms):.1f}-{max(result.runs_ms):.1f}"
+    print(f"{result.entry_point:<8} {result.module:<34} {result.median_ms:7.1f} ms "
+          f"(faixa {spread}) / orçamento {result.budget_ms:.0f} ms  {status}")
+    for record in result.heaviest:
+        print(f"{'':<10}{record.self_us / 1000:6.1f} ms próprio  {record.cumulative_us / 1000:6.1f} ms total  {record.name}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Verifica o tempo de importação dos pontos de entrada (-X importtime)")
+    parser.add_argument("--only", nargs="+", choices=list(ENTRY_POINTS), help="só estes pontos de entrada")
+    parser.add_argument("--runs", type=int, default=5, help="execuções medidas por ponto de entrada")
+    parser.add_argument("--budget", nargs="+", default=[], metavar="NOME=MS", help="substitui o orçamento padrão")
+    parser.add_argument("--top", type=int, default=5, help="módulos mais pesados listados por ponto de entrada")
+    args = parser.parse_args(argv)
+
+    if args.runs < 1:
+        parser.error("São necessárias --runs >= 1.")
+    try:
+        budgets = _parse_budgets(args.budget)
+    except ValueError as e:
+        parser.error(str(e))
+
+    startup = _startup_modules()
+    over = []
+    for name in args.only or ENTRY_POINTS:
+        module, budget = ENTRY_POINTS[name]
+        try:
+            result = measure(name, module, budgets.get(name, budget), args.runs, args.top, startup)
+        except RuntimeError as e:
+            print(f"{name:<8} {module:<34} ERRO: {e}")
+            over.append(name)
+            continue
+        _print_measurement(result)
+        if result.over_budget:
+            over.append(name)
+
+    if over:
+        print(f"\nFora do orçamento: {', '.join(over)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+'''
+Recuperação do JournaledQueueRepository após quedas, conferida contra a referência
+
+Em cada rodada, um processo filho abre o repositório (recuperando o que as rodadas
+anteriores gravaram), aplica uma sequência semeada de operações e termina com
+os._exit, sem fechar nada. O processo pai reabre o diretório e compara a ordem de
+cada fila com um InMemoryQueueRepository que recebeu exatamente as mesmas operações
+
+A carga inclui o que depende dos números de chegada: chamadas provisórias
+(take_next_patient) devolvidas mais tarde com return_patient, e reclassificações
+com e sem keep_arrival_order. O fsync é feito a cada operação ("always"), então
+nada gravado pode se perder, e snapshots pequenos forçam compactações no meio
+
+Uso (na raiz do projeto):
+    python -m benchmarks.journal_crash
+    python -m benchmarks.journal_crash --rounds 20 --operations 5000 --seed 3
+
+Termina com código 1 se alguma recuperação divergir da referência
+'''
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+from src.infrastructure.repositories.journaled_repository import JournaledQueueRepository
+
+_COLORS: Tuple[Classification, ...] = tuple(sorted(Classification, key=lambda c: c.priority))
+
+# Operação: (nome, argumentos); só tipos simples, para atravessar para o processo filho
+Operation = Tuple[str, Tuple[Any, ...]]
+
+
+def _patient(patient_id: int) -> Patient:
+    return Patient.restore(f"P{patient_id}", patient_id)
+
+
+class _Runner:
+    # Aplica operações a um repositório, guardando os pacientes retirados provisoriamente
+    def __init__(self, repo: InMemoryQueueRepository):
+        self.repo = repo
+        self.held: List[Tuple[Patient, Classification, int]] = []
+
+    def apply(self, operation: Operation):
+        name, args = operation
+        repo = self.repo
+        if name == "add":
+            repo.add_patient(_patient(args[0]), _COLORS[args[1]])
+        elif name == "add_many":
+            repo.add_patients([(_patient(patient_id), _COLORS[priority]) for patient_id, priority in args[0]])
+        elif name == "call":
+            repo.get_next_patient()
+        elif name == "call_many":
+            repo.get_next_patients(args[0])
+        elif name == "take":
+            taken = repo.take_next_patient()
+            if taken is not None:
+                self.held.append(taken)
+        elif name == "return":
+            repo.return_patient(*self.held.pop(args[0]))
+        elif name == "remove":
+            repo.remove_patient(args[0])
+        elif name == "reclassify":
+            repo.reclassify_patient(args[0], _COLORS[args[1]], keep_arrival_order=args[2])
+        else:
+            raise ValueError(f"Operação desconhecida: {name}")
+
+
+def build_round(reference: _Runner, operations: int, next_id: int, rng: random.Random) -> Tuple[List[Operation], int]:
+    '''
+    Gera (e aplica à referência) uma rodada de operações válidas para o estado atual
+
+    Returns:
+        Tuple[List[Operation], int]: As operações e o próximo id livre
+    '''
+    weights = (2, 8, 25, 45, 20)
+    ops: List[Operation] = []
+    for _ in range(operations):
+        roll = rng.random()
+        waiting = reference.repo.find_patient
+        if roll < 0.35:
+            op: Operation = ("add", (next_id, rng.choices(range(5), weights)[0]))
+            next_id += 1
+        elif roll < 0.40:
+            size = rng.randint(2, 16)
+            op = ("add_many", ([(next_id + i, rng.choices(range(5), weights)[0]) for i in range(size)],))
+            next_id += size
+        elif roll < 0.55:
+            op = ("call", ())
+        elif roll < 0.60:
+            op = ("call_many", (rng.randint(2, 8),))
+        elif roll < 0.70:
+            op = ("take", ())
+        elif roll < 0.80 and reference.held:
+            op = ("return", (rng.randrange(len(reference.held)),))
+        else:
+            candidates = [patient.id for queue in reference.repo.queues.values() for patient in queue]
+            if not candidates:
+                continue
+            patient_id = rng.choice(candidates)
+            if roll < 0.85:
+                op = ("remove", (patient_id,))
+            else:
+                current = waiting(patient_id)[1]
+                target = rng.choice([cls for cls in _COLORS if cls is not current])
+                op = ("reclassify", (patient_id, target.priority, rng.random() < 0.7))
+        reference.apply(op)
+        ops.append(op)
+    return ops, next_id
+
+
+def _open(directory: str, snapshot_every: int) -> JournaledQueueRepository:
+    return JournaledQueueRepository(directory, fsync_policy="always", snapshot_every=snapshot_every)
+
+
+def _crashing_child(directory: str, snapshot_every: int, ops: List[Operation]):
+    # Processo filho: aplica a rodada e "cai" sem fechar o journal nem esperar a compactação
+    runner = _Runner(_open(directory, snapshot_every))
+    for operation in ops:
+        runner.apply(operation)
+    os._exit(0)
+
+
+def queue_orders(repo: InMemoryQueueRepository) -> Dict[str, List[Any]]:
+    return {cls.name: [patient.id for patient in repo.queues[cls]] for cls in _COLORS}
+
+
+def _first_difference(expected: Dict[str, List[Any]], recovered: Dict[str, List[Any]]) -> Optional[str]:
+    for name, wanted in expected.items():
+        got = recovered[name]
+        if got != wanted:
+            index = next((i for i, (a, b) in enumerate(zip(wanted, got)) if a != b), min(len(wanted), len(got)))
+            return (f"fila {name}: posição {index}, esperado {wanted[index:index + 3]}, "
+                    f"obtido {got[index:index + 3]} ({len(got)} de {len(wanted)} pacientes)")
+    return None
+
+
+def run(rounds: int, operations: int, snapshot_every: int, seed: int) -> int:
+    context = multiprocessing.get_context("fork")
+    rng = random.Random(seed)
+    reference = _Runner(InMemoryQueueRepository())
+    next_id = 1
+    directory = tempfile.mkdtemp(prefix="journal-crash-")
+    try:
+        for round_number in range(1, rounds + 1):
+            ops, next_id = build_round(reference, operations, next_id, rng)
+            # Quem estava retirado provisoriamente quando o processo caiu não volta (o POP já foi gravado)
+            reference.held.clear()
+
+            child = context.Process(target=_crashing_child, args=(directory, snapshot_every, ops))
+            child.start()
+            child.join()
+            if child.exitcode != 0:
+                print(f"Rodada {round_number}: o processo filho terminou com código {child.exitcode}")
+                return 1
+
+            try:
+                recovered = _open(directory, snapshot_every)
+            except Exception as e:
+                print(f"Rodada {round_number}: a recuperação falhou: {e!r}")
+                return 1
+            difference = _first_difference(queue_orders(reference.repo), queue_orders(recovered))
+            recovered.close()
+            waiting = sum(reference.repo.get_status().values())
+            if difference is not None:
+                print(f"Rodada {round_number}: divergência após a queda: {difference}")
+                return 1
+            print(f"Rodada {round_number:>3}: {len(ops):,} operações, {waiting:,} em espera, recuperação confere")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print("\nTodas as recuperações conferem com a referência.")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Quedas e recuperação do repositório com journal")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--operations", type=int, default=5000, help="operações por rodada")
+    parser.add_argument("--snapshot-every", type=int, default=1500, help="registros por journal antes de rotacionar")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    if args.rounds < 1 or args.operations < 1:
+        parser.error("São necessárias --rounds e --operations >= 1.")
+    if "fork" not in multiprocessing.get_all_start_methods():
+        print("Este teste precisa de multiprocessing com 'fork' (Linux/macOS).")
+        return 2
+    return run(args.rounds, args.operations, args.snapshot_every, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+'''
+Mede o tempo de recuperação do JournaledQueueRepository após N operações gravadas
+
+Compara dois cenários:
+- somente journal (snapshot_every=0): toda a história é reaplicada
+- snapshot + cauda do journal: apenas os registros após o último snapshot
+
+Uso (na raiz do projeto):
+    python -m benchmarks.journal_recovery [--operations 1000000] [--snapshot-every 100000]
+'''
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.infrastructure.repositories.journaled_repository import JournaledQueueRepository
+
+
+def _write_history(directory: str, operations: int, snapshot_every: int, seed: int) -> float:
+    # Gera a carga: ~60% cadastros e ~40% chamadas, sem fsync para a escrita não dominar a medição
+    rng = random.Random(seed)
+    classifications = list(Classification)
+    repo = JournaledQueueRepository(directory, fsync_policy="never", group_size=1024,
+                                    snapshot_every=snapshot_every, background_compaction=True)
+    start = time.perf_counter()
+    for i in range(operations):
+        if rng.random() < 0.6:
+            repo.add_patient(Patient(f"Paciente {i}"), rng.choice(classifications))
+        else:
+            repo.get_next_patient()
+    elapsed = time.perf_counter() - start
+    repo.close()
+    return elapsed
+
+
+def _recover(directory: str) -> tuple:
+    start = time.perf_counter()
+    repo = JournaledQueueRepository(directory, snapshot_every=0)
+    elapsed = time.perf_counter() - start
+    waiting = sum(repo.get_status().values())
+    repo.close()
+    return elapsed, waiting
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de recuperação do repositório com journal")
+    parser.add_argument("--operations", type=int, default=1_000_000)
+    parser.add_argument("--snapshot-every", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    scenarios = {
+        "somente journal": 0,
+        f"snapshot a cada {args.snapshot_every:,}": args.snapshot_every,
+    }
+    print(f"{'Cenário':<28} | {'escrita (s)':>11} | {'recuperação (s)':>15} | {'em espera':>9}")
+    print("-" * 74)
+    for label, snapshot_every in scenarios.items():
+        directory = tempfile.mkdtemp(prefix="journal-bench-")
+        try:
+            write_time = _write_history(directory, args.operations, snapshot_every, args.seed)
+            recovery_time, waiting = _recover(directory)
+            print(f"{label:<28} | {write_time:>11.2f} | {recovery_time:>15.2f} | {waiting:>9,}")
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
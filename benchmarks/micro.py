@@ -0,0 +1,307 @@
+'''
+Micro-benchmarks das operações centrais: fila, repositório em memória, navegação
+da triagem e o ciclo cadastrar + chamar pelos casos de uso
+
+Cada benchmark passa por um aquecimento, é calibrado para que uma amostra dure
+pelo menos --min-time segundos e é repetido --repeats vezes. O resultado é a
+vazão (operações por segundo, pela mediana das amostras) e os percentis do custo
+por operação entre as amostras. Durante as medições o stdout é descartado e o
+coletor de lixo fica desligado (como no timeit), então só o trabalho real é medido
+
+Uso (na raiz do projeto):
+    python -m benchmarks.micro run --save baseline.json
+    python -m benchmarks.micro run --compare baseline.json --threshold 10
+    python -m benchmarks.micro run --only fila repo.get_status
+    python -m benchmarks.micro compare baseline.json atual.json --threshold 10
+
+'run --compare' e 'compare' terminam com código 1 se algum benchmark ficar mais
+de --threshold por cento mais lento que a referência
+'''
+import argparse
+import contextlib
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.domain.custom_queue import Fila
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+from src.infrastructure.triage_builder import montar_arvore
+from src.application.services.triage_service import TriageNavigator
+from src.application.use_cases.register_patient import RegisterPatientUseCase
+from src.application.use_cases.call_next_patient import CallNextPatientUseCase
+
+# Um benchmark recebe 'number' e prepara (fora da medição) uma função que executa
+# exatamente 'number' operações quando chamada
+Setup = Callable[[int], Callable[[], None]]
+
+# Pacientes já na fila durante as medições de regime estacionário
+_BACKGROUND = 1_000
+
+
+def _patients(count: int) -> List[Patient]:
+    return [Patient(f"Paciente {i}") for i in range(count)]
+
+
+def _classifications(count: int) -> List[Classification]:
+    # Sequência fixa e misturada de cores (mesmo padrão em todas as execuções)
+    colors = list(Classification)
+    return [colors[(i * 7 + i // 5) % len(colors)] for i in range(count)]
+
+
+def _filled_repository(count: int) -> InMemoryQueueRepository:
+    repo = InMemoryQueueRepository()
+    repo.add_patients(zip(_patients(count), _classifications(count)))
+    return repo
+
+
+def bench_fila_enqueue_dequeue(number: int) -> Callable[[], None]:
+    # Enfileira e desenfileira um paciente com a fila já ocupada
+    fila = Fila()
+    fila.enqueue_many(_patients(_BACKGROUND))
+    incoming = _patients(number)
+    enqueue, dequeue = fila.enqueue, fila.dequeue
+
+    def run():
+        for patient in incoming:
+            enqueue(patient)
+            dequeue()
+    return run
+
+
+def bench_repo_get_next_patient(number: int) -> Callable[[], None]:
+    # Esvazia um repositório pré-carregado com 'number' pacientes de cores misturadas
+    repo = _filled_repository(number)
+    get_next = repo.get_next_patient
+
+    def run():
+        for _ in range(number):
+            get_next()
+    return run
+
+
+def bench_repo_get_status(number: int) -> Callable[[], None]:
+    repo = _filled_repository(_BACKGROUND)
+    get_status = repo.get_status
+
+    def run():
+        for _ in range(number):
+            get_status()
+    return run
+
+
+def bench_triage_navigate(number: int) -> Callable[[], None]:
+    # Uma triagem completa por operação, alternando entre os caminhos até as 5 folhas
+    navigator = TriageNavigator(montar_arvore())
+    paths = ((True,), (False, True), (False, False, True), (False, False, False, True), (False, False, False, False))
+    answers = [paths[i % len(paths)] for i in range(number)]
+    root = navigator.root_node
+    navigate = navigator.navigate
+
+    def run():
+        for path in answers:
+            navigator.current_node = root
+            for answer in path:
+                navigate(answer)
+    return run
+
+
+def bench_use_case_round_trip(number: int) -> Callable[[], None]:
+    # Cadastro + chamada pelos casos de uso, com a fila já ocupada
+    repo = _filled_repository(_BACKGROUND)
+    register = RegisterPatientUseCase(repo).execute
+    call_next = CallNextPatientUseCase(repo).execute
+    incoming = list(zip(_patients(number), _classifications(number)))
+
+    def run():
+        for patient, classification in incoming:
+            register(patient, classification)
+            call_next()
+    return run
+
+
+BENCHMARKS: Dict[str, Setup] = {
+    "fila.enqueue_dequeue": bench_fila_enqueue_dequeue,
+    "repo.get_next_patient": bench_repo_get_next_patient,
+    "repo.get_status": bench_repo_get_status,
+    "triage.navigate": bench_triage_navigate,
+    "use_case.register_call": bench_use_case_round_trip,
+}
+
+
+def _time_once(setup: Setup, number: int) -> float:
+    # Uma amostra: prepara fora da medição, mede com o gc desligado e o stdout descartado
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        run = setup(number)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+    return elapsed
+
+
+def _calibrate(setup: Setup, min_time: float) -> int:
+    # Dobra 'number' até uma amostra durar pelo menos min_time (como timeit.autorange)
+    number = 1
+    while True:
+        elapsed = _time_once(setup, number)
+        if elapsed >= min_time:
+            return number
+        # Salta direto para perto do alvo quando a amostra ainda é muito curta
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.1))
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    # Percentil pelo método do posto mais próximo (lista já ordenada e não vazia)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def measure(setup: Setup, repeats: int = 15, min_time: float = 0.05, warmup: float = 0.2) -> Dict[str, float]:
+    '''
+    Mede um benchmark e devolve o resumo (custo por operação em nanossegundos)
+
+    Args:
+        setup (Setup): O benchmark (ver BENCHMARKS)
+        repeats (int): Amostras medidas depois do aquecimento
+        min_time (float): Duração mínima de cada amostra, em segundos
+        warmup (float): Tempo mínimo de aquecimento, em segundos (amostras descartadas)
+    '''
+    number = _calibrate(setup, min_time)
+    deadline = time.perf_counter() + warmup
+    while time.perf_counter() < deadline:
+        _time_once(setup, number)
+
+    per_op = sorted(_time_once(setup, number) / number * 1e9 for _ in range(repeats))
+    median = _percentile(per_op, 0.50)
+    return {
+        "ops_per_sec": 1e9 / median,
+        "number": number,
+        "repeats": repeats,
+        "min_ns": per_op[0],
+        "p50_ns": median,
+        "p90_ns": _percentile(per_op, 0.90),
+        "p99_ns": _percentile(per_op, 0.99),
+        "max_ns": per_op[-1],
+    }
+
+
+def run_suite(names: Sequence[str], repeats: int, min_time: float, warmup: float) -> Dict:
+    results = {}
+    for name in names:
+        results[name] = measure(BENCHMARKS[name], repeats, min_time, warmup)
+        _print_result(name, results[name])
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "benchmarks": results,
+    }
+
+
+def _print_result(name: str, result: Dict[str, float]):
+    print(f"{name:<24} {result['ops_per_sec']:>14,.0f} ops/s | p50 {result['p50_ns']:>9.1f} ns"
+          f" | p90 {result['p90_ns']:>9.1f} ns | p99 {result['p99_ns']:>9.1f} ns", flush=True)
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    '''
+    Compara duas execuções pela vazão e imprime a variação de cada benchmark
+
+    Args:
+        threshold (float): Queda máxima tolerada de ops/s, em porcentagem
+
+    Returns:
+        List[str]: Os benchmarks que regrediram além do limite
+    '''
+    regressions = []
+    print(f"\n{'Benchmark':<24} {'referência':>14} {'atual':>14} {'variação':>9}")
+    print("-" * 64)
+    for name, result in current["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if reference is None:
+            print(f"{name:<24} {'—':>14} {result['ops_per_sec']:>14,.0f} {'novo':>9}")
+            continue
+        change = (result["ops_per_sec"] / reference["ops_per_sec"] - 1) * 100
+        regressed = change < -threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<24} {reference['ops_per_sec']:>14,.0f} {result['ops_per_sec']:>14,.0f} "
+              f"{change:>+8.1f}%{'  <- REGRESSÃO' if regressed else ''}")
+
+    if baseline["meta"].get("python") != current["meta"].get("python"):
+        print(f"\nAtenção: referência em Python {baseline['meta'].get('python')}, atual em {current['meta'].get('python')}.")
+    return regressions
+
+
+def _load(path: str) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _report_regressions(regressions: List[str], threshold: float) -> int:
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) mais de {threshold:g}% mais lentos: {', '.join(regressions)}")
+        return 1
+    print(f"\nNenhuma regressão acima de {threshold:g}%.")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de filas, repositório, triagem e casos de uso")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="executa os benchmarks")
+    run_parser.add_argument("--only", nargs="+", metavar="PREFIXO", help="só os benchmarks com estes prefixos")
+    run_parser.add_argument("--repeats", type=int, default=15)
+    run_parser.add_argument("--min-time", type=float, default=0.05, help="segundos mínimos por amostra")
+    run_parser.add_argument("--warmup", type=float, default=0.2, help="segundos de aquecimento por benchmark")
+    run_parser.add_argument("--save", metavar="ARQUIVO", help="grava o resultado em JSON (referência)")
+    run_parser.add_argument("--compare", metavar="ARQUIVO", help="compara com uma referência gravada")
+    run_parser.add_argument("--threshold", type=float, default=10.0, help="queda tolerada de ops/s (%%)")
+
+    compare_parser = commands.add_parser("compare", help="compara dois resultados gravados")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="queda tolerada de ops/s (%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        regressions = compare(_load(args.baseline), _load(args.current), args.threshold)
+        return _report_regressions(regressions, args.threshold)
+
+    names = [name for name in BENCHMARKS if not args.only or any(name.startswith(prefix) for prefix in args.only)]
+    if not names:
+        parser.error(f"Nenhum benchmark corresponde a {args.only}. Disponíveis: {', '.join(BENCHMARKS)}.")
+    if args.repeats < 1 or args.min_time <= 0:
+        parser.error("São necessárias --repeats >= 1 e --min-time > 0.")
+
+    baseline = _load(args.compare) if args.compare else None
+    current = run_suite(names, args.repeats, args.min_time, args.warmup)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nResultado gravado em {args.save}")
+    if baseline is not None:
+        return _report_regressions(compare(baseline, current, args.threshold), args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+'''
+Mede o custo de memória (bytes por paciente) e de cadastro (registros por segundo)
+do Patient atual (slots + estratégia de id) contra o Patient original (dataclass
+com __dict__ e uuid4)
+
+Uso (na raiz do projeto):
+    python -m benchmarks.patient_footprint [--count 200000]
+'''
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, Dict
+
+from src.domain import patient as patient_module
+from src.domain.patient import Patient, counter_ids, uuid4_ids, uuid7_ids
+from src.domain.classification import Classification
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+
+
+@dataclass
+class LegacyPatient:
+    # Cópia fiel do Patient anterior (com __dict__ e uuid4), usada como referência "antes"
+    name: str
+    id: uuid.UUID = field(default_factory=uuid.uuid4, init=False, repr=False)
+
+    def __post_init__(self):
+        if not self.name or not isinstance(self.name, str) or self.name.strip() == "":
+            raise ValueError("O nome do paciente deve ser uma string não vazia.")
+        self.name = self.name.strip()
+
+
+def _bytes_per_patient(factory: Callable[[str], object], names) -> float:
+    # Memória alocada (tracemalloc) dividida pelo número de pacientes mantidos vivos
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    patients = [factory(name) for name in names]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del patients
+    return (after - before) / len(names)
+
+
+def _registrations_per_second(factory: Callable[[str], object], names) -> float:
+    # Cria o paciente e o adiciona ao repositório, como em um cadastro
+    repo = InMemoryQueueRepository()
+    add = repo.add_patient
+    classification = Classification.GREEN
+    start = time.perf_counter()
+    for name in names:
+        add(factory(name), classification)
+    return len(names) / (time.perf_counter() - start)
+
+
+def run(count: int) -> Dict[str, Dict[str, float]]:
+    # Os nomes são criados antes para não entrarem na medição
+    names = [f"Paciente {i}" for i in range(count)]
+    variants = {
+        "antes (dataclass + uuid4)": (LegacyPatient, None),
+        "slots + uuid4": (Patient, uuid4_ids()),
+        "slots + uuid7": (Patient, uuid7_ids()),
+        "slots + contador": (Patient, counter_ids()),
+    }
+
+    original_strategy = patient_module.get_id_strategy()
+    results = {}
+    try:
+        for label, (cls, strategy) in variants.items():
+            if strategy is not None:
+                patient_module.set_id_strategy(strategy)
+            results[label] = {
+                "bytes_per_patient": _bytes_per_patient(cls, names),
+                "registrations_per_second": _registrations_per_second(cls, names),
+            }
+    finally:
+        patient_module.set_id_strategy(original_strategy)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória e custo de cadastro por paciente")
+    parser.add_argument("--count", type=int, default=200_000, help="pacientes por variante")
+    args = parser.parse_args()
+
+    results = run(args.count)
+    print(f"{'Variante':<28} | {'bytes/paciente':>14} | {'cadastros/s':>12}")
+    print("-" * 62)
+    for label, numbers in results.items():
+        print(f"{label:<28} | {numbers['bytes_per_patient']:>14.1f} | {numbers['registrations_per_second']:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+'''
+Mede a vazão do motor de simulação (eventos por minuto de relógio) e confere
+que a mesma semente produz os mesmos resultados
+
+Com --repository deadline, confere também que a política por prazo (que usa o
+relógio simulado) muda as esperas por cor em relação à ordem estrita por cor;
+termina com código 1 se não mudar
+
+Uso (na raiz do projeto):
+    python -m benchmarks.simulation_throughput [--days 365] [--doctors 6] [--repository in-memory]
+'''
+import argparse
+import sys
+import time
+
+from src.domain.classification import Classification
+from src.application.simulation.engine import SimulationConfig, SimulationEngine
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+from src.infrastructure.repositories.deadline_repository import DeadlineQueueRepository, POLICY_STRICT
+
+# Cada repositório recebe o relógio simulado; os que carimbam a chegada precisam dele
+REPOSITORIES = {
+    "in-memory": lambda clock: InMemoryQueueRepository(),
+    "deadline": lambda clock: DeadlineQueueRepository(clock=clock),
+}
+
+# Chegadas por hora de um pronto-atendimento movimentado (carga ~95% com 6 consultórios e os tempos de atendimento padrão)
+ARRIVAL_RATES = {
+    Classification.RED: 0.5,
+    Classification.ORANGE: 2.0,
+    Classification.YELLOW: 6.0,
+    Classification.GREEN: 9.0,
+    Classification.BLUE: 4.0,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vazão do motor de simulação")
+    parser.add_argument("--days", type=float, default=365)
+    parser.add_argument("--doctors", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repository", choices=sorted(REPOSITORIES), default="in-memory")
+    args = parser.parse_args()
+
+    config = SimulationConfig(ARRIVAL_RATES, doctors=args.doctors, duration=args.days * 24 * 60, seed=args.seed)
+    runs = []
+    for _ in range(2):
+        start = time.perf_counter()
+        result = SimulationEngine.with_repository(config, REPOSITORIES[args.repository]).run()
+        runs.append((time.perf_counter() - start, result))
+
+    elapsed, result = min(runs, key=lambda run: run[0])
+    rate = result.events_processed / elapsed * 60
+    print(f"{result.events_processed:,} eventos em {elapsed:.2f}s -> {rate / 1e6:.1f} milhões de eventos/minuto")
+    print(f"Utilização dos consultórios: {result.doctor_utilization:.1%}, ainda esperando: {result.still_waiting}")
+    print(f"Reproduzível (mesma semente, mesmos resultados): {runs[0][1].waits == runs[1][1].waits}")
+    print()
+    print(f"{'Cor':<7} | {'atendidos':>9} | {'média':>7} | {'p50':>7} | {'p95':>7} | {'p99':>7} | {'no alvo':>7}")
+    for classification, stats in result.waits.items():
+        print(f"{classification.name:<7} | {stats.count:>9,} | {stats.mean:>7.1f} | {stats.p50:>7.1f} | "
+              f"{stats.p95:>7.1f} | {stats.p99:>7.1f} | {stats.within_target:>7.1%}")
+
+    if args.repository == "deadline":
+        # Mesma semente com a ordem estrita por cor: as esperas por cor precisam mudar
+        strict = SimulationEngine.with_repository(
+            config, lambda clock: DeadlineQueueRepository(POLICY_STRICT, clock=clock)).run()
+        print()
+        print(f"{'Cor':<7} | {'média (prazo)':>13} | {'média (estrita)':>15}")
+        for classification, stats in result.waits.items():
+            print(f"{classification.name:<7} | {stats.mean:>13.1f} | {strict.waits[classification].mean:>15.1f}")
+        changed = result.wait_samples != strict.wait_samples
+        print(f"A política por prazo muda as esperas por cor: {changed}")
+        if not changed:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
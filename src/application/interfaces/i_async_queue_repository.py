@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Dict
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+
+class IAsyncQueueRepository(ABC):
+    '''
+    Versão assíncrona (asyncio) da interface IQueueRepository
+
+    A diferença principal está em get_next_patient: em vez de retornar None
+    quando todas as filas estão vazias, ele suspende quem chamou até que um
+    paciente chegue, sem consultas repetidas (polling)
+    '''
+
+    @abstractmethod
+    async def add_patient(self, patient: Patient, classification: Classification):
+        '''
+        Adiciona um paciente na fila correspondente à sua classificação,
+        acordando no máximo um consultório que esteja aguardando
+
+        Args:
+            patient (Patient): O objeto do paciente
+            classification (Classification): A classificação (cor) da fila
+        '''
+        pass
+
+    @abstractmethod
+    async def get_next_patient(self, timeout: Optional[float] = None) -> Optional[Patient]:
+        '''
+        Remove e retorna o próximo paciente da fila de maior prioridade,
+        aguardando a chegada de um paciente se todas as filas estiverem vazias
+
+        Os consultórios em espera são atendidos na ordem em que começaram a esperar
+
+        Args:
+            timeout (Optional[float]): Tempo máximo de espera em segundos
+                                       (None = sem limite, 0 = não espera)
+
+        Returns:
+            Optional[Patient]: O paciente, ou None se o tempo de espera acabar
+        '''
+        pass
+
+    @abstractmethod
+    async def get_status(self) -> Dict[Classification, int]:
+        '''
+        Retorna o tamanho atual de cada uma das 5 filas
+
+        Returns:
+            Dict[Classification, int]: Classificação -> número de pacientes na fila
+        '''
+        pass
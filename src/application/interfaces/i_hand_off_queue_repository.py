@@ -0,0 +1,41 @@
+from abc import abstractmethod
+from typing import Optional, Tuple
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.application.interfaces.i_queue_repository import IQueueRepository
+
+class IHandOffQueueRepository(IQueueRepository):
+    '''
+    Capacidade de um repositório de filas que entrega o próximo paciente de forma
+    provisória: a chamada informa de qual fila ele saiu e em que posição estava, e
+    o paciente pode ser devolvido exatamente ao mesmo lugar se a entrega não se concretizar
+    '''
+
+    @abstractmethod
+    def take_next_patient(self) -> Optional[Tuple[Patient, Classification, int]]:
+        '''
+        Remove o próximo paciente na ordem de prioridade, como get_next_patient
+
+        Returns:
+            Optional[Tuple[Patient, Classification, int]]: O paciente, a sua
+                classificação e o seu número de chegada (usado por return_patient),
+                ou None se todas as filas estiverem vazias
+        '''
+        pass
+
+    @abstractmethod
+    def return_patient(self, patient: Patient, classification: Classification, arrival: int):
+        '''
+        Devolve um paciente retirado por take_next_patient à sua posição original
+        na fila, à frente de quem chegou depois dele
+
+        Args:
+            patient (Patient): O paciente retirado
+            classification (Classification): A classificação retornada por take_next_patient
+            arrival (int): O número de chegada retornado por take_next_patient
+
+        Raises:
+            KeyError: Se a classificação não for válida
+            ValueError: Se o paciente já estiver esperando ou o número de chegada for inválido
+        '''
+        pass
@@ -0,0 +1,30 @@
+from abc import abstractmethod
+from typing import Any, Dict, Optional
+from src.domain.queue_position import QueuePosition
+from src.application.interfaces.i_queue_repository import IQueueRepository
+
+class IPositionedQueueRepository(IQueueRepository):
+    '''
+    Capacidade de um repositório de filas que informa a posição dos pacientes em espera
+    '''
+
+    @abstractmethod
+    def get_position(self, patient_id: Any) -> Optional[QueuePosition]:
+        '''
+        Retorna a posição de um paciente em espera: quantos estão à frente dele
+        na sua fila e quantos serão chamados antes dele na ordem de despacho
+
+        Args:
+            patient_id (Any): O id do paciente (Patient.id)
+
+        Returns:
+            Optional[QueuePosition]: A posição, ou None se o paciente não estiver esperando
+        '''
+        pass
+
+    @abstractmethod
+    def get_positions(self) -> Dict[Any, QueuePosition]:
+        '''
+        Retorna a posição de todos os pacientes em espera (id -> posição)
+        '''
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, List, Tuple
 from src.domain.patient import Patient
 from src.domain.classification import Classification
 
@@ -7,6 +7,11 @@ class IQueueRepository(ABC):
     '''
     Essa é a interface que define as operações obrigatórias para um repositório de gerenciamento de filas de pacientes
     Com isso, qualquer classe que implementar essa interface deve fornecer a lógica para os métodos a seguir
+
+    Operações que nem todo repositório oferece ficam em interfaces de capacidade
+    (ISearchableQueueRepository, IPositionedQueueRepository, IVersionedStatusRepository,
+    IHandOffQueueRepository);
+    quem precisa delas verifica com isinstance
     '''
 
     @abstractmethod
@@ -32,6 +37,39 @@ class IQueueRepository(ABC):
         '''
         pass
      
+    def add_patients(self, entries: Iterable[Tuple[Patient, Classification]]):
+        '''
+        Adiciona vários pacientes de uma vez, cada um na fila da sua classificação
+
+        A ordem de chegada dentro de cada fila deve ser a mesma de uma sequência
+        de chamadas a add_patient. Esta implementação padrão faz exatamente isso;
+        repositórios podem sobrescrevê-la para amortizar o custo por paciente
+
+        Args:
+            entries (Iterable[Tuple[Patient, Classification]]): Pares (paciente, classificação)
+        '''
+        for patient, classification in entries:
+            self.add_patient(patient, classification)
+
+    def get_next_patients(self, count: int) -> List[Patient]:
+        '''
+        Remove e retorna até 'count' pacientes, na mesma ordem que
+        'count' chamadas seguidas a get_next_patient retornariam
+
+        Args:
+            count (int): Quantidade máxima de pacientes a chamar
+
+        Returns:
+            List[Patient]: Os pacientes chamados (vazia se todas as filas estiverem vazias)
+        '''
+        patients = []
+        for _ in range(count):
+            patient = self.get_next_patient()
+            if patient is None:
+                break
+            patients.append(patient)
+        return patients
+
     @abstractmethod
     def get_status(self) -> Dict[Classification, int]:
         '''
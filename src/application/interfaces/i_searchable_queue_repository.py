@@ -0,0 +1,64 @@
+from abc import abstractmethod
+from typing import Any, Optional, Tuple
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.application.interfaces.i_queue_repository import IQueueRepository
+
+class ISearchableQueueRepository(IQueueRepository):
+    '''
+    Capacidade de um repositório de filas que mantém um índice por id do paciente:
+    encontrar, remover e reclassificar um paciente em espera em qualquer posição
+    '''
+
+    @abstractmethod
+    def find_patient(self, patient_id: Any) -> Optional[Tuple[Patient, Classification]]:
+        '''
+        Procura um paciente em espera pelo seu id
+
+        Args:
+            patient_id (Any): O id do paciente (Patient.id)
+
+        Returns:
+            Optional[Tuple[Patient, Classification]]: O paciente e a fila em que está,
+                                                      ou None se ele não estiver esperando
+        '''
+        pass
+
+    @abstractmethod
+    def remove_patient(self, patient_id: Any) -> Patient:
+        '''
+        Remove um paciente em espera de qualquer posição da sua fila
+        (ex: o paciente foi embora sem ser atendido)
+
+        Args:
+            patient_id (Any): O id do paciente (Patient.id)
+
+        Returns:
+            Patient: O paciente removido
+
+        Raises:
+            KeyError: Se nenhum paciente com esse id estiver esperando
+        '''
+        pass
+
+    @abstractmethod
+    def reclassify_patient(self, patient_id: Any, new_classification: Classification,
+                           keep_arrival_order: bool = False) -> Classification:
+        '''
+        Move um paciente em espera para a fila de outra classificação (retriagem)
+
+        Args:
+            patient_id (Any): O id do paciente (Patient.id)
+            new_classification (Classification): A nova classificação
+            keep_arrival_order (bool): Se True, o paciente entra na nova fila na posição
+                                       correspondente à sua chegada original; se False,
+                                       entra no fim, como uma nova chegada
+
+        Returns:
+            Classification: A classificação anterior
+
+        Raises:
+            KeyError: Se nenhum paciente com esse id estiver esperando ou se a
+                      classificação não for válida
+        '''
+        pass
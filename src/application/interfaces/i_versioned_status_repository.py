@@ -0,0 +1,43 @@
+from abc import abstractmethod
+from typing import Callable, Optional
+from src.domain.status_snapshot import StatusDelta, StatusSnapshot
+from src.application.interfaces.i_queue_repository import IQueueRepository
+
+class IVersionedStatusRepository(IQueueRepository):
+    '''
+    Capacidade de um repositório de filas com status versionado: consultas
+    "mudou desde a versão X?" e assinaturas das alterações
+    '''
+
+    @abstractmethod
+    def get_status_if_changed(self, since_version: int) -> Optional[StatusSnapshot]:
+        '''
+        Retorna o status versionado se as filas mudaram desde 'since_version'
+
+        Permite consultar o status com alta frequência quase sem custo: enquanto
+        nada muda, a resposta é None e nenhum dicionário é montado
+
+        Args:
+            since_version (int): A última versão que o chamador conhece (-1 para sempre receber)
+
+        Returns:
+            Optional[StatusSnapshot]: O status atual com a sua versão, ou None se não houve mudança
+        '''
+        pass
+
+    @abstractmethod
+    def subscribe_status(self, callback: Callable[[StatusDelta], None]) -> Callable[[], None]:
+        '''
+        Registra uma função chamada com as alterações das filas (StatusDelta)
+
+        As alterações de uma mesma operação (ex: um lote) chegam em uma única
+        entrega, só com as classificações cujo tamanho mudou. A função é chamada
+        na thread que alterou o repositório
+
+        Args:
+            callback (Callable[[StatusDelta], None]): Recebe cada entrega
+
+        Returns:
+            Callable[[], None]: Função que cancela a assinatura
+        '''
+        pass
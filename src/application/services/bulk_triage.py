@@ -0,0 +1,71 @@
+from typing import List, Union
+from src.domain.triage_node import NodoArvore
+from src.domain.classification import Classification
+from src.application.services.triage_compiler import CompiledTriageTree, NO_VALUE, compile_tree
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependência opcional
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("A triagem em lote requer o NumPy. Instale com: pip install numpy")
+
+
+def classify_matrix(tree: Union[NodoArvore, CompiledTriageTree], answers) -> "np.ndarray":
+    '''
+    Classifica N conjuntos de respostas de uma vez, usando máscaras vetorizadas
+
+    Em vez de um laço Python por paciente, todos os pacientes descem a árvore
+    juntos, um nível por iteração; quem chega a uma folha sai do conjunto ativo.
+    O número de iterações é a profundidade da árvore, não o número de pacientes
+
+    Args:
+        tree (NodoArvore | CompiledTriageTree): A árvore (ex: montar_arvore()) ou ela já compilada
+        answers (array-like): Matriz N×Q de booleanos; a coluna q é a resposta da
+                              pergunta compiled.questions[q] (True = Sim)
+
+    Returns:
+        np.ndarray: Vetor com N prioridades de Classification (0 = Vermelho ... 4 = Azul)
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado
+        ValueError: Se a matriz não tiver uma coluna por pergunta da árvore
+    '''
+    _require_numpy()
+    compiled = tree if isinstance(tree, CompiledTriageTree) else compile_tree(tree)
+
+    answers = np.asarray(answers, dtype=bool)
+    if answers.ndim != 2 or answers.shape[1] != len(compiled.questions):
+        raise ValueError(
+            f"A matriz de respostas deve ter formato N×{len(compiled.questions)} "
+            f"(uma coluna por pergunta), recebido {answers.shape}."
+        )
+
+    question_id = np.asarray(compiled.question_id, dtype=np.intp)
+    yes_index = np.asarray(compiled.yes_index, dtype=np.intp)
+    no_index = np.asarray(compiled.no_index, dtype=np.intp)
+    leaf_priority = np.asarray(compiled.leaf_priority, dtype=np.int8)
+
+    node = np.zeros(answers.shape[0], dtype=np.intp)
+    active = np.arange(answers.shape[0]) if not compiled.is_leaf(0) else np.empty(0, dtype=np.intp)
+
+    # Cada iteração avança todos os pacientes ativos um nível na árvore
+    while active.size:
+        current = node[active]
+        answered_yes = answers[active, question_id[current]]
+        following = np.where(answered_yes, yes_index[current], no_index[current])
+        node[active] = following
+        active = active[leaf_priority[following] == NO_VALUE]
+
+    return leaf_priority[node]
+
+
+def to_classifications(priorities) -> List[Classification]:
+    '''
+    Converte um vetor de prioridades (saída de classify_matrix) em Classification
+    '''
+    by_priority = {cls.priority: cls for cls in Classification}
+    return [by_priority[int(priority)] for priority in priorities]
@@ -0,0 +1,232 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.domain.triage_node import NodoArvore
+from src.domain.classification import Classification
+
+# Valor usado nas colunas que não se aplicam ao nó (ex: 'yes_index' de uma folha)
+NO_VALUE = -1
+
+_CLASSIFICATION_BY_PRIORITY: Dict[int, Classification] = {cls.priority: cls for cls in Classification}
+
+
+class CompiledTriageTree:
+    '''
+    Árvore de decisão compilada em uma tabela plana de inteiros
+
+    Cada nó vira uma linha (o índice da linha é o índice do nó) com as colunas:
+    - question_id: índice da pergunta em 'questions' (NO_VALUE nas folhas)
+    - yes_index / no_index: linhas dos filhos (NO_VALUE nas folhas)
+    - leaf_priority: prioridade da Classification da folha (NO_VALUE nos nós de pergunta)
+
+    A raiz é sempre a linha 0. Todas as colunas são tuplas, então a tabela é
+    imutável e pode ser compartilhada entre threads ou enviada a outros processos (pickle)
+    '''
+    __slots__ = ("questions", "question_id", "yes_index", "no_index", "leaf_priority")
+
+    def __init__(self,
+                 questions: Tuple[str, ...],
+                 question_id: Tuple[int, ...],
+                 yes_index: Tuple[int, ...],
+                 no_index: Tuple[int, ...],
+                 leaf_priority: Tuple[int, ...]):
+        size = len(question_id)
+        if not size or any(len(column) != size for column in (yes_index, no_index, leaf_priority)):
+            raise ValueError("Todas as colunas da tabela compilada devem ter o mesmo tamanho (e não vazio).")
+
+        self.questions = tuple(questions)
+        self.question_id = tuple(question_id)
+        self.yes_index = tuple(yes_index)
+        self.no_index = tuple(no_index)
+        self.leaf_priority = tuple(leaf_priority)
+
+    def __len__(self) -> int:
+        # Número de nós da tabela
+        return len(self.question_id)
+
+    def __getstate__(self):
+        return (self.questions, self.question_id, self.yes_index, self.no_index, self.leaf_priority)
+
+    def __setstate__(self, state):
+        self.questions, self.question_id, self.yes_index, self.no_index, self.leaf_priority = state
+
+    def is_leaf(self, index: int) -> bool:
+        return self.leaf_priority[index] != NO_VALUE
+
+    def question_at(self, index: int) -> Optional[str]:
+        # Retorna o texto da pergunta do nó, ou None se for folha
+        question_id = self.question_id[index]
+        return None if question_id == NO_VALUE else self.questions[question_id]
+
+    def classification_at(self, index: int) -> Optional[Classification]:
+        # Retorna a classificação do nó folha, ou None se for nó de pergunta
+        priority = self.leaf_priority[index]
+        return None if priority == NO_VALUE else _CLASSIFICATION_BY_PRIORITY[priority]
+
+    def rows(self) -> List[Tuple[int, int, int, int, int]]:
+        # Retorna a tabela linha a linha: (índice, pergunta, sim, não, prioridade da folha)
+        return list(zip(range(len(self)), self.question_id, self.yes_index, self.no_index, self.leaf_priority))
+
+    def classify(self, answers: Sequence[bool]) -> Classification:
+        '''
+        Classifica um conjunto completo de respostas, indexado pelo id da pergunta
+
+        Args:
+            answers (Sequence[bool]): answers[question_id] é a resposta (True = Sim)
+
+        Returns:
+            Classification: A classificação da folha alcançada
+        '''
+        question_id, yes_index, no_index, leaf_priority = self.question_id, self.yes_index, self.no_index, self.leaf_priority
+        index = 0
+        while leaf_priority[index] == NO_VALUE:
+            index = yes_index[index] if answers[question_id[index]] else no_index[index]
+        return _CLASSIFICATION_BY_PRIORITY[leaf_priority[index]]
+
+
+def compile_tree(root_node: NodoArvore) -> CompiledTriageTree:
+    '''
+    Compila uma árvore de NodoArvore em uma CompiledTriageTree
+
+    Os nós são numerados em pré-ordem (raiz = 0, depois o ramo 'sim', depois o 'não').
+    Subárvores compartilhadas são compiladas uma única vez, e perguntas com o mesmo
+    texto recebem o mesmo id
+
+    Args:
+        root_node (NodoArvore): A raiz da árvore (ex: montar_arvore())
+
+    Returns:
+        CompiledTriageTree: A tabela compilada
+
+    Raises:
+        ValueError: Se a árvore for inválida (nó incompleto, filho inválido ou ciclo)
+    '''
+    if not root_node or not isinstance(root_node, NodoArvore):
+        raise ValueError("A árvore de triagem (root_node) é inválida.")
+
+    questions: List[str] = []
+    question_ids: Dict[str, int] = {}
+    question_id: List[int] = []
+    yes_index: List[int] = []
+    no_index: List[int] = []
+    leaf_priority: List[int] = []
+    index_of: Dict[int, int] = {}
+    in_progress = set()
+
+    def visit(node: NodoArvore) -> int:
+        if not isinstance(node, NodoArvore):
+            raise ValueError("Os filhos (yes_child/no_child) devem ser instâncias de NodoArvore.")
+
+        key = id(node)
+        if key in index_of:
+            return index_of[key]
+        if key in in_progress:
+            raise ValueError(f"A árvore de triagem contém um ciclo em {node}.")
+
+        # Reserva a linha do nó antes de visitar os filhos (pré-ordem)
+        index = len(question_id)
+        question_id.append(NO_VALUE)
+        yes_index.append(NO_VALUE)
+        no_index.append(NO_VALUE)
+        leaf_priority.append(NO_VALUE)
+
+        if node.is_leaf():
+            if not isinstance(node.classification, Classification):
+                raise ValueError("A classificação deve ser uma instância da Enum Classification.")
+            leaf_priority[index] = node.classification.priority
+        else:
+            if not node.question or node.yes_child is None or node.no_child is None:
+                raise ValueError(f"Nó de pergunta ('{node.question}') deve ter ambos os filhos (yes_child e no_child).")
+            if node.question not in question_ids:
+                question_ids[node.question] = len(questions)
+                questions.append(node.question)
+            question_id[index] = question_ids[node.question]
+
+            in_progress.add(key)
+            yes_index[index] = visit(node.yes_child)
+            no_index[index] = visit(node.no_child)
+            in_progress.discard(key)
+
+        index_of[key] = index
+        return index
+
+    visit(root_node)
+    return CompiledTriageTree(tuple(questions), tuple(question_id), tuple(yes_index), tuple(no_index), tuple(leaf_priority))
+
+
+def verify_equivalence(root_node: NodoArvore, compiled: CompiledTriageTree) -> bool:
+    '''
+    Verifica se a tabela compilada é equivalente à árvore original
+
+    Percorre as duas estruturas em paralelo, comparando o texto de cada
+    pergunta e a classificação de cada folha em todos os caminhos
+
+    Args:
+        root_node (NodoArvore): A raiz da árvore original
+        compiled (CompiledTriageTree): A tabela a ser verificada
+
+    Returns:
+        bool: True se toda sequência de respostas leva ao mesmo resultado nas duas
+    '''
+    pending = [(root_node, 0)]
+    checked = set()
+
+    while pending:
+        node, index = pending.pop()
+        if (id(node), index) in checked:
+            continue
+        checked.add((id(node), index))
+
+        if not 0 <= index < len(compiled):
+            return False
+
+        if node.is_leaf():
+            if compiled.classification_at(index) is not node.classification:
+                return False
+        else:
+            if compiled.is_leaf(index) or compiled.question_at(index) != node.question:
+                return False
+            pending.append((node.yes_child, compiled.yes_index[index]))
+            pending.append((node.no_child, compiled.no_index[index]))
+
+    return True
+
+
+class CompiledTriageNavigator:
+    '''
+    Versão do TriageNavigator que percorre uma CompiledTriageTree
+
+    Todo o estado da triagem é um único inteiro (o índice do nó atual), e a
+    tabela é somente leitura, então vários navegadores podem compartilhá-la
+    '''
+    __slots__ = ("tree", "current_index")
+
+    def __init__(self, compiled: CompiledTriageTree):
+        if not isinstance(compiled, CompiledTriageTree):
+            raise ValueError("A árvore compilada (compiled) é inválida.")
+        self.tree = compiled
+        self.current_index = 0
+
+    def reset(self):
+        # Volta para a raiz para uma nova triagem
+        self.current_index = 0
+
+    def get_current_question(self) -> Optional[str]:
+        '''Retorna a pergunta atual, ou None se a triagem terminou'''
+        return self.tree.question_at(self.current_index)
+
+    def navigate(self, answer_is_yes: bool):
+        '''Avança na tabela com base na resposta'''
+        if self.is_finished():
+            return
+
+        if answer_is_yes:
+            self.current_index = self.tree.yes_index[self.current_index]
+        else:
+            self.current_index = self.tree.no_index[self.current_index]
+
+    def is_finished(self) -> bool:
+        ''' Verifica se a triagem chegou a uma folha (classificação)'''
+        return self.tree.is_leaf(self.current_index)
+
+    def get_final_classification(self) -> Optional[Classification]:
+        ''' Retorna a classificação final, ou None se não terminou '''
+        return self.tree.classification_at(self.current_index)
@@ -1,19 +1,107 @@
+import weakref
 from src.domain.triage_node import NodoArvore
 from src.domain.classification import Classification
-from src.infrastructure.triage_builder import montar_arvore
-from typing import Optional
+from typing import Dict, Optional, Union
 
-def _ask_yes_no(prompt: str) -> bool:
+
+class TriagePathIndex:
+    '''
+    Índice pré-calculado de caminhos da árvore: código de respostas -> folha
+
+    Cada caminho da raiz até uma folha vira um código compacto com uma letra por
+    resposta ('S' = Sim, 'N' = Não), ex: "NNS" -> Amarelo. Assim uma triagem com
+    todas as respostas conhecidas é resolvida em uma única consulta ao dicionário
+
+    O índice guarda a geração da raiz (root_node.get_generation()) e se
+    reconstrói sozinho na próxima consulta se algum nó desta árvore tiver sido alterado
+    '''
+
+    def __init__(self, root_node: NodoArvore):
+        if not root_node or not isinstance(root_node, NodoArvore):
+            raise ValueError("A árvore de triagem (root_node) é inválida.")
+        self.root_node = root_node
+        self._leaves: Dict[str, NodoArvore] = {}
+        self._generation = -1
+
+    def _rebuild(self):
+        # Percorre todos os caminhos da árvore, guardando o código de cada folha
+        leaves: Dict[str, NodoArvore] = {}
+        pending = [(self.root_node, "", frozenset())]
+
+        while pending:
+            node, code, ancestors = pending.pop()
+            if node.is_leaf():
+                leaves[code] = node
+                continue
+            if id(node) in ancestors:
+                raise ValueError(f"A árvore de triagem contém um ciclo em {node}.")
+            ancestors = ancestors | {id(node)}
+            pending.append((node.no_child, code + "N", ancestors))
+            pending.append((node.yes_child, code + "S", ancestors))
+
+        self._leaves = leaves
+        self._generation = self.root_node.get_generation()
+
+    def _current_leaves(self) -> Dict[str, NodoArvore]:
+        # Reconstrói o índice se a árvore mudou desde a última consulta
+        if self._generation != self.root_node.get_generation():
+            self._rebuild()
+        return self._leaves
+
+    def lookup_leaf(self, code: str) -> Optional[NodoArvore]:
+        # Retorna o nó folha do caminho, ou None se o código não for um caminho completo
+        return self._current_leaves().get(code.strip().upper())
+
+    def lookup(self, code: str) -> Optional[Classification]:
+        '''
+        Retorna a classificação do caminho (ex: "NNS"), ou None se o código não
+        corresponder a um caminho completo da raiz até uma folha
+        '''
+        leaf = self.lookup_leaf(code)
+        return leaf.classification if leaf else None
+
+    def paths(self) -> Dict[str, Classification]:
+        # Retorna todos os caminhos conhecidos (código -> classificação)
+        return {code: leaf.classification for code, leaf in self._current_leaves().items()}
+
+
+# Um índice por árvore, compartilhado entre navegadores (liberado junto com a árvore)
+_path_indexes: "weakref.WeakKeyDictionary[NodoArvore, TriagePathIndex]" = weakref.WeakKeyDictionary()
+
+def get_path_index(root_node: NodoArvore) -> TriagePathIndex:
+    '''
+    Retorna o TriagePathIndex da árvore, criando-o na primeira chamada
+    '''
+    index = _path_indexes.get(root_node)
+    if index is None:
+        index = TriagePathIndex(root_node)
+        _path_indexes[root_node] = index
+    return index
+
+
+def _is_path_code(answer: str) -> bool:
+    # Um código de caminho tem mais de uma letra e só contém 'S' e 'N'
+    return len(answer) > 1 and set(answer) <= {'S', 'N'}
+
+def _ask_yes_no(prompt: str, path_index: Optional[TriagePathIndex] = None) -> Union[bool, str]:
     '''
     Função auxiliar privada para o console
+
+    Se 'path_index' for informado, também aceita o caminho completo de
+    respostas (ex: "NNS") e o retorna como string
     '''
+    hint = "S/N ou caminho completo, ex: NNS" if path_index else "S/N"
     while True:
         try:
-            answer = input(f"\n[PERGUNTA] {prompt} (S/N): ").strip().upper()
+            answer = input(f"\n[PERGUNTA] {prompt} ({hint}): ").strip().upper()
             if answer == 'S' or answer == 'SIM':
                 return True
             elif answer == 'N' or answer == 'NAO' or answer == 'NÃO':
                 return False
+            elif path_index and _is_path_code(answer):
+                if path_index.lookup(answer) is not None:
+                    return answer
+                print(f"ERRO: Caminho '{answer}' não leva a uma classificação. Caminhos válidos: {', '.join(sorted(path_index.paths()))}.")
             else:
                 print(f"ERRO: Resposta '{answer}' inválida. Por favor, digite 'S' para Sim ou 'N' para Não.")
         except KeyboardInterrupt:
@@ -28,9 +116,14 @@ def triagem_console(root_node: NodoArvore) -> Classification:
     current_node = root_node
     
     try:
+        # Na primeira pergunta o operador pode digitar o caminho inteiro (atalho)
+        path_index = get_path_index(root_node)
         while not current_node.is_leaf():
-            answer_is_yes = _ask_yes_no(current_node.question)
-            current_node = current_node.yes_child if answer_is_yes else current_node.no_child
+            answer = _ask_yes_no(current_node.question, path_index if current_node is root_node else None)
+            if isinstance(answer, str):
+                current_node = path_index.lookup_leaf(answer)
+            else:
+                current_node = current_node.yes_child if answer else current_node.no_child
             
         final_classification = current_node.classification
         print("--- Triagem Concluída ---")
@@ -67,6 +160,24 @@ class TriageNavigator:
         else:
             self.current_node = self.current_node.no_child
             
+    def navigate_path(self, code: str) -> Classification:
+        '''
+        Atalho: aplica o caminho completo de respostas (ex: "NNS") a partir
+        da raiz e termina a triagem em uma única consulta ao índice de caminhos
+
+        Raises:
+            ValueError: Se a triagem já começou ou se o código não for um caminho completo
+        '''
+        if self.current_node is not self.root_node:
+            raise ValueError("O atalho de caminho só pode ser usado no início da triagem.")
+
+        leaf = get_path_index(self.root_node).lookup_leaf(code)
+        if leaf is None:
+            raise ValueError(f"Caminho '{code}' não leva a uma classificação.")
+
+        self.current_node = leaf
+        return leaf.classification
+            
     def is_finished(self) -> bool:
         ''' Verifica se a triagem chegou a uma folha (classificação)'''
         return self.current_node.is_leaf()
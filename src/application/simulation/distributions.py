@@ -0,0 +1,62 @@
+import math
+import random
+
+# Uma distribuição de tempo de atendimento é um objeto chamável que recebe o gerador
+# aleatório da simulação e sorteia uma duração em minutos. Receber o gerador (em vez
+# de usar o módulo random) é o que torna a simulação reproduzível pela semente.
+# São classes simples (e não lambdas) para poderem ser enviadas a outros processos (pickle)
+
+class Exponential:
+    # Duração exponencial com a média informada (sem memória: o caso clássico M/M/c)
+    __slots__ = ("mean", "_rate")
+
+    def __init__(self, mean: float):
+        if mean <= 0:
+            raise ValueError("A média deve ser positiva.")
+        self.mean = mean
+        self._rate = 1.0 / mean
+
+    def __call__(self, rng: random.Random) -> float:
+        return rng.expovariate(self._rate)
+
+    def __repr__(self) -> str:
+        return f"Exponential(mean={self.mean})"
+
+
+class LogNormal:
+    '''
+    Duração lognormal com a média informada (assimétrica à direita, como os
+    atendimentos reais: a maioria é curta e alguns demoram bem mais)
+
+    'sigma' é o desvio padrão do logaritmo e controla a assimetria
+    '''
+    __slots__ = ("mean", "sigma", "_mu")
+
+    def __init__(self, mean: float, sigma: float = 0.5):
+        if mean <= 0 or sigma < 0:
+            raise ValueError("A média deve ser positiva e sigma não pode ser negativo.")
+        self.mean = mean
+        self.sigma = sigma
+        self._mu = math.log(mean) - sigma * sigma / 2
+
+    def __call__(self, rng: random.Random) -> float:
+        return rng.lognormvariate(self._mu, self.sigma)
+
+    def __repr__(self) -> str:
+        return f"LogNormal(mean={self.mean}, sigma={self.sigma})"
+
+
+class Fixed:
+    # Duração constante (útil para conferir a simulação com contas de cabeça)
+    __slots__ = ("duration",)
+
+    def __init__(self, duration: float):
+        if duration < 0:
+            raise ValueError("A duração não pode ser negativa.")
+        self.duration = duration
+
+    def __call__(self, rng: random.Random) -> float:
+        return self.duration
+
+    def __repr__(self) -> str:
+        return f"Fixed({self.duration})"
@@ -0,0 +1,324 @@
+import heapq
+import math
+import random
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_queue_repository import IQueueRepository
+from src.application.services.triage_compiler import CompiledTriageTree, NO_VALUE
+from src.application.use_cases.register_patient import RegisterPatientUseCase
+from src.application.use_cases.call_next_patient import CallNextPatientUseCase
+from src.application.simulation.distributions import Exponential
+
+# Tipos de evento da simulação
+_ARRIVAL = 0
+_DEPARTURE = 1
+
+_CLASSIFICATION_BY_PRIORITY: Dict[int, Classification] = {cls.priority: cls for cls in Classification}
+
+def default_service_times() -> Dict[Classification, Any]:
+    # Tempos médios de atendimento (minutos) por cor: casos mais graves demoram mais
+    means = {
+        Classification.RED: 45.0,
+        Classification.ORANGE: 30.0,
+        Classification.YELLOW: 20.0,
+        Classification.GREEN: 12.0,
+        Classification.BLUE: 8.0,
+    }
+    return {cls: Exponential(mean) for cls, mean in means.items()}
+
+
+class SimulatedClock:
+    '''
+    Relógio da simulação, no formato dos relógios injetáveis dos repositórios
+    (chamável, em segundos)
+
+    O motor avança 'minutes' a cada evento; um repositório que carimba as chegadas
+    (ex: DeadlineQueueRepository(clock=...)) passa a ver o tempo simulado em vez do
+    relógio de parede, que mal anda durante uma execução
+    '''
+    __slots__ = ("minutes",)
+
+    def __init__(self):
+        self.minutes = 0.0
+
+    def __call__(self) -> float:
+        return self.minutes * 60.0
+
+
+@dataclass
+class SimulationConfig:
+    '''
+    Parâmetros de uma execução da simulação (tempos em minutos)
+
+    arrival_rates: chegadas por hora de cada cor (processos de Poisson independentes)
+    doctors: número de consultórios atendendo em paralelo
+    duration: duração simulada; depois dela não há novas chegadas nem atendimentos
+    warmup: período inicial descartado das estatísticas (fila ainda enchendo)
+    service_times: distribuição do tempo de atendimento de cada cor (ver distributions.py)
+    triage_tree: se informada, cada chegada é triada percorrendo a árvore compilada com
+                 respostas aleatórias, e as taxas por cor só definem a taxa total de chegadas
+    yes_probabilities: probabilidade de "Sim" de cada pergunta, indexada pelo id da
+                       pergunta na árvore compilada (padrão: 0.5 para todas)
+    seed: semente do gerador aleatório (mesma semente => mesmos resultados)
+    '''
+    arrival_rates: Dict[Classification, float]
+    doctors: int = 3
+    duration: float = 24 * 60.0
+    warmup: float = 0.0
+    service_times: Dict[Classification, Any] = field(default_factory=default_service_times)
+    triage_tree: Optional[CompiledTriageTree] = None
+    yes_probabilities: Optional[Sequence[float]] = None
+    seed: int = 0
+
+    def validate(self):
+        # Levanta ValueError com a primeira inconsistência encontrada
+        if not self.arrival_rates or any(rate < 0 for rate in self.arrival_rates.values()):
+            raise ValueError("As taxas de chegada devem existir e não podem ser negativas.")
+        if sum(self.arrival_rates.values()) <= 0:
+            raise ValueError("A taxa total de chegadas deve ser positiva.")
+        if self.doctors < 1:
+            raise ValueError("É preciso pelo menos um consultório.")
+        if self.duration <= 0 or not 0 <= self.warmup < self.duration:
+            raise ValueError("A duração deve ser positiva e o aquecimento deve ser menor que ela.")
+        missing = [cls.name for cls in Classification if cls not in self.service_times]
+        if missing:
+            raise ValueError(f"Faltam tempos de atendimento para: {', '.join(missing)}.")
+        if self.triage_tree is not None and self.yes_probabilities is not None:
+            if len(self.yes_probabilities) != len(self.triage_tree.questions):
+                raise ValueError("É preciso uma probabilidade de 'Sim' para cada pergunta da árvore.")
+
+
+@dataclass(frozen=True)
+class WaitStats:
+    '''
+    Resumo dos tempos de espera (minutos) de uma cor
+
+    within_target é a fração dos pacientes atendidos dentro do tempo-alvo do protocolo
+    '''
+    count: int
+    mean: float
+    p50: float
+    p90: float
+    p95: float
+    p99: float
+    max: float
+    within_target: float
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    # Percentil pelo método do posto mais próximo (lista já ordenada e não vazia)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+def summarize_waits(samples: List[float], target_wait: float) -> WaitStats:
+    '''
+    Calcula o resumo de uma lista de esperas (a lista não é alterada)
+    '''
+    if not samples:
+        nan = float("nan")
+        return WaitStats(0, nan, nan, nan, nan, nan, nan, nan)
+    ordered = sorted(samples)
+    within = bisect_right(ordered, target_wait)
+    return WaitStats(
+        count=len(ordered),
+        mean=math.fsum(ordered) / len(ordered),
+        p50=_percentile(ordered, 0.50),
+        p90=_percentile(ordered, 0.90),
+        p95=_percentile(ordered, 0.95),
+        p99=_percentile(ordered, 0.99),
+        max=ordered[-1],
+        within_target=within / len(ordered),
+    )
+
+
+@dataclass
+class SimulationResult:
+    '''
+    Resultado de uma execução
+
+    waits: resumo das esperas por cor (só pacientes que chegaram depois do aquecimento)
+    wait_samples: as esperas individuais por cor (mesmo filtro)
+    arrivals / served: pacientes que chegaram / começaram a ser atendidos
+    still_waiting: pacientes nas filas quando o tempo simulado acabou
+    events_processed: eventos tirados do heap (chegadas + fins de atendimento)
+    doctor_utilization: fração do tempo em que os consultórios estiveram ocupados
+    '''
+    seed: int
+    waits: Dict[Classification, WaitStats]
+    wait_samples: Dict[Classification, List[float]]
+    arrivals: int
+    served: int
+    still_waiting: int
+    events_processed: int
+    doctor_utilization: float
+
+
+class SimulationEngine:
+    '''
+    Simulação de eventos discretos do pronto-atendimento
+
+    Um heap de eventos (chegada de paciente, fim de atendimento) ordenados pelo
+    tempo simulado. Cada chegada é cadastrada e cada consultório livre chama o
+    próximo paciente pelos mesmos casos de uso da aplicação, então qualquer
+    IQueueRepository pode ser simulado (ex: ordem estrita por cor ou por prazo)
+
+    As chegadas das 5 cores são somadas em um único processo de Poisson (a soma de
+    processos de Poisson independentes é Poisson) e a cor de cada chegada é sorteada
+    proporcionalmente às taxas, então o heap guarda no máximo uma chegada pendente
+    mais um evento por consultório ocupado
+
+    Todo o acaso vem de um random.Random semeado pela configuração: a mesma
+    semente produz exatamente os mesmos resultados
+
+    O tempo simulado fica em 'clock' (segundos). Repositórios que dependem do relógio
+    devem recebê-lo, senão as políticas por prazo comparam carimbos do relógio de
+    parede; with_repository monta o repositório já com ele
+    '''
+
+    def __init__(self, config: SimulationConfig, queue_repo: IQueueRepository, events: Optional[EventSink] = None,
+                 clock: Optional[SimulatedClock] = None):
+        '''
+        Args:
+            config (SimulationConfig): Parâmetros da execução
+            queue_repo (IQueueRepository): Repositório vazio que receberá os pacientes
+            events (Optional[EventSink]): Destino dos eventos da simulação. Os casos de uso
+                                          e o repositório seguem com os seus próprios sinks
+                                          (deixe-os desligados para simulações longas)
+            clock (Optional[SimulatedClock]): Relógio avançado pela simulação (o mesmo
+                                              entregue ao repositório, se ele usar um)
+        '''
+        config.validate()
+        if not isinstance(queue_repo, IQueueRepository):
+            raise TypeError("O repositório (queue_repo) deve implementar a interface IQueueRepository.")
+        if sum(queue_repo.get_status().values()):
+            raise ValueError("A simulação precisa de um repositório vazio.")
+
+        self.config = config
+        self.queue_repo = queue_repo
+        self.clock = clock if clock is not None else SimulatedClock()
+        self._events = events if events is not None else NULL_SINK
+        self._register = RegisterPatientUseCase(queue_repo)
+        self._call_next = CallNextPatientUseCase(queue_repo)
+
+    @classmethod
+    def with_repository(cls, config: SimulationConfig,
+                        repository_factory: Callable[[SimulatedClock], IQueueRepository],
+                        events: Optional[EventSink] = None) -> "SimulationEngine":
+        '''
+        Cria o motor e o repositório, entregando a ele o relógio simulado
+
+        Args:
+            repository_factory (Callable[[SimulatedClock], IQueueRepository]): Recebe o relógio
+                (em segundos) e cria um repositório vazio, ex:
+                lambda clock: DeadlineQueueRepository(clock=clock)
+        '''
+        clock = SimulatedClock()
+        return cls(config, repository_factory(clock), events, clock)
+
+    def _make_triage(self, rng: random.Random):
+        # Retorna a função que sorteia a cor de uma chegada
+        config = self.config
+        tree = config.triage_tree
+        if tree is None:
+            classes = [cls for cls in sorted(config.arrival_rates, key=lambda c: c.priority) if config.arrival_rates[cls] > 0]
+            cumulative = []
+            total = 0.0
+            for cls in classes:
+                total += config.arrival_rates[cls]
+                cumulative.append(total)
+            last = len(classes) - 1
+
+            def by_mix() -> Classification:
+                return classes[min(bisect_right(cumulative, rng.random() * total), last)]
+            return by_mix
+
+        probabilities = tuple(config.yes_probabilities) if config.yes_probabilities is not None else (0.5,) * len(tree.questions)
+        question_id, yes_index, no_index, leaf_priority = tree.question_id, tree.yes_index, tree.no_index, tree.leaf_priority
+
+        def by_tree() -> Classification:
+            # Só as perguntas do caminho percorrido são sorteadas
+            index = 0
+            while leaf_priority[index] == NO_VALUE:
+                index = yes_index[index] if rng.random() < probabilities[question_id[index]] else no_index[index]
+            return _CLASSIFICATION_BY_PRIORITY[leaf_priority[index]]
+        return by_tree
+
+    def run(self) -> SimulationResult:
+        '''
+        Executa a simulação até o fim da duração configurada
+
+        Returns:
+            SimulationResult: Estatísticas de espera por cor e contadores da execução
+        '''
+        config = self.config
+        rng = random.Random(config.seed)
+        triage = self._make_triage(rng)
+        arrival_rate = sum(config.arrival_rates.values()) / 60.0
+        service_times = config.service_times
+        duration, warmup = config.duration, config.warmup
+        register = self._register.execute
+        call_next = self._call_next.execute
+        clock = self.clock
+        clock.minutes = 0.0
+
+        heap: List[Tuple[float, int, int]] = []
+        push, pop = heapq.heappush, heapq.heappop
+        sequence = 0
+        waiting_since: Dict[Any, Tuple[float, Classification]] = {}
+        samples: Dict[Classification, List[float]] = {cls: [] for cls in Classification}
+        idle_doctors = config.doctors
+        busy_time = 0.0
+        arrivals = served = events_processed = 0
+
+        push(heap, (rng.expovariate(arrival_rate), sequence, _ARRIVAL))
+        self._events.emit(EventLevel.INFO, "Simulação", "Iniciando simulação (semente %d, %d consultórios).", config.seed, config.doctors)
+
+        while heap and heap[0][0] <= duration:
+            now, _, kind = pop(heap)
+            clock.minutes = now
+            events_processed += 1
+
+            if kind == _ARRIVAL:
+                arrivals += 1
+                classification = triage()
+                patient = Patient(f"Paciente {arrivals}")
+                waiting_since[patient.id] = (now, classification)
+                register(patient, classification)
+
+                sequence += 1
+                push(heap, (now + rng.expovariate(arrival_rate), sequence, _ARRIVAL))
+                if not idle_doctors:
+                    continue
+                idle_doctors -= 1
+            # Chegada com consultório livre ou consultório que acabou de atender: chama o próximo
+            patient = call_next()
+            if patient is None:
+                idle_doctors += 1
+                continue
+
+            arrived_at, classification = waiting_since.pop(patient.id)
+            if arrived_at >= warmup:
+                samples[classification].append(now - arrived_at)
+            served += 1
+            service = service_times[classification](rng)
+            busy_time += min(service, duration - now)
+            sequence += 1
+            push(heap, (now + service, sequence, _DEPARTURE))
+
+        still_waiting = sum(self.queue_repo.get_status().values())
+        self._events.emit(EventLevel.INFO, "Simulação", "Simulação concluída: %d eventos, %d atendidos, %d ainda esperando.",
+                          events_processed, served, still_waiting)
+
+        return SimulationResult(
+            seed=config.seed,
+            waits={cls: summarize_waits(samples[cls], cls.target_wait) for cls in Classification},
+            wait_samples=samples,
+            arrivals=arrivals,
+            served=served,
+            still_waiting=still_waiting,
+            events_processed=events_processed,
+            doctor_utilization=busy_time / (config.doctors * duration),
+        )
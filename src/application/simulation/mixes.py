@@ -0,0 +1,9 @@
+from typing import Dict, Tuple
+
+# Distribuições de cores predefinidas (pesos Vermelho -> Azul), compartilhadas pelas
+# ferramentas de linha de comando (varredura de dimensionamento e gerador de carga)
+MIX_PRESETS: Dict[str, Tuple[float, ...]] = {
+    "típico": (2, 8, 25, 45, 20),
+    "grave": (5, 15, 35, 35, 10),
+    "leve": (1, 4, 15, 50, 30),
+}
@@ -0,0 +1,263 @@
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from statistics import NormalDist, fmean, stdev
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from src.domain.classification import Classification
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_queue_repository import IQueueRepository
+from src.application.simulation.engine import SimulationConfig, SimulationEngine, default_service_times
+
+# Cores na ordem de prioridade: as tuplas dos resumos seguem esta ordem
+COLORS: Tuple[Classification, ...] = tuple(sorted(Classification, key=lambda c: c.priority))
+
+
+@dataclass(frozen=True)
+class SweepScenario:
+    '''
+    Um ponto da grade de parâmetros
+
+    arrivals_per_hour: taxa total de chegadas
+    doctors: consultórios atendendo
+    mix_name / mix: nome e pesos da distribuição de cores das chegadas (Vermelho -> Azul)
+    '''
+    arrivals_per_hour: float
+    doctors: int
+    mix_name: str
+    mix: Tuple[float, ...]
+
+    def arrival_rates(self) -> Dict[Classification, float]:
+        total_weight = sum(self.mix)
+        return {cls: self.arrivals_per_hour * weight / total_weight for cls, weight in zip(COLORS, self.mix)}
+
+
+def build_grid(arrivals_per_hour: Sequence[float], doctor_counts: Sequence[int],
+               mixes: Dict[str, Sequence[float]]) -> List[SweepScenario]:
+    '''
+    Monta a grade completa taxa de chegada x consultórios x distribuição de cores
+
+    Raises:
+        ValueError: Se alguma distribuição não tiver 5 pesos não negativos com soma positiva
+    '''
+    for name, weights in mixes.items():
+        if len(weights) != len(COLORS) or any(weight < 0 for weight in weights) or sum(weights) <= 0:
+            raise ValueError(f"A distribuição '{name}' precisa de 5 pesos não negativos (Vermelho -> Azul).")
+    return [
+        SweepScenario(rate, doctors, name, tuple(weights))
+        for name, weights in mixes.items()
+        for rate in arrivals_per_hour
+        for doctors in doctor_counts
+    ]
+
+
+@dataclass(frozen=True)
+class ReplicaSummary:
+    '''
+    O que volta de cada réplica: só números, nunca pacientes ou amostras individuais
+    (tuplas por cor, Vermelho -> Azul; NaN quando a cor não teve atendimentos)
+    '''
+    scenario_index: int
+    replica: int
+    mean_wait: Tuple[float, ...]
+    p95_wait: Tuple[float, ...]
+    within_target: Tuple[float, ...]
+    utilization: float
+    still_waiting: int
+    events: int
+
+
+@dataclass(frozen=True)
+class Interval:
+    # Média entre réplicas e o intervalo de confiança dela (NaN se houver menos de 2 réplicas válidas)
+    mean: float
+    low: float
+    high: float
+
+
+@dataclass(frozen=True)
+class ScenarioSummary:
+    scenario: SweepScenario
+    replicas: int
+    mean_wait: Dict[Classification, Interval]
+    p95_wait: Dict[Classification, Interval]
+    within_target: Dict[Classification, Interval]
+    utilization: Interval
+    still_waiting: float
+    events: int
+
+
+def student_t_quantile(p: float, df: int) -> float:
+    '''
+    Quantil p da distribuição t de Student com 'df' graus de liberdade
+
+    Exato para 1 e 2 graus de liberdade; acima disso usa a expansão de Cornish-Fisher
+    em torno da normal (Abramowitz & Stegun 26.7.5), com erro relativo abaixo de 1% para
+    df >= 3 nos níveis usuais de confiança (90% a 99%)
+    '''
+    if df < 1 or not 0 < p < 1:
+        raise ValueError("São necessários df >= 1 e 0 < p < 1.")
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    z2 = z * z
+    terms = (
+        z,
+        z * (z2 + 1) / 4,
+        z * (5 * z2 * z2 + 16 * z2 + 3) / 96,
+        z * (3 * z2 ** 3 + 19 * z2 * z2 + 17 * z2 - 15) / 384,
+        z * (79 * z2 ** 4 + 776 * z2 ** 3 + 1482 * z2 * z2 - 1920 * z2 - 945) / 92160,
+    )
+    return sum(term / df ** power for power, term in enumerate(terms))
+
+def confidence_interval(values: Sequence[float], confidence: float = 0.95) -> Interval:
+    # Intervalo t para a média de réplicas independentes (valores NaN são ignorados)
+    values = [value for value in values if not math.isnan(value)]
+    if not values:
+        return Interval(math.nan, math.nan, math.nan)
+    mean = fmean(values)
+    if len(values) < 2:
+        return Interval(mean, math.nan, math.nan)
+    half_width = student_t_quantile(0.5 + confidence / 2, len(values) - 1) * stdev(values) / math.sqrt(len(values))
+    return Interval(mean, mean - half_width, mean + half_width)
+
+
+def run_replica(scenario_index: int, scenario: SweepScenario, replica: int, base_seed: int,
+                duration: float, warmup: float, service_times: Dict[Classification, Any],
+                repository_factory: Callable[[], IQueueRepository]) -> ReplicaSummary:
+    '''
+    Executa uma réplica (no processo em que for chamada) e devolve só o resumo
+
+    A semente depende apenas da réplica, não do cenário: a réplica k de todos os cenários
+    vê a mesma sequência aleatória (números aleatórios comuns), o que reduz a variância
+    das comparações entre cenários (ex: 4 x 5 consultórios)
+    '''
+    config = SimulationConfig(
+        arrival_rates=scenario.arrival_rates(),
+        doctors=scenario.doctors,
+        duration=duration,
+        warmup=warmup,
+        service_times=service_times,
+        seed=base_seed + replica,
+    )
+    result = SimulationEngine(config, repository_factory()).run()
+    return ReplicaSummary(
+        scenario_index=scenario_index,
+        replica=replica,
+        mean_wait=tuple(result.waits[cls].mean for cls in COLORS),
+        p95_wait=tuple(result.waits[cls].p95 for cls in COLORS),
+        within_target=tuple(result.waits[cls].within_target for cls in COLORS),
+        utilization=result.doctor_utilization,
+        still_waiting=result.still_waiting,
+        events=result.events_processed,
+    )
+
+
+def _aggregate(scenario: SweepScenario, summaries: List[ReplicaSummary], confidence: float) -> ScenarioSummary:
+    def per_color(metric: str) -> Dict[Classification, Interval]:
+        return {
+            cls: confidence_interval([getattr(summary, metric)[position] for summary in summaries], confidence)
+            for position, cls in enumerate(COLORS)
+        }
+
+    return ScenarioSummary(
+        scenario=scenario,
+        replicas=len(summaries),
+        mean_wait=per_color("mean_wait"),
+        p95_wait=per_color("p95_wait"),
+        within_target=per_color("within_target"),
+        utilization=confidence_interval([summary.utilization for summary in summaries], confidence),
+        still_waiting=fmean(summary.still_waiting for summary in summaries),
+        events=sum(summary.events for summary in summaries),
+    )
+
+
+def run_sweep(scenarios: Sequence[SweepScenario],
+              repository_factory: Callable[[], IQueueRepository],
+              replicas: int = 20,
+              duration: float = 7 * 24 * 60.0,
+              warmup: float = 24 * 60.0,
+              service_times: Optional[Dict[Classification, Any]] = None,
+              base_seed: int = 0,
+              confidence: float = 0.95,
+              workers: Optional[int] = None,
+              events: Optional[EventSink] = None) -> List[ScenarioSummary]:
+    '''
+    Executa todas as réplicas de todos os cenários em um pool de processos e agrega os resultados
+
+    Cada réplica é uma tarefa independente (sem estado compartilhado), então a vazão
+    cresce com o número de núcleos; só os resumos compactos atravessam os processos
+
+    Args:
+        scenarios (Sequence[SweepScenario]): Cenários (ex: build_grid(...))
+        repository_factory (Callable[[], IQueueRepository]): Cria um repositório vazio por
+                                                             réplica; precisa ser serializável
+                                                             (ex: a própria classe InMemoryQueueRepository)
+        replicas (int): Réplicas por cenário
+        duration (float): Minutos simulados por réplica
+        warmup (float): Minutos iniciais descartados das estatísticas
+        service_times (Optional[Dict[Classification, Any]]): Distribuições de atendimento (padrão do motor)
+        base_seed (int): Semente base (réplica k usa base_seed + k)
+        confidence (float): Nível de confiança dos intervalos
+        workers (Optional[int]): Processos no pool (padrão: número de núcleos); 1 executa
+                                 tudo no processo atual, sem pool
+        events (Optional[EventSink]): Destino dos eventos de progresso
+
+    Returns:
+        List[ScenarioSummary]: Um resumo por cenário, na ordem recebida
+    '''
+    if replicas < 1:
+        raise ValueError("É preciso pelo menos uma réplica por cenário.")
+    events = events if events is not None else NULL_SINK
+    service_times = service_times if service_times is not None else default_service_times()
+
+    tasks = [
+        (index, scenario, replica, base_seed, duration, warmup, service_times, repository_factory)
+        for index, scenario in enumerate(scenarios)
+        for replica in range(replicas)
+    ]
+    collected: List[List[ReplicaSummary]] = [[] for _ in scenarios]
+    events.emit(EventLevel.INFO, "Varredura", "%d cenários x %d réplicas = %d simulações.", len(scenarios), replicas, len(tasks))
+
+    if workers == 1:
+        for done, task in enumerate(tasks, start=1):
+            summary = run_replica(*task)
+            collected[summary.scenario_index].append(summary)
+            events.emit(EventLevel.DEBUG, "Varredura", "%d/%d simulações concluídas.", done, len(tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_replica, *task) for task in tasks]
+            for done, future in enumerate(as_completed(futures), start=1):
+                summary = future.result()
+                collected[summary.scenario_index].append(summary)
+                events.emit(EventLevel.DEBUG, "Varredura", "%d/%d simulações concluídas.", done, len(tasks))
+
+    return [_aggregate(scenario, sorted(summaries, key=lambda s: s.replica), confidence)
+            for scenario, summaries in zip(scenarios, collected)]
+
+
+def recommend_doctors(summaries: Sequence[ScenarioSummary], required_share: float = 0.9,
+                      colors: Sequence[Classification] = COLORS) -> Dict[Tuple[float, str], Optional[int]]:
+    '''
+    Para cada (taxa de chegada, distribuição de cores), o menor número de consultórios em que
+    o limite inferior do intervalo de 'atendidos dentro do tempo-alvo' fica acima de
+    'required_share' para todas as cores de 'colors' (None se nenhum cenário da grade atinge)
+    '''
+    best: Dict[Tuple[float, str], Optional[int]] = {}
+    for summary in summaries:
+        key = (summary.scenario.arrivals_per_hour, summary.scenario.mix_name)
+        best.setdefault(key, None)
+
+        def meets(interval: Interval) -> bool:
+            # Cor sem atendimentos não tem o que cumprir; com uma única réplica não há intervalo: usa a média
+            if math.isnan(interval.mean):
+                return True
+            bound = interval.mean if math.isnan(interval.low) else interval.low
+            return bound >= required_share
+
+        if all(meets(summary.within_target[cls]) for cls in colors):
+            current = best[key]
+            if current is None or summary.scenario.doctors < current:
+                best[key] = summary.scenario.doctors
+    return best
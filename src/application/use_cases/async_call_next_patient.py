@@ -0,0 +1,58 @@
+from typing import Optional
+from src.domain.patient import Patient
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_async_queue_repository import IAsyncQueueRepository
+
+class AsyncCallNextPatientUseCase:
+    '''
+    Versão assíncrona do Caso de Uso para chamar (remover) o próximo paciente
+
+    Em vez de retornar None com as filas vazias, aguarda (sem polling)
+    até que um paciente seja cadastrado
+    '''
+    def __init__(self, queue_repo: IAsyncQueueRepository, events: Optional[EventSink] = None):
+        '''
+        Inicializa o caso de uso com suas dependências
+        
+        Args:
+            queue_repo (IAsyncQueueRepository): Uma implementação assíncrona do
+                                                repositório de filas
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
+        '''
+        if not isinstance(queue_repo, IAsyncQueueRepository):
+            raise TypeError("O repositório (queue_repo) deve implementar a interface IAsyncQueueRepository.")
+
+        self.queue_repo = queue_repo
+        self._events = events if events is not None else NULL_SINK
+        self._events.emit(EventLevel.INFO, "UseCase Init", "Caso de Uso 'AsyncCallNextPatient' pronto.")
+
+    async def execute(self, timeout: Optional[float] = None) -> Optional[Patient]:
+        '''
+        Executa o fluxo de chamada do próximo paciente, aguardando se necessário
+        
+        Args:
+            timeout (Optional[float]): Tempo máximo de espera em segundos
+                                       (None = sem limite, 0 = não espera)
+
+        Returns:
+            Optional[Patient]: O paciente chamado, ou None se o tempo acabar
+                               
+        Raises:
+            SystemError: Se ocorrer uma falha inesperada no repositório
+        '''
+        self._events.emit(EventLevel.INFO, "UseCase", "--- Iniciando Caso de Uso: Chamar Próximo Paciente (assíncrono) ---")
+
+        try:
+            patient = await self.queue_repo.get_next_patient(timeout)
+
+            if self._events.enabled_for(EventLevel.INFO):
+                if patient:
+                    self._events.emit(EventLevel.INFO, "UseCase", "Paciente '%s' encontrado e removido da fila.", patient.name)
+                else:
+                    self._events.emit(EventLevel.INFO, "UseCase", "Tempo de espera esgotado. Nenhum paciente para chamar.")
+
+            return patient
+
+        except Exception as e_repo:
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao tentar obter o próximo paciente: %s", e_repo)
+            raise SystemError("Falha ao processar a chamada do paciente.") from e_repo
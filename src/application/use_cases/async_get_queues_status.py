@@ -0,0 +1,44 @@
+from typing import Dict, Optional
+from src.domain.classification import Classification
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_async_queue_repository import IAsyncQueueRepository
+
+class AsyncGetQueuesStatusUseCases:
+    '''
+    Versão assíncrona do Caso de Uso para obter o status (tamanho) de todas as filas
+    '''
+
+    def __init__(self, queue_repo: IAsyncQueueRepository, events: Optional[EventSink] = None):
+        '''
+        Inicializa o caso de uso com suas dependências
+        
+        Args:
+            queue_repo (IAsyncQueueRepository): Uma implementação assíncrona do
+                                                repositório de filas
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
+        '''
+        if not isinstance(queue_repo, IAsyncQueueRepository):
+            raise TypeError("O repositório (queue_repo) deve implementar a interface IAsyncQueueRepository")
+
+        self.queue_repo = queue_repo
+        self._events = events if events is not None else NULL_SINK
+        self._events.emit(EventLevel.INFO, "UseCase Init", "Caso de Uso 'AsyncGetQueuesStatus' pronto.")
+
+    async def execute(self) -> Dict[Classification, int]:
+        '''
+        Executa o fluxo de obtenção do status das filas
+        
+        Returns:
+            Dict[Classification, int]: Classificação -> número de pacientes na fila
+                                       
+        Raises:
+            SystemError: Se ocorrer uma falha inesperada no repositório
+        '''
+        self._events.emit(EventLevel.INFO, "UseCase", "--- Iniciando Caso de Uso: Obter Status das Filas (assíncrono) ---")
+
+        try:
+            return await self.queue_repo.get_status()
+
+        except Exception as e_repo:
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao tentar obter o status das filas: %s", e_repo)
+            raise SystemError("Falha ao processar a solicitação de status.") from e_repo
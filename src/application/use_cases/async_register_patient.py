@@ -0,0 +1,59 @@
+from typing import Optional
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_async_queue_repository import IAsyncQueueRepository
+
+class AsyncRegisterPatientUseCase:
+    '''
+    Versão assíncrona do Caso de Uso para registrar um paciente já classificado
+
+    Cadastrar um paciente acorda no máximo um consultório que esteja
+    aguardando em AsyncCallNextPatientUseCase
+    '''
+
+    def __init__(self, queue_repo: IAsyncQueueRepository, events: Optional[EventSink] = None):
+        '''
+        Inicializa o caso de uso
+        
+        Args:
+            queue_repo (IAsyncQueueRepository): Implementação assíncrona do repositório
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
+        '''
+        if not isinstance(queue_repo, IAsyncQueueRepository):
+            raise TypeError("O repositório (queue_repo) deve implementar a interface IAsyncQueueRepository")
+
+        self.queue_repo = queue_repo
+        self._events = events if events is not None else NULL_SINK
+        self._events.emit(EventLevel.INFO, "UseCase Init", "Caso de Uso 'AsyncRegisterPatient' pronto.")
+
+    async def execute(self, patient: Patient, classification: Classification):
+        '''
+        Executa o fluxo de cadastro do paciente
+        
+        Args:
+            patient (Patient): O objeto Paciente
+            classification (Classification): A classificação final
+                                            
+        Raises:
+            ValueError: Se o paciente ou classificação forem inválidos
+            SystemError: Se o salvamento no repo falhar
+        '''
+        try:
+            # Validação
+            if not patient or not isinstance(patient, Patient):
+                raise ValueError("Objeto 'Patient' inválido.")
+            if not classification or not isinstance(classification, Classification):
+                raise ValueError("Objeto 'Classification' inválido.")
+
+            if self._events.enabled_for(EventLevel.INFO):
+                self._events.emit(EventLevel.INFO, "UseCase", "--- Iniciando Caso de Uso: Registrar Paciente '%s' ---", patient.name)
+
+            await self.queue_repo.add_patient(patient, classification)
+            self._events.emit(EventLevel.INFO, "UseCase", "Paciente adicionado à fila com sucesso.")
+
+        except (KeyError, ValueError) as e_repo:
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao adicionar paciente ao repositório: %s", e_repo)
+            raise SystemError("Falha ao salvar paciente na fila.") from e_repo
+
+        return True
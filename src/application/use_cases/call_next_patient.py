@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 from src.domain.patient import Patient
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
 from src.application.interfaces.i_queue_repository import IQueueRepository
 
 class CallNextPatientUseCase:
@@ -9,19 +10,21 @@ class CallNextPatientUseCase:
     Orquestra a obtenção do paciente da fila de maior prioridade
     disponível através do repositório
     '''
-    def __init__(self, queue_repo: IQueueRepository):
+    def __init__(self, queue_repo: IQueueRepository, events: Optional[EventSink] = None):
         '''
         Inicializa o caso de uso com suas dependências
         
         Args:
             queue_repo (IQueueRepository): Uma implementação do repositório 
                                            de filas
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
         '''
         if not isinstance(queue_repo, IQueueRepository):
             raise TypeError("O repositório (queue_repo) deve implementar a interface IQueueRepository.")
         
         self.queue_repo = queue_repo
-        print("[UseCase Init] Caso de Uso 'CallNextPatient' pronto.")
+        self._events = events if events is not None else NULL_SINK
+        self._events.emit(EventLevel.INFO, "UseCase Init", "Caso de Uso 'CallNextPatient' pronto.")
         
     def execute(self) -> Optional[Patient]:
         '''
@@ -38,18 +41,53 @@ class CallNextPatientUseCase:
         Raises:
             SystemError: Se ocorrer uma falha inesperada no repositório
         '''
-        print("\n--- Iniciando Caso de Uso: Chamar Próximo Paciente ---")
+        self._events.emit(EventLevel.INFO, "UseCase", "--- Iniciando Caso de Uso: Chamar Próximo Paciente ---")
         
         try:
             patient = self.queue_repo.get_next_patient()
             
-            if patient:
-                print(f"[UseCase] Paciente '{patient.name}' encontrado e removido da fila.")
-            else:
-                print("[UseCase] Todas as filas estão vazias. Nenhum paciente para chamar.")
+            if self._events.enabled_for(EventLevel.INFO):
+                if patient:
+                    self._events.emit(EventLevel.INFO, "UseCase", "Paciente '%s' encontrado e removido da fila.", patient.name)
+                else:
+                    self._events.emit(EventLevel.INFO, "UseCase", "Todas as filas estão vazias. Nenhum paciente para chamar.")
                 
             return patient
         
         except Exception as e_repo:
-            print(f"[UseCase] Erro ao tentar obter o próximo paciente: {e_repo}")
-            raise SystemError("Falha ao processar a chamada do paciente.") from e_repo
\ No newline at end of file
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao tentar obter o próximo paciente: %s", e_repo)
+            raise SystemError("Falha ao processar a chamada do paciente.") from e_repo
+
+    def execute_batch(self, count: int) -> List[Patient]:
+        '''
+        Executa o fluxo de chamada para até 'count' pacientes de uma vez
+
+        A ordem dos pacientes retornados é a mesma de 'count' execuções
+        seguidas de execute()
+
+        Args:
+            count (int): Quantidade máxima de pacientes a chamar
+
+        Returns:
+            List[Patient]: Os pacientes chamados (vazia se todas as filas
+                           estiverem vazias)
+
+        Raises:
+            ValueError: Se 'count' não for um inteiro não negativo
+            SystemError: Se ocorrer uma falha inesperada no repositório
+        '''
+        if not isinstance(count, int) or count < 0:
+            raise ValueError("A quantidade de pacientes deve ser um inteiro não negativo.")
+
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "UseCase", "--- Iniciando Caso de Uso: Chamar Lote de até %d Pacientes ---", count)
+
+        try:
+            patients = self.queue_repo.get_next_patients(count)
+            if self._events.enabled_for(EventLevel.INFO):
+                self._events.emit(EventLevel.INFO, "UseCase", "%d pacientes encontrados e removidos das filas.", len(patients))
+            return patients
+
+        except Exception as e_repo:
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao tentar obter o lote de pacientes: %s", e_repo)
+            raise SystemError("Falha ao processar a chamada do lote de pacientes.") from e_repo
@@ -0,0 +1,86 @@
+import dataclasses
+from typing import Any, Dict, Optional
+from src.domain.queue_position import QueuePosition
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_positioned_queue_repository import IPositionedQueueRepository
+
+class GetPatientPositionUseCase:
+    '''
+    Caso de Uso para informar a posição de um paciente na espera
+    ("quantas pessoas estão na frente do paciente X?")
+
+    Opcionalmente estima a espera em minutos a partir de um tempo médio de
+    atendimento por paciente e do número de consultórios em funcionamento
+    '''
+
+    def __init__(self, queue_repo: IPositionedQueueRepository, minutes_per_patient: Optional[float] = None,
+                 doctors: int = 1, events: Optional[EventSink] = None):
+        '''
+        Inicializa o caso de uso com suas dependências
+        
+        Args:
+            queue_repo (IPositionedQueueRepository): Um repositório de filas que informa posições
+            minutes_per_patient (Optional[float]): Tempo médio de atendimento; sem ele,
+                                                   a espera não é estimada
+            doctors (int): Número de consultórios atendendo em paralelo
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
+        '''
+        if not isinstance(queue_repo, IPositionedQueueRepository):
+            raise TypeError("O repositório (queue_repo) deve implementar a interface IPositionedQueueRepository")
+        if doctors < 1:
+            raise ValueError("É preciso pelo menos um consultório.")
+
+        self.queue_repo = queue_repo
+        self.minutes_per_patient = minutes_per_patient
+        self.doctors = doctors
+        self._events = events if events is not None else NULL_SINK
+        self._events.emit(EventLevel.INFO, "UseCase Init", "Caso de Uso 'GetPatientPosition' pronto.")
+
+    def _with_estimate(self, position: QueuePosition) -> QueuePosition:
+        # Quem está à frente é dividido entre os consultórios
+        if self.minutes_per_patient is None:
+            return position
+        estimated_wait = position.ahead_overall * self.minutes_per_patient / self.doctors
+        return dataclasses.replace(position, estimated_wait=estimated_wait)
+
+    def execute(self, patient_id: Any) -> Optional[QueuePosition]:
+        '''
+        Executa a consulta de posição de um paciente
+        
+        Args:
+            patient_id (Any): O id do paciente (Patient.id)
+
+        Returns:
+            Optional[QueuePosition]: A posição (com a espera estimada, se configurada),
+                                     ou None se o paciente não estiver esperando
+                                       
+        Raises:
+            SystemError: Se o repositório falhar
+        '''
+        try:
+            position = self.queue_repo.get_position(patient_id)
+        except Exception as e_repo:
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao consultar a posição do paciente: %s", e_repo)
+            raise SystemError("Falha ao consultar a posição do paciente.") from e_repo
+
+        if position is None:
+            self._events.emit(EventLevel.INFO, "UseCase", "Paciente '%s' não está esperando.", patient_id)
+            return None
+        return self._with_estimate(position)
+
+    def execute_all(self) -> Dict[Any, QueuePosition]:
+        '''
+        Consulta a posição de todos os pacientes em espera de uma vez (ex: painel da sala de espera)
+
+        Returns:
+            Dict[Any, QueuePosition]: id do paciente -> posição
+        '''
+        try:
+            positions = self.queue_repo.get_positions()
+        except Exception as e_repo:
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao consultar as posições: %s", e_repo)
+            raise SystemError("Falha ao consultar as posições dos pacientes.") from e_repo
+
+        if self.minutes_per_patient is None:
+            return positions
+        return {patient_id: self._with_estimate(position) for patient_id, position in positions.items()}
@@ -1,6 +1,9 @@
-from typing import Dict
+from typing import Callable, Dict, Optional
 from src.domain.classification import Classification
+from src.domain.status_snapshot import StatusDelta, StatusSnapshot
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
 from src.application.interfaces.i_queue_repository import IQueueRepository
+from src.application.interfaces.i_versioned_status_repository import IVersionedStatusRepository
 
 class GetQueuesStatusUseCases:
     '''
@@ -9,19 +12,21 @@ class GetQueuesStatusUseCases:
     Busca no repositório a contagem de pacientes em cada fila
     '''
 
-    def __init__(self, queue_repo: IQueueRepository):
+    def __init__(self, queue_repo: IQueueRepository, events: Optional[EventSink] = None):
         '''
         Inicializa o caso de uso com suas dependências
         
         Args:
             queue_repo (IQueueRepository): Uma implementação do repositório 
                                            de filas
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
         '''
         if not isinstance(queue_repo, IQueueRepository):
             raise TypeError("O repositório (queue_repo) deve implementar a interface IQueueRepository")
             
         self.queue_repo = queue_repo
-        print("[UseCase Init] Caso de Uso 'GetQueuesStatus' pronto.")
+        self._events = events if events is not None else NULL_SINK
+        self._events.emit(EventLevel.INFO, "UseCase Init", "Caso de Uso 'GetQueuesStatus' pronto.")
 
     def execute(self) -> Dict[Classification, int]:
         '''
@@ -35,18 +40,64 @@ class GetQueuesStatusUseCases:
         Raises:
             SystemError: Se ocorrer uma falha inesperada no repositório
         '''
-        print("\n--- Iniciando Caso de Uso: Obter Status das Filas ---")
+        self._events.emit(EventLevel.INFO, "UseCase", "--- Iniciando Caso de Uso: Obter Status das Filas ---")
         
         try:
             # 1. Pedir ao Repositório (via Interface)
             status_dict = self.queue_repo.get_status()
             
-            print("[UseCase] Status das filas obtido com sucesso.")
+            self._events.emit(EventLevel.INFO, "UseCase", "Status das filas obtido com sucesso.")
             
             # 2. Retornar para a Camada de Apresentação
             return status_dict
 
         except Exception as e_repo:
             # Captura qualquer erro inesperado vindo do repositório
-            print(f"[UseCase] Erro ao tentar obter o status das filas: {e_repo}")
-            raise SystemError("Falha ao processar a solicitação de status.") from e_repo
\ No newline at end of file
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao tentar obter o status das filas: %s", e_repo)
+            raise SystemError("Falha ao processar a solicitação de status.") from e_repo
+
+    @property
+    def supports_versions(self) -> bool:
+        # True se o repositório tem status versionado (execute_if_changed e subscribe)
+        return isinstance(self.queue_repo, IVersionedStatusRepository)
+
+    def _require_versions(self):
+        if not self.supports_versions:
+            raise TypeError(f"{type(self.queue_repo).__name__} não implementa IVersionedStatusRepository.")
+
+    def execute_if_changed(self, since_version: int) -> Optional[StatusSnapshot]:
+        '''
+        Obtém o status só se as filas mudaram desde 'since_version'
+
+        Pensado para painéis que atualizam com alta frequência: enquanto nada
+        muda, a resposta é None e não há nada para redesenhar
+
+        Args:
+            since_version (int): Última versão exibida (-1 na primeira consulta)
+
+        Returns:
+            Optional[StatusSnapshot]: O status com a sua versão, ou None se nada mudou
+
+        Raises:
+            TypeError: Se o repositório não tiver status versionado (ver supports_versions)
+            SystemError: Se o repositório falhar
+        '''
+        self._require_versions()
+        try:
+            return self.queue_repo.get_status_if_changed(since_version)
+        except Exception as e_repo:
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao tentar obter o status versionado das filas: %s", e_repo)
+            raise SystemError("Falha ao processar a solicitação de status.") from e_repo
+
+    def subscribe(self, callback: Callable[[StatusDelta], None]) -> Callable[[], None]:
+        '''
+        Assina as alterações das filas (ver IVersionedStatusRepository.subscribe_status)
+
+        Returns:
+            Callable[[], None]: Função que cancela a assinatura
+
+        Raises:
+            TypeError: Se o repositório não tiver status versionado (ver supports_versions)
+        '''
+        self._require_versions()
+        return self.queue_repo.subscribe_status(callback)
@@ -1,10 +1,9 @@
+from typing import Iterable, Optional, Tuple
 from src.domain.patient import Patient
 from src.domain.classification import Classification
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
 from src.application.interfaces.i_queue_repository import IQueueRepository
 
-from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
-from src.infrastructure.triage_builder import montar_arvore
-
 class RegisterPatientUseCase:
     '''
     Caso de Uso para registrar um paciente já classificado
@@ -13,18 +12,20 @@ class RegisterPatientUseCase:
     repositório na fila correta
     '''
 
-    def __init__(self, queue_repo: IQueueRepository):
+    def __init__(self, queue_repo: IQueueRepository, events: Optional[EventSink] = None):
         '''
         Inicializa o caso de uso
         
         Args:
             queue_repo (IQueueRepository): Implementação do repositório
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
         '''
         if not isinstance(queue_repo, IQueueRepository):
             raise TypeError("O repositório (queue_repo) deve implementar a interface IQueueRepository")
             
         self.queue_repo = queue_repo
-        print("[UseCase Init] Caso de Uso 'RegisterPatient' pronto (simplificado).")
+        self._events = events if events is not None else NULL_SINK
+        self._events.emit(EventLevel.INFO, "UseCase Init", "Caso de Uso 'RegisterPatient' pronto (simplificado).")
 
     def execute(self, patient: Patient, classification: Classification):
         '''
@@ -38,8 +39,6 @@ class RegisterPatientUseCase:
             ValueError: Se o paciente ou classificação forem inválidos
             SystemError: Se o salvamento no repo falhar
         '''
-        print(f"\n--- Iniciando Caso de Uso: Registrar Paciente '{patient.name}' ---")
-        
         try:
             # Validação
             if not patient or not isinstance(patient, Patient):
@@ -47,13 +46,60 @@ class RegisterPatientUseCase:
             if not classification or not isinstance(classification, Classification):
                 raise ValueError("Objeto 'Classification' inválido.")
 
+            if self._events.enabled_for(EventLevel.INFO):
+                self._events.emit(EventLevel.INFO, "UseCase", "--- Iniciando Caso de Uso: Registrar Paciente '%s' ---", patient.name)
+
             # Adicionar à Fila (Infraestrutura via Interface)
             self.queue_repo.add_patient(patient, classification)
-            print("[UseCase] Paciente adicionado à fila com sucesso.")
+            self._events.emit(EventLevel.INFO, "UseCase", "Paciente adicionado à fila com sucesso.")
             
         except (KeyError, ValueError) as e_repo:
-            print(f"[UseCase] Erro ao adicionar paciente ao repositório: {e_repo}")
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao adicionar paciente ao repositório: %s", e_repo)
             raise SystemError("Falha ao salvar paciente na fila.") from e_repo
         
         # Retorna True em sucesso (ou nada)
-        return True
\ No newline at end of file
+        return True
+
+    def execute_batch(self, entries: Iterable[Tuple[Patient, Classification]]) -> int:
+        '''
+        Executa o fluxo de cadastro para um lote de pacientes já classificados
+
+        Todo o lote é validado antes de qualquer inserção: se um item for
+        inválido, nenhum paciente é adicionado. Depois o lote é entregue ao
+        repositório em uma única chamada. Como em execute, os erros de validação
+        e do repositório chegam como SystemError (a causa fica em __cause__)
+
+        Args:
+            entries (Iterable[Tuple[Patient, Classification]]): Pares (paciente, classificação)
+
+        Returns:
+            int: Quantidade de pacientes cadastrados
+
+        Raises:
+            SystemError: Se algum item do lote for inválido (não for um par, ou o paciente
+                ou a classificação forem inválidos) ou se o salvamento no repo falhar
+        '''
+        try:
+            entries = list(entries)
+            if self._events.enabled_for(EventLevel.INFO):
+                self._events.emit(EventLevel.INFO, "UseCase", "--- Iniciando Caso de Uso: Registrar Lote de %d Pacientes ---", len(entries))
+
+            # Validação (uma vez para o lote todo)
+            for entry in entries:
+                try:
+                    patient, classification = entry
+                except (TypeError, ValueError):
+                    raise ValueError(f"Item do lote inválido: {entry!r} (esperado um par paciente, classificação).") from None
+                if not patient or not isinstance(patient, Patient):
+                    raise ValueError("Objeto 'Patient' inválido.")
+                if not classification or not isinstance(classification, Classification):
+                    raise ValueError("Objeto 'Classification' inválido.")
+
+            self.queue_repo.add_patients(entries)
+            self._events.emit(EventLevel.INFO, "UseCase", "Lote de pacientes adicionado às filas com sucesso.")
+
+        except (KeyError, ValueError) as e_repo:
+            self._events.emit(EventLevel.ERROR, "UseCase", "Erro ao adicionar lote de pacientes ao repositório: %s", e_repo)
+            raise SystemError("Falha ao salvar lote de pacientes nas filas.") from e_repo
+
+        return len(entries)
@@ -0,0 +1,99 @@
+from bisect import bisect_left, insort
+from typing import Iterable, List
+
+# Abaixo deste tamanho o prefixo já consumido das listas não é descartado
+_MIN_COMPACT = 1024
+
+class ArrivalIndex:
+    '''
+    Estrutura de estatística de ordem para uma fila: responde "quantos pacientes
+    estão à frente do número de chegada X?" em O(log n)
+
+    Guarda os números de chegada da fila em uma lista ordenada com um ponteiro para
+    o início (desenfileirar só avança o ponteiro, O(1)). Remoções do meio da fila não
+    mexem na lista: o número vira um "buraco" em uma segunda lista ordenada. A posição
+    é então (números antes de X) - (buracos antes de X), com duas buscas binárias
+
+    Invariante: o número apontado pelo início é sempre de um paciente ainda na fila.
+    O prefixo já consumido das listas é descartado quando passa da metade delas
+    '''
+    __slots__ = ("_order", "_start", "_holes", "_holes_start")
+
+    def __init__(self):
+        self._order: List[int] = []
+        self._start = 0
+        self._holes: List[int] = []
+        self._holes_start = 0
+
+    def append(self, arrival: int):
+        # Novo número no fim da fila (deve ser maior que todos os atuais)
+        self._order.append(arrival)
+
+    def extend(self, arrivals: Iterable[int]):
+        # Vários números no fim da fila, em ordem crescente
+        self._order.extend(arrivals)
+
+    def insert(self, arrival: int):
+        '''
+        Insere um número fora de ordem (paciente reclassificado que mantém a sua chegada,
+        ou devolvido ao início da fila)
+
+        O(1) quando o número vai para o início e há espaço já consumido antes dele;
+        senão O(n) no pior caso pelo deslocamento da lista, feito em C
+        '''
+        holes = self._holes
+        index = bisect_left(holes, arrival, self._holes_start)
+        if index < len(holes) and holes[index] == arrival:
+            # O paciente voltou para uma fila da qual tinha saído: o buraco volta a ser ocupado
+            del holes[index]
+            return
+        order, start = self._order, self._start
+        if start and (start == len(order) or arrival < order[start]):
+            # Reaproveita a posição consumida logo antes do início
+            self._start = start - 1
+            order[self._start] = arrival
+            return
+        insort(order, arrival, start)
+
+    def pop_front(self):
+        # O paciente do início saiu da fila
+        self._start += 1
+        self._skip_holes()
+
+    def pop_front_many(self, count: int):
+        for _ in range(count):
+            self._start += 1
+            self._skip_holes()
+
+    def discard(self, arrival: int):
+        # O paciente com esse número saiu do meio (ou do início) da fila
+        if self._start < len(self._order) and self._order[self._start] == arrival:
+            self.pop_front()
+        else:
+            insort(self._holes, arrival, self._holes_start)
+
+    def rank(self, arrival: int) -> int:
+        '''
+        Retorna quantos pacientes ainda na fila chegaram antes de 'arrival'
+        '''
+        before = bisect_left(self._order, arrival, self._start) - self._start
+        holes_before = bisect_left(self._holes, arrival, self._holes_start) - self._holes_start
+        return before - holes_before
+
+    def _skip_holes(self):
+        # Avança o início sobre os buracos, mantendo a invariante, e descarta o prefixo consumido
+        order, holes = self._order, self._holes
+        while (self._holes_start < len(holes) and self._start < len(order)
+               and order[self._start] == holes[self._holes_start]):
+            self._start += 1
+            self._holes_start += 1
+
+        if self._start > _MIN_COMPACT and self._start * 2 > len(order):
+            del order[:self._start]
+            self._start = 0
+        if self._holes_start > _MIN_COMPACT and self._holes_start * 2 > len(holes):
+            del holes[:self._holes_start]
+            self._holes_start = 0
+
+    def __len__(self) -> int:
+        return (len(self._order) - self._start) - (len(self._holes) - self._holes_start)
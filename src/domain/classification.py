@@ -4,24 +4,27 @@ class Classification(enum.Enum):
     '''
     Aqui eu defino as classificações de urgência do Protocolo de Manchester
 
-    Cada membro possui três valores:
+    Cada membro possui cinco valores:
     1. A cor (representada por emoji)
     2. O nome da classificação
     3. Nível de prioridade, onde 0 é o mais urgente (vou usar números pra conseguir manipular melhor a urgência de cada paciente)
+    4. A cor hexadecimal (usada na interface gráfica)
+    5. O tempo-alvo máximo de espera do protocolo, em minutos
     '''
 
-    RED    = ("🟥", "Emergência (atendimento imediato)", 0, "#E53E3E")
-    ORANGE = ("🟧", "Muito urgente", 1, "#DD6B20")
-    YELLOW = ("🟨", "Urgente", 2, "#D69E2E")
-    GREEN  = ("🟩", "Pouco urgente", 3, "#38A169")
-    BLUE   = ("🟦", "Não urgente", 4, "#3182CE")
+    RED    = ("🟥", "Emergência (atendimento imediato)", 0, "#E53E3E", 0)
+    ORANGE = ("🟧", "Muito urgente", 1, "#DD6B20", 10)
+    YELLOW = ("🟨", "Urgente", 2, "#D69E2E", 60)
+    GREEN  = ("🟩", "Pouco urgente", 3, "#38A169", 120)
+    BLUE   = ("🟦", "Não urgente", 4, "#3182CE", 240)
 
-    def __init__(self, color_emoji, description, priority_level, hex_color):
+    def __init__(self, color_emoji, description, priority_level, hex_color, target_wait_minutes):
         # Inicializador customizado para os membros da Enum
         self._color_emoji = color_emoji
         self._description = description
         self._priority_level = priority_level
         self._hex_color = hex_color
+        self._target_wait_minutes = target_wait_minutes
 
     @property
     def color(self):
@@ -42,6 +45,11 @@ class Classification(enum.Enum):
     def hex_color(self):
         # Retorna a cor hexadecimal
         return self._hex_color
+
+    @property
+    def target_wait(self):
+        # Retorna o tempo-alvo máximo de espera em minutos (0 = atendimento imediato)
+        return self._target_wait_minutes
     
     @classmethod
     def get_by_priority(cls, level: int):
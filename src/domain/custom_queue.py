@@ -1,5 +1,7 @@
-from collections import deque
-from typing import Any, Optional
+import itertools
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, Optional
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
 
 class EmptyQueueError(Exception):
     # Exceção customizada para fila vazia
@@ -10,12 +12,29 @@ class EmptyQueueError(Exception):
 class Fila:
     '''
     Aqui vou implementar uma estrutura de dados de Fila (FIFO: First-In, First-Out) utilizando
-    collections.deque para operações otimizadas 0(1).
+    um OrderedDict indexado pelo id de cada item (ex: Patient.id). Além de enfileirar e
+    desenfileirar em O(1), isso permite encontrar e remover um item do meio da fila em O(1)
+
+    Itens sem atributo 'id' recebem uma chave interna (e só saem pela ordem da fila)
+
+    Os eventos de enfileirar/desenfileirar vão para o EventSink injetado;
+    sem sink, nada é formatado nem impresso
     '''
 
-    def __init__(self):
-        # Inicializa a fila interna como um deque vazio
-        self._queue = deque()
+    def __init__(self, events: Optional[EventSink] = None):
+        # Inicializa a fila interna vazia (id do item -> item, na ordem de chegada)
+        self._queue: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._anonymous_keys = itertools.count()
+        self._events = events if events is not None else NULL_SINK
+
+    def _key_of(self, item: Any) -> Hashable:
+        # Chave do item no índice: o seu id, ou uma chave interna se ele não tiver um
+        item_id = getattr(item, "id", None)
+        if item_id is None:
+            return (Fila, next(self._anonymous_keys))
+        if item_id in self._queue:
+            raise ValueError(f"Já existe um item com id '{item_id}' na fila.")
+        return item_id
 
     def enqueue(self, item: Any):
         '''
@@ -27,8 +46,32 @@ class Fila:
         if item is None:
             raise ValueError("Não é possível adicionar um item 'None'.")
         
-        self._queue.append(item)
-        print(f"[Fila] Item '{item}' enfileirado.")
+        self._queue[self._key_of(item)] = item
+        if self._events.enabled_for(EventLevel.DEBUG):
+            self._events.emit(EventLevel.DEBUG, "Fila", "Item '%s' enfileirado.", item)
+
+    def enqueue_many(self, items: Iterable[Any]):
+        '''
+        Adiciona vários itens ao final da fila, mantendo a ordem recebida
+
+        A validação é feita antes de inserir: se algum item for None ou tiver
+        um id repetido, nenhum item é adicionado
+
+        Args:
+            items (Iterable[Any]): Os itens a serem adicionados
+        '''
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("Não é possível adicionar um item 'None'.")
+        keys = [getattr(item, "id", None) for item in items]
+        if None in keys:
+            keys = [(Fila, next(self._anonymous_keys)) if key is None else key for key in keys]
+        if len(set(keys)) != len(keys) or not self._queue.keys().isdisjoint(keys):
+            raise ValueError("Há itens com id repetido no lote ou já presentes na fila.")
+
+        self._queue.update(zip(keys, items))
+        if self._events.enabled_for(EventLevel.DEBUG):
+            self._events.emit(EventLevel.DEBUG, "Fila", "%d itens enfileirados.", len(items))
 
     def dequeue(self) -> Optional[Any]:
         '''
@@ -41,12 +84,104 @@ class Fila:
             EmptyQueueError: Se a fila estiver vazia
         '''
         try:
-            item = self._queue.popleft()
-            print(f"[Fila] Item '{item}' desenfileirado.")
-            return item
-        except IndexError:
+            _, item = self._queue.popitem(last=False)
+        except KeyError:
             raise EmptyQueueError()
+
+        if self._events.enabled_for(EventLevel.DEBUG):
+            self._events.emit(EventLevel.DEBUG, "Fila", "Item '%s' desenfileirado.", item)
+        return item
+
+    def dequeue_many(self, count: int) -> List[Any]:
+        '''
+        Remove e retorna até 'count' itens do início da fila
+
+        Args:
+            count (int): Quantidade máxima de itens a remover
+
+        Returns:
+            List[Any]: Os itens removidos, na ordem de saída (pode ter
+                       menos que 'count' itens se a fila acabar)
+        '''
+        popitem = self._queue.popitem
+        items = [popitem(last=False)[1] for _ in range(min(count, len(self._queue)))]
+        if self._events.enabled_for(EventLevel.DEBUG):
+            self._events.emit(EventLevel.DEBUG, "Fila", "%d itens desenfileirados.", len(items))
+        return items
+
+    def insert_ordered(self, item: Any, sort_key: Callable[[Any], Any], from_front: bool = False):
+        '''
+        Insere um item na posição que mantém a fila ordenada por 'sort_key'
+
+        Supõe que a fila já está ordenada por 'sort_key' e procura a posição a partir
+        do fim: o custo é O(k), onde k é o número de itens que ficam depois do novo
+        (O(1) quando ele é o mais recente). Com 'from_front' a busca começa pelo
+        início e o custo é o número de itens que ficam antes dele (O(1) quando ele
+        volta para o início da fila)
+
+        Args:
+            item (Any): O item a ser inserido
+            sort_key (Callable[[Any], Any]): Função que dá a chave de ordenação de um item
+            from_front (bool): Procura a posição a partir do início da fila
+        '''
+        if item is None:
+            raise ValueError("Não é possível adicionar um item 'None'.")
+
+        key = self._key_of(item)
+        target = sort_key(item)
+        if from_front:
+            earlier = []
+            for other_key in self._queue:
+                if sort_key(self._queue[other_key]) >= target:
+                    break
+                earlier.append(other_key)
+
+            self._queue[key] = item
+            self._queue.move_to_end(key, last=False)
+            for other_key in reversed(earlier):
+                self._queue.move_to_end(other_key, last=False)
+            return
+
+        later = []
+        for other_key in reversed(self._queue):
+            if sort_key(self._queue[other_key]) <= target:
+                break
+            later.append(other_key)
+
+        self._queue[key] = item
+        for other_key in reversed(later):
+            self._queue.move_to_end(other_key)
+
+    def find(self, item_id: Hashable) -> Optional[Any]:
+        '''
+        Retorna o item com o id informado, ou None se ele não estiver na fila (O(1))
+        '''
+        return self._queue.get(item_id)
+
+    def remove(self, item_id: Hashable) -> Any:
+        '''
+        Remove e retorna o item com o id informado, de qualquer posição da fila (O(1))
+
+        Raises:
+            KeyError: Se não houver item com esse id na fila
+        '''
+        try:
+            item = self._queue.pop(item_id)
+        except KeyError:
+            raise KeyError(f"Nenhum item com id '{item_id}' na fila.")
+
+        if self._events.enabled_for(EventLevel.DEBUG):
+            self._events.emit(EventLevel.DEBUG, "Fila", "Item '%s' removido do meio da fila.", item)
+        return item
         
+    def __iter__(self) -> Iterator[Any]:
+        # Percorre os itens do início ao fim da fila, sem removê-los
+        return iter(self._queue.values())
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        # Permite usar 'item_id in fila'
+        return item_id in self._queue
+
     def is_empty(self) -> bool:
         # Verifica se a fila está vazia
         return len(self._queue) == 0
@@ -61,4 +196,4 @@ class Fila:
     
     def __str__(self) -> str:
         # Retorna uma representação em string da fila
-        return f"Fila (Início -> Fim): {list(self._queue)}"
\ No newline at end of file
+        return f"Fila (Início -> Fim): {list(self._queue.values())}"
\ No newline at end of file
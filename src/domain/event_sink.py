@@ -0,0 +1,97 @@
+import enum
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Tuple
+
+
+class EventLevel(enum.IntEnum):
+    '''
+    Níveis dos eventos emitidos pelo sistema (do mais detalhado ao mais grave)
+    '''
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    OFF = 100
+
+
+class Event:
+    '''
+    Representa um evento estruturado (ex: paciente enfileirado, fila vazia)
+
+    A mensagem só é formatada quando alguém a lê (formatação preguiçosa),
+    então guardar o evento em memória custa apenas a tupla de argumentos
+    '''
+    __slots__ = ("timestamp", "level", "source", "template", "args")
+
+    def __init__(self, level: EventLevel, source: str, template: str, args: Tuple[Any, ...]):
+        self.timestamp = time.time()
+        self.level = level
+        self.source = source
+        self.template = template
+        self.args = args
+
+    @property
+    def message(self) -> str:
+        # Formata a mensagem somente quando ela é necessária
+        return self.template % self.args if self.args else self.template
+
+    def __str__(self) -> str:
+        return f"[{self.source}] {self.message}"
+
+
+class EventSink(ABC):
+    '''
+    Destino dos eventos do domínio, repositórios e casos de uso
+
+    As classes que emitem eventos recebem um EventSink por injeção de dependência.
+    No caminho crítico elas verificam 'enabled_for(level)' antes de montar qualquer
+    argumento, então um sink desligado custa apenas uma comparação de inteiros
+
+    Subclasses implementam 'write(event)' para decidir para onde o evento vai
+    (console, arquivo, memória...)
+    '''
+
+    def __init__(self, level: EventLevel = EventLevel.INFO):
+        self.level = level
+
+    def enabled_for(self, level: EventLevel) -> bool:
+        # Verifica se eventos deste nível serão registrados
+        return level >= self.level
+
+    def emit(self, level: EventLevel, source: str, template: str, *args: Any):
+        '''
+        Registra um evento se o nível estiver habilitado
+
+        Args:
+            level (EventLevel): O nível do evento
+            source (str): Quem emitiu o evento (ex: "Fila", "Repo", "UseCase")
+            template (str): Mensagem no formato '%' (ex: "Paciente '%s' chamado.")
+            *args (Any): Argumentos da mensagem, formatados apenas na leitura
+        '''
+        if level >= self.level:
+            self.write(Event(level, source, template, args))
+
+    @abstractmethod
+    def write(self, event: Event):
+        # Entrega o evento ao destino concreto
+        pass
+
+    def close(self):
+        # Libera recursos do destino (arquivos, por exemplo)
+        pass
+
+
+class NullEventSink(EventSink):
+    '''
+    Sink desligado: descarta tudo. É o padrão quando nenhum sink é injetado
+    '''
+
+    def __init__(self):
+        super().__init__(EventLevel.OFF)
+
+    def write(self, event: Event):
+        pass
+
+
+NULL_SINK = NullEventSink()
@@ -1,24 +1,126 @@
 import uuid
+import random
+import itertools
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Self
+from typing import Any, Callable
 
-@dataclass
+# Estratégias de geração de id
+# Cada estratégia é uma função sem argumentos que retorna um novo id a cada chamada
+
+def uuid4_ids() -> Callable[[], uuid.UUID]:
+    # Estratégia original: UUID aleatório (lê os.urandom a cada paciente)
+    return uuid.uuid4
+
+def counter_ids(start: int = 1) -> Callable[[], int]:
+    # Contador inteiro monotônico: o id mais barato, único dentro do processo
+    # (repositórios duráveis chamam skip_used_ids ao restaurar pacientes de outra execução)
+    return itertools.count(start).__next__
+
+def uuid7_ids() -> Callable[[], uuid.UUID]:
+    '''
+    UUID ordenado pelo tempo no formato da versão 7 (RFC 9562)
+
+    48 bits de timestamp em milissegundos + 12 bits de contador (monotônico dentro
+    do mesmo milissegundo) + 62 bits aleatórios. Os aleatórios vêm de um gerador
+    semeado uma única vez, então não há leitura de os.urandom por paciente
+    '''
+    rng = random.Random()
+    lock = threading.Lock()
+    state = {"ms": -1, "counter": 0}
+
+    def next_id() -> uuid.UUID:
+        with lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > state["ms"]:
+                state["ms"] = now_ms
+                state["counter"] = rng.getrandbits(11)
+            else:
+                # Mesmo milissegundo (ou relógio voltou): incrementa o contador
+                state["counter"] += 1
+                if state["counter"] > 0xFFF:
+                    state["ms"] += 1
+                    state["counter"] = 0
+            value = (state["ms"] & 0xFFFFFFFFFFFF) << 80
+            value |= 0x7 << 76
+            value |= state["counter"] << 64
+            value |= 0b10 << 62
+            value |= rng.getrandbits(62)
+        return uuid.UUID(int=value)
+
+    return next_id
+
+
+_id_factory: Callable[[], Any] = uuid4_ids()
+
+# Maior id inteiro já restaurado neste processo (ver skip_used_ids); vale também para
+# contadores instalados depois da restauração
+_max_used_id = 0
+
+def _skip_counter(factory: Callable[[], Any]) -> Callable[[], Any]:
+    # Se 'factory' for um contador (counter_ids), retorna um que começa depois de _max_used_id
+    counter = getattr(factory, "__self__", None)
+    if isinstance(counter, itertools.count):
+        # itertools.count não permite consultar o próximo valor sem consumi-lo: consome e recria
+        return itertools.count(max(next(counter), _max_used_id + 1)).__next__
+    return factory
+
+def set_id_strategy(factory: Callable[[], Any]):
+    '''
+    Define como os ids dos novos pacientes são gerados
+
+    Um contador instalado aqui já pula os ids restaurados antes (ver skip_used_ids)
+
+    Args:
+        factory (Callable[[], Any]): ex: counter_ids(), uuid7_ids() ou uuid4_ids() (padrão)
+    '''
+    global _id_factory
+    if not callable(factory):
+        raise TypeError("A estratégia de id deve ser uma função sem argumentos.")
+    _id_factory = _skip_counter(factory)
+
+def get_id_strategy() -> Callable[[], Any]:
+    # Retorna a estratégia de id em uso
+    return _id_factory
+
+def skip_used_ids(max_used_id: int):
+    '''
+    Garante que a estratégia de contador em uso não gere mais ids <= max_used_id
+
+    O contador recomeça em 1 a cada processo; repositórios que restauram pacientes
+    com os ids de uma execução anterior (journal, banco) chamam esta função com o
+    maior id inteiro restaurado. O valor fica guardado, então um contador instalado
+    depois por set_id_strategy também o respeita. As estratégias UUID não são afetadas
+    '''
+    global _id_factory, _max_used_id
+    _max_used_id = max(_max_used_id, max_used_id)
+    _id_factory = _skip_counter(_id_factory)
+
+def _new_patient_id() -> Any:
+    return _id_factory()
+
+
+@dataclass(slots=True)
 class Patient:
     '''
     Representa um paciente no sistema de triagem.
 
     Utiliza o @dataclass para gerar automaticamente métodos como:
     __init__(), __repr__(), e __eq__()
+
+    slots=True troca o __dict__ de cada instância por campos fixos,
+    reduzindo a memória por paciente
     '''
 
     # Aqui temos um atributo público, pois dataclasses são usadas para guardar dados
     name: str
 
     # field -> permite customizar atributos
-    # default_factory -> chama uma função (uuid.uuid4) para criar um valor padrão
+    # default_factory -> chama a estratégia de id atual (ver set_id_strategy) para criar um valor padrão
     # init=False -> significa que este campo não deve ser incluído no construtor
     # repr=False -> esconde este campo longo da impressão padrão
-    id: uuid.UUID = field(default_factory=uuid.uuid4, init=False, repr=False)
+    id: Any = field(default_factory=_new_patient_id, init=False, repr=False)
 
     def __post_init__(self):
         # Método de validação chamado automaticamente pelo dataclass após a inicialização
@@ -26,14 +128,26 @@ class Patient:
             if not self.name or not isinstance(self.name, str) or self.name.strip() == "":
                 # Erro para nome inválido
                 raise ValueError("O nome do paciente deve ser uma string não vazia.")
-            
+
             # Sanitiza o input removendo espaços extras
             self.name = self.name.strip()
 
         except AttributeError as e:
             # Captura o erro se self.name for None
             raise ValueError("O nome do paciente não pode ser 'None'.") from e
-        
+
+    @classmethod
+    def restore(cls, name: str, patient_id: Any) -> "Patient":
+        '''
+        Recria um paciente já cadastrado (ex: lido de um banco ou journal),
+        mantendo o id original em vez de gerar um novo pela estratégia atual
+        '''
+        patient = object.__new__(cls)
+        patient.name = name
+        patient.id = patient_id
+        patient.__post_init__()
+        return patient
+
     def __str__(self) -> str:
         # Retorna uma representação legível do paciente
-        return f"Paciente(Nome: '{self.name}')"
\ No newline at end of file
+        return f"Paciente(Nome: '{self.name}')"
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+from src.domain.classification import Classification
+
+@dataclass(frozen=True, slots=True)
+class QueuePosition:
+    '''
+    Posição de um paciente em espera
+
+    ahead_in_queue: pacientes à frente dele na fila da mesma cor
+    ahead_overall: pacientes que serão chamados antes dele, na ordem de despacho atual
+    estimated_wait: espera estimada em minutos (preenchida pelo caso de uso, se configurado)
+    '''
+    classification: Classification
+    ahead_in_queue: int
+    ahead_overall: int
+    estimated_wait: Optional[float] = None
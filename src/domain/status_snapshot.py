@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Mapping
+from src.domain.classification import Classification
+
+@dataclass(frozen=True, slots=True)
+class StatusSnapshot:
+    '''
+    Tamanho das filas em uma versão do repositório
+
+    version: cresce a cada alteração das filas (mesma versão => mesmos tamanhos)
+    counts: classificação -> pacientes em espera (somente leitura, compartilhado entre leitores)
+    '''
+    version: int
+    counts: Mapping[Classification, int]
+
+
+@dataclass(frozen=True, slots=True)
+class StatusDelta:
+    '''
+    Alteração das filas entregue aos assinantes do status
+
+    version: versão do repositório depois das alterações
+    changes: só as classificações cujo tamanho mudou desde a última entrega (novo tamanho)
+    counts: o tamanho atual de todas as filas
+    '''
+    version: int
+    changes: Mapping[Classification, int]
+    counts: Mapping[Classification, int]
@@ -1,3 +1,4 @@
+import weakref
 from typing import Optional, Self
 from src.domain.classification import Classification
 
@@ -8,6 +9,12 @@ class NodoArvore:
     Um nó é mutuamente exclusivo:
     - Ou é um nó de pergunta (interno) com uma 'question' e dois filhos
     - Ou é um nó folha (terminal) com uma 'classification' final
+
+    Cada nó tem uma geração: alterar a estrutura de um nó depois de criado
+    (pergunta, classificação ou filhos) incrementa a geração dele e a de todos os
+    seus ancestrais. Assim a geração da raiz muda com qualquer alteração da sua
+    árvore, e só dela, e os caches derivados (ex: TriagePathIndex) sabem quando
+    se invalidar. Criar nós novos não altera a geração de ninguém
     '''
 
     def __init__(self,
@@ -16,6 +23,9 @@ class NodoArvore:
                  yes_child: Optional[Self] = None,
                  no_child: Optional[Self] = None):
         # Construtor da árvore, valida a lógica de negócio do nó
+        object.__setattr__(self, "_generation", 0)
+        object.__setattr__(self, "_parents", weakref.WeakSet())   # Nós que têm este como filho
+        object.__setattr__(self, "_ready", False)                 # True ao fim do construtor
         
         # 1. Validação da lógica exclusiva (pergunta ou folha)
         if (question and classification):
@@ -44,6 +54,49 @@ class NodoArvore:
         self.classification = classification
         self.yes_child = yes_child
         self.no_child = no_child
+        object.__setattr__(self, "_ready", True)
+
+    def __setattr__(self, name, value):
+        if name in ("yes_child", "no_child"):
+            # Mantém o registro de pais usado para propagar a geração até a raiz
+            old = self.__dict__.get(name)
+            other = self.__dict__.get("no_child" if name == "yes_child" else "yes_child")
+            if isinstance(old, NodoArvore) and old is not other:
+                old._parents.discard(self)
+            if isinstance(value, NodoArvore):
+                value._parents.add(self)
+        object.__setattr__(self, name, value)
+        if self._ready:
+            self._bump_generation()
+
+    def _bump_generation(self):
+        # Nova geração para este nó e todos os seus ancestrais (cada um uma vez, mesmo com ciclos)
+        pending = [self]
+        seen = set()
+        while pending:
+            node = pending.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            object.__setattr__(node, "_generation", node._generation + 1)
+            pending.extend(node._parents)
+
+    def __getstate__(self):
+        # O registro de pais (referências fracas) não é copiado; é refeito em __setstate__
+        state = dict(self.__dict__)
+        del state["_parents"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        object.__setattr__(self, "_parents", weakref.WeakSet())
+        for child in (self.yes_child, self.no_child):
+            if isinstance(child, NodoArvore):
+                child._parents.add(self)
+
+    def get_generation(self) -> int:
+        # Retorna a geração deste nó (muda quando ele ou algum descendente é alterado)
+        return self._generation
 
     def is_leaf(self) -> bool:
         # Método auxiliar limpo para verificar se este nó é uma folha
@@ -0,0 +1,94 @@
+import sys
+import threading
+from collections import deque
+from typing import List, Optional, TextIO
+from src.domain.event_sink import Event, EventLevel, EventSink
+
+
+class StdoutEventSink(EventSink):
+    '''
+    Escreve os eventos no console, no mesmo formato dos antigos print() ("[Repo] ...")
+    '''
+
+    def __init__(self, level: EventLevel = EventLevel.INFO, stream: Optional[TextIO] = None):
+        super().__init__(level)
+        self._stream = stream
+
+    def write(self, event: Event):
+        # O stream é resolvido na escrita para respeitar redirecionamentos de sys.stdout
+        print(event, file=self._stream or sys.stdout)
+
+
+class RotatingFileEventSink(EventSink):
+    '''
+    Escreve os eventos em um arquivo que é rotacionado ao atingir um tamanho máximo
+
+    Usa o RotatingFileHandler da biblioteca padrão (arquivo.log, arquivo.log.1, ...)
+    '''
+
+    def __init__(self,
+                 path: str,
+                 level: EventLevel = EventLevel.DEBUG,
+                 max_bytes: int = 5 * 1024 * 1024,
+                 backup_count: int = 3):
+        super().__init__(level)
+        # logging só é importado quando este destino é usado (não pesa na inicialização)
+        import logging
+        from logging.handlers import RotatingFileHandler
+
+        self._make_record = logging.LogRecord
+        self._handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self._handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+
+    def write(self, event: Event):
+        record = self._make_record(
+            name=event.source,
+            level=int(event.level),
+            pathname="",
+            lineno=0,
+            msg=event.template,
+            args=event.args or None,
+            exc_info=None
+        )
+        record.created = event.timestamp
+        self._handler.handle(record)
+
+    def close(self):
+        self._handler.close()
+
+
+class RingBufferEventSink(EventSink):
+    '''
+    Guarda os últimos 'capacity' eventos em memória (buffer circular)
+
+    Os eventos são guardados sem formatar; a mensagem só é montada
+    quando alguém consulta o buffer
+    '''
+
+    def __init__(self, capacity: int = 1024, level: EventLevel = EventLevel.DEBUG):
+        if capacity <= 0:
+            raise ValueError("A capacidade do buffer deve ser maior que zero.")
+        super().__init__(level)
+        self._events: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def write(self, event: Event):
+        # deque.append com maxlen descarta o evento mais antigo automaticamente
+        with self._lock:
+            self._events.append(event)
+
+    def events(self) -> List[Event]:
+        # Retorna uma cópia dos eventos guardados (do mais antigo ao mais recente)
+        with self._lock:
+            return list(self._events)
+
+    def messages(self) -> List[str]:
+        # Retorna os eventos guardados já formatados
+        return [str(event) for event in self.events()]
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+
+    def __len__(self) -> int:
+        return len(self._events)
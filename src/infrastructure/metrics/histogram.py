@@ -0,0 +1,188 @@
+import math
+from array import array
+from typing import Iterator, Sequence, Tuple
+
+
+class LatencyHistogram:
+    '''
+    Histograma no estilo HDR (High Dynamic Range) para valores inteiros (ex: latências em ns)
+
+    Os valores de 1 até 'highest_value' são contados em baldes log-lineares: cada potência
+    de 2 é dividida em sub-baldes de mesma largura, então o erro relativo de qualquer
+    valor registrado fica abaixo de 10^-significant_figures (3 algarismos => 0,1%).
+    A memória é fixa (um array de contadores alocado na criação) e registrar um valor
+    é O(1): só um cálculo de índice com bit_length() e um incremento
+
+    Valores acima de 'highest_value' são contados no último balde (saturam), mas o
+    máximo exato continua disponível em max
+    '''
+    __slots__ = ("highest_value", "significant_figures", "_sub_bucket_half_magnitude",
+                 "_sub_bucket_half_count", "_sub_bucket_mask", "_counts", "count", "total", "min", "max")
+
+    def __init__(self, highest_value: int = 60 * 10**9, significant_figures: int = 3):
+        '''
+        Args:
+            highest_value (int): Maior valor rastreado com precisão (padrão: 60 s em ns)
+            significant_figures (int): Algarismos significativos preservados (1 a 5)
+
+        Raises:
+            ValueError: Se os parâmetros estiverem fora dos limites
+        '''
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures deve estar entre 1 e 5.")
+        if highest_value < 2:
+            raise ValueError("highest_value deve ser pelo menos 2.")
+
+        self.highest_value = highest_value
+        self.significant_figures = significant_figures
+
+        # Menor potência de 2 com resolução unitária até 2 * 10^algarismos
+        sub_bucket_magnitude = math.ceil(math.log2(2 * 10**significant_figures))
+        self._sub_bucket_half_magnitude = sub_bucket_magnitude - 1
+        self._sub_bucket_half_count = 1 << self._sub_bucket_half_magnitude
+        self._sub_bucket_mask = (1 << sub_bucket_magnitude) - 1
+
+        # Quantas potências de 2 (baldes) cobrem até highest_value
+        bucket_count = 1
+        smallest_untrackable = 1 << sub_bucket_magnitude
+        while smallest_untrackable <= highest_value:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+
+        self._counts = array("Q", bytes(8 * (bucket_count + 1) * self._sub_bucket_half_count))
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index_of(self, value: int) -> int:
+        # Balde = posição do bit mais alto acima da faixa de resolução unitária
+        bucket = (value | self._sub_bucket_mask).bit_length() - self._sub_bucket_half_magnitude - 1
+        sub_bucket = value >> bucket
+        return ((bucket + 1) << self._sub_bucket_half_magnitude) + sub_bucket - self._sub_bucket_half_count
+
+    def _range_of(self, index: int) -> Tuple[int, int]:
+        # Menor e maior valor que caem no contador 'index'
+        bucket = (index >> self._sub_bucket_half_magnitude) - 1
+        sub_bucket = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        if bucket < 0:
+            sub_bucket -= self._sub_bucket_half_count
+            bucket = 0
+        low = sub_bucket << bucket
+        return low, low + (1 << bucket) - 1
+
+    def record(self, value: int):
+        '''
+        Registra um valor (inteiro não negativo; valores negativos contam como 0)
+        '''
+        if value < 0:
+            value = 0
+        index = self._index_of(value if value <= self.highest_value else self.highest_value)
+        self._counts[index] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    def value_at_percentile(self, percentile: float) -> int:
+        '''
+        Retorna o valor no percentil informado (0 a 100), ou 0 se o histograma estiver vazio
+
+        O resultado é o maior valor equivalente do balde (nunca acima do máximo registrado),
+        como no HdrHistogram: o erro é sempre para cima, dentro da precisão configurada
+        '''
+        if self.count == 0:
+            return 0
+        target = max(1, math.ceil(min(max(percentile, 0.0), 100.0) / 100 * self.count))
+        if target >= self.count:
+            return self.max
+        seen = 0
+        for index, count in enumerate(self._counts):
+            if count:
+                seen += count
+                if seen >= target:
+                    return min(self._range_of(index)[1], self.max)
+        return self.max
+
+    def percentiles(self, *percentiles: float) -> Tuple[int, ...]:
+        '''
+        Retorna vários percentis (na ordem pedida) em uma única passada pelos contadores
+        '''
+        if self.count == 0:
+            return (0,) * len(percentiles)
+        targets = sorted((max(1, math.ceil(min(max(p, 0.0), 100.0) / 100 * self.count)), position)
+                         for position, p in enumerate(percentiles))
+        results = [self.max] * len(percentiles)
+        pending = 0
+        seen = 0
+        for index, count in enumerate(self._counts):
+            if not count:
+                continue
+            seen += count
+            while pending < len(targets) and seen >= targets[pending][0] and targets[pending][0] < self.count:
+                results[targets[pending][1]] = min(self._range_of(index)[1], self.max)
+                pending += 1
+            if pending == len(targets):
+                break
+        return tuple(results)
+
+    def counts_at_or_below(self, bounds: Sequence[int]) -> Tuple[int, ...]:
+        '''
+        Para cada limite (em ordem crescente), quantos valores registrados são menores ou
+        iguais a ele (cumulativo, como os baldes de um histograma do Prometheus)
+
+        O balde que contém o limite conta inteiro, dentro da precisão configurada
+        '''
+        results = []
+        seen = 0
+        index = 0
+        counts = self._counts
+        for bound in bounds:
+            last = self._index_of(min(max(bound, 0), self.highest_value))
+            while index <= last:
+                seen += counts[index]
+                index += 1
+            results.append(seen)
+        return tuple(results)
+
+    def buckets(self) -> Iterator[Tuple[int, int]]:
+        # Percorre os contadores não vazios como (maior valor do balde, quantidade)
+        for index, count in enumerate(self._counts):
+            if count:
+                yield self._range_of(index)[1], count
+
+    def merge(self, other: "LatencyHistogram"):
+        '''
+        Soma os contadores de outro histograma com a mesma configuração a este
+
+        Raises:
+            ValueError: Se as configurações forem diferentes
+        '''
+        if (other.highest_value, other.significant_figures) != (self.highest_value, self.significant_figures):
+            raise ValueError("Só é possível somar histogramas com a mesma configuração.")
+        if other.count == 0:
+            return
+        counts = self._counts
+        for index, count in enumerate(other._counts):
+            if count:
+                counts[index] += count
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def reset(self):
+        # Zera os contadores sem realocar o array
+        counts = self._counts
+        for index in range(len(counts)):
+            counts[index] = 0
+        self.count = self.total = self.min = self.max = 0
+
+    def memory_bytes(self) -> int:
+        # Tamanho do array de contadores (fixo desde a criação)
+        return self._counts.itemsize * len(self._counts)
@@ -0,0 +1,344 @@
+import math
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from src.domain.classification import Classification
+from src.infrastructure.metrics.histogram import LatencyHistogram
+
+# Cores na ordem de prioridade: o índice de cada cor é a sua posição na tabela de despacho
+COLORS: Tuple[Classification, ...] = tuple(sorted(Classification, key=lambda c: c.priority))
+
+# Limites (segundos) dos baldes do histograma exportado: cobrem os tempos-alvo do protocolo
+WAIT_BUCKETS: Tuple[float, ...] = (1, 10, 30, 60, 300, 600, 1800, 3600, 7200, 14400, 28800)
+
+# Abaixo deste tamanho o prefixo já consumido dos carimbos não é descartado
+_MIN_COMPACT = 1024
+
+
+class _ArrivalStamps:
+    '''
+    Carimbos de chegada dos pacientes, indexados pelo número de chegada global do
+    repositório (0, 1, 2, ... na ordem dos cadastros)
+
+    Um array de doubles e um bytearray "ainda esperando" alinhados, com um ponteiro
+    para o primeiro carimbo que pode estar vivo. Gravar, ler e descartar um carimbo
+    são O(1) em qualquer posição (chamada, remoção ou reclassificação), sem criar
+    objetos por paciente. O prefixo descartado é liberado quando passa da metade do
+    array; um paciente esperando há muito tempo segura os carimbos de quem chegou depois
+    '''
+    __slots__ = ("_stamps", "_live", "_offset", "_start")
+
+    def __init__(self):
+        self._stamps = array("d")
+        self._live = bytearray()
+        self._offset = 0       # Número de chegada do índice 0 dos arrays
+        self._start = 0        # Antes deste índice, ninguém está esperando
+
+    def add(self, arrival: int, stamp: float):
+        index = arrival - self._offset
+        stamps = self._stamps
+        if index < 0:
+            # Paciente devolvido depois que o seu carimbo foi liberado (raro): abre espaço no início
+            stamps[0:0] = array("d", [math.nan] * -index)
+            self._live[0:0] = bytes(-index)
+            self._offset = arrival
+            self._start -= index
+            index = 0
+        if index >= len(stamps):
+            # Normalmente index == len (chegadas em ordem); lacunas ficam como não vivas
+            missing = index - len(stamps)
+            stamps.extend([math.nan] * missing)
+            self._live.extend(bytes(missing))
+            stamps.append(stamp)
+            self._live.append(1)
+        else:
+            stamps[index] = stamp
+            self._live[index] = 1
+        if index < self._start:
+            self._start = index
+
+    def take(self, arrival: int) -> float:
+        # Descarta e retorna o carimbo de um paciente que saiu da espera
+        index = arrival - self._offset
+        stamp = self._stamps[index]
+        self._live[index] = 0
+        if index == self._start:
+            live, start, size = self._live, index + 1, len(self._live)
+            while start < size and not live[start]:
+                start += 1
+            self._start = start
+            if start > _MIN_COMPACT and start * 2 > size:
+                del self._stamps[:start]
+                del self._live[:start]
+                self._offset += start
+                self._start = 0
+        return stamp
+
+    def restore(self, arrival: int) -> bool:
+        '''
+        Marca de novo como esperando um paciente que já tinha saído (mantém o carimbo);
+        False se o carimbo já foi liberado
+        '''
+        index = arrival - self._offset
+        if not 0 <= index < len(self._live) or math.isnan(self._stamps[index]):
+            return False
+        self._live[index] = 1
+        if index < self._start:
+            self._start = index
+        return True
+
+
+@dataclass(frozen=True)
+class QueueSnapshot:
+    '''
+    Estado de uma fila em um instante (esperas em segundos, dos pacientes já chamados)
+    '''
+    arrivals: int
+    dispatched: int
+    removed: int
+    reclassified_in: int
+    reclassified_out: int
+    depth: int
+    wait_count: int
+    wait_mean: float
+    wait_p50: float
+    wait_p90: float
+    wait_p99: float
+    wait_max: float
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    # Fotografia de todas as filas; 'taken_at' vem do relógio das métricas (segundos)
+    taken_at: float
+    queues: Dict[Classification, QueueSnapshot]
+
+    def rates_since(self, previous: "MetricsSnapshot") -> Dict[Classification, Tuple[float, float]]:
+        '''
+        Taxas (por segundo) de chegada e de chamada de cada fila entre duas fotografias
+        '''
+        elapsed = self.taken_at - previous.taken_at
+        if elapsed <= 0:
+            return {cls: (math.nan, math.nan) for cls in self.queues}
+        return {
+            cls: ((current.arrivals - previous.queues[cls].arrivals) / elapsed,
+                  (current.dispatched - previous.queues[cls].dispatched) / elapsed)
+            for cls, current in self.queues.items()
+        }
+
+
+class QueueMetrics:
+    '''
+    Métricas por fila: chegadas, chamadas, remoções, reclassificações, profundidade
+    e o histograma do tempo de espera (do cadastro até a chamada)
+
+    O repositório chama os ganchos record_* com a posição da fila na ordem de
+    prioridade (Vermelho = 0). Cada gancho é O(1) e não cria objetos por evento: os
+    contadores e os histogramas têm memória fixa, e os carimbos de chegada ficam em
+    um array de doubles indexado pelo número de chegada. As esperas são registradas
+    em milissegundos
+
+    As leituras (snapshot, render_prometheus) podem vir de outra thread: elas só
+    leem os contadores, e o pior caso é uma fotografia com um evento de diferença
+    entre dois campos
+    '''
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, highest_wait: float = 24 * 3600.0):
+        '''
+        Args:
+            clock (Callable[[], float]): Relógio em segundos (injetável para simulações)
+            highest_wait (float): Maior espera (segundos) medida com precisão; acima disso satura
+        '''
+        self._clock = clock
+        size = len(COLORS)
+        self.position_of: Dict[Classification, int] = {cls: index for index, cls in enumerate(COLORS)}
+        self._arrivals = array("Q", bytes(8 * size))
+        self._dispatched = array("Q", bytes(8 * size))
+        self._removed = array("Q", bytes(8 * size))
+        self._reclassified_in = array("Q", bytes(8 * size))
+        self._reclassified_out = array("Q", bytes(8 * size))
+        self._depth = array("q", bytes(8 * size))
+        self._stamps = _ArrivalStamps()
+        self._waits: List[LatencyHistogram] = [
+            LatencyHistogram(highest_value=int(highest_wait * 1000), significant_figures=3) for _ in COLORS
+        ]
+
+    # Ganchos do repositório ('arrival' é o número de chegada do paciente no repositório)
+
+    def record_arrival(self, position: int, arrival: int):
+        self._stamps.add(arrival, self._clock())
+        self._arrivals[position] += 1
+        self._depth[position] += 1
+
+    def record_arrivals(self, positions: List[int], first_arrival: int):
+        # Um lote com números de chegada consecutivos: todos recebem o mesmo carimbo
+        now, stamps = self._clock(), self._stamps
+        for arrival, position in enumerate(positions, first_arrival):
+            stamps.add(arrival, now)
+            self._arrivals[position] += 1
+            self._depth[position] += 1
+
+    def record_dispatch(self, position: int, arrival: int):
+        wait = self._clock() - self._stamps.take(arrival)
+        self._waits[position].record(int(wait * 1000))
+        self._dispatched[position] += 1
+        self._depth[position] -= 1
+
+    def record_dispatches(self, position: int, arrivals: List[int]):
+        # Pacientes chamados do início da mesma fila
+        now = self._clock()
+        stamps, waits = self._stamps, self._waits[position]
+        for arrival in arrivals:
+            waits.record(int((now - stamps.take(arrival)) * 1000))
+        self._dispatched[position] += len(arrivals)
+        self._depth[position] -= len(arrivals)
+
+    def record_removal(self, position: int, arrival: int):
+        self._stamps.take(arrival)
+        self._removed[position] += 1
+        self._depth[position] -= 1
+
+    def record_reclassification(self, old_position: int, new_position: int, old_arrival: int, new_arrival: int):
+        '''
+        O paciente mantém o carimbo original (a espera conta desde o cadastro), mesmo
+        quando entra no fim da nova fila com outro número de chegada
+        '''
+        if new_arrival != old_arrival:
+            self._stamps.add(new_arrival, self._stamps.take(old_arrival))
+        self._reclassified_out[old_position] += 1
+        self._reclassified_in[new_position] += 1
+        self._depth[old_position] -= 1
+        self._depth[new_position] += 1
+
+    def record_return(self, position: int, arrival: int):
+        '''
+        Um paciente chamado (record_dispatch) voltou para a fila na posição original
+        sem ter sido atendido. Conta como uma nova chegada (os contadores só crescem),
+        mas mantém o carimbo do cadastro, ou recomeça a contar se ele já foi liberado
+        '''
+        if not self._stamps.restore(arrival):
+            self._stamps.add(arrival, self._clock())
+        self._arrivals[position] += 1
+        self._depth[position] += 1
+
+    # Leituras
+
+    def snapshot(self) -> MetricsSnapshot:
+        '''
+        Retorna uma fotografia imutável de todas as filas
+        '''
+        queues = {}
+        for position, cls in enumerate(COLORS):
+            waits = self._waits[position]
+            p50, p90, p99 = waits.percentiles(50, 90, 99)
+            queues[cls] = QueueSnapshot(
+                arrivals=self._arrivals[position],
+                dispatched=self._dispatched[position],
+                removed=self._removed[position],
+                reclassified_in=self._reclassified_in[position],
+                reclassified_out=self._reclassified_out[position],
+                depth=self._depth[position],
+                wait_count=waits.count,
+                wait_mean=waits.mean() / 1000,
+                wait_p50=p50 / 1000,
+                wait_p90=p90 / 1000,
+                wait_p99=p99 / 1000,
+                wait_max=waits.max / 1000,
+            )
+        return MetricsSnapshot(self._clock(), queues)
+
+    def render_prometheus(self, prefix: str = "manchester") -> str:
+        '''
+        Retorna as métricas no formato de texto do Prometheus (versão 0.0.4)
+        '''
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str, values: array):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for position, cls in enumerate(COLORS):
+                lines.append(f'{prefix}_{name}{{classification="{cls.name}"}} {values[position]}')
+
+        family("arrivals_total", "counter", "Pacientes cadastrados em cada fila.", self._arrivals)
+        family("dispatched_total", "counter", "Pacientes chamados de cada fila.", self._dispatched)
+        family("removed_total", "counter", "Pacientes removidos de cada fila sem serem chamados.", self._removed)
+        family("reclassified_in_total", "counter", "Pacientes que entraram na fila por reclassificação.", self._reclassified_in)
+        family("reclassified_out_total", "counter", "Pacientes que saíram da fila por reclassificação.", self._reclassified_out)
+        family("queue_depth", "gauge", "Pacientes esperando em cada fila.", self._depth)
+
+        name = f"{prefix}_wait_seconds"
+        lines.append(f"# HELP {name} Espera entre o cadastro e a chamada.")
+        lines.append(f"# TYPE {name} histogram")
+        for position, cls in enumerate(COLORS):
+            waits = self._waits[position]
+            label = f'classification="{cls.name}"'
+            cumulative = waits.counts_at_or_below([int(bound * 1000) for bound in WAIT_BUCKETS])
+            for bound, count in zip(WAIT_BUCKETS, cumulative):
+                lines.append(f'{name}_bucket{{{label},le="{bound:g}"}} {count}')
+            lines.append(f'{name}_bucket{{{label},le="+Inf"}} {waits.count}')
+            lines.append(f"{name}_sum{{{label}}} {waits.total / 1000:g}")
+            lines.append(f"{name}_count{{{label}}} {waits.count}")
+
+        name = f"{prefix}_wait_quantile_seconds"
+        lines.append(f"# HELP {name} Percentis da espera (precisão de 0,1%).")
+        lines.append(f"# TYPE {name} gauge")
+        for position, cls in enumerate(COLORS):
+            for quantile, value in zip(("0.5", "0.9", "0.99"), self._waits[position].percentiles(50, 90, 99)):
+                lines.append(f'{name}{{classification="{cls.name}",quantile="{quantile}"}} {value / 1000:g}')
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    '''
+    Servidor HTTP mínimo (biblioteca padrão) que expõe QueueMetrics em /metrics
+
+    Escuta só em localhost por padrão e atende em uma thread daemon, então não
+    bloqueia a aplicação. Use port=0 para uma porta livre (ver 'url')
+    '''
+
+    def __init__(self, metrics: QueueMetrics, host: str = "127.0.0.1", port: int = 9464):
+        # http.server só é importado quando o servidor é criado: o repositório importa
+        # este módulo e não deve pagar por isso na inicialização
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.metrics = metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.split("?")[0] != "/metrics":
+                    handler.send_error(404, "Use /metrics")
+                    return
+                body = metrics.render_prometheus().encode("utf-8")
+                handler.send_response(200)
+                handler.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                # Sem uma linha no stderr a cada coleta
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
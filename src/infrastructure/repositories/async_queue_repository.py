@@ -0,0 +1,115 @@
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Tuple
+from src.domain.classification import Classification
+from src.domain.patient import Patient
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_hand_off_queue_repository import IHandOffQueueRepository
+from src.application.interfaces.i_async_queue_repository import IAsyncQueueRepository
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+
+class AsyncQueueRepository(IAsyncQueueRepository):
+    '''
+    Implementação asyncio de IAsyncQueueRepository
+
+    Envolve um repositório síncrono com entrega provisória (IHandOffQueueRepository,
+    por padrão o InMemoryQueueRepository) e mantém uma fila FIFO de consultórios aguardando. Só existem consultórios
+    aguardando quando todas as filas estão vazias, então cada paciente que chega
+    é entregue diretamente ao consultório que espera há mais tempo: exatamente um
+    é acordado, sem acordar os demais à toa
+
+    Deve ser usado a partir de um único event loop
+    '''
+
+    def __init__(self, backend: Optional[IHandOffQueueRepository] = None, events: Optional[EventSink] = None):
+        '''
+        Args:
+            backend (Optional[IHandOffQueueRepository]): Repositório síncrono com as filas
+                                                         (padrão: InMemoryQueueRepository)
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
+
+        Raises:
+            TypeError: Se o repositório não implementar IHandOffQueueRepository (sem ele,
+                       um paciente entregue a um consultório que desistiu não volta ao seu lugar)
+        '''
+        self._events = events if events is not None else NULL_SINK
+        self._backend = backend if backend is not None else InMemoryQueueRepository(self._events)
+        if not isinstance(self._backend, IHandOffQueueRepository):
+            raise TypeError("O repositório (backend) deve implementar a interface IHandOffQueueRepository.")
+
+        # Cada consultório aguardando é um Future que recebe (paciente, classificação, chegada) ou None (timeout)
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def waiting_callers(self) -> int:
+        # Número de consultórios aguardando paciente
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def _hand_off(self):
+        # Entrega os pacientes disponíveis (mais urgente primeiro) aos consultórios que esperam há mais tempo
+        while self._waiters:
+            waiter = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            # A classificação e a chegada vão junto para devolver o paciente ao mesmo lugar se a espera for cancelada
+            taken = self._backend.take_next_patient()
+            if taken is None:
+                return
+            self._waiters.popleft()
+            waiter.set_result(taken)
+
+    async def add_patient(self, patient: Patient, classification: Classification):
+        self._backend.add_patient(patient, classification)
+        self._hand_off()
+
+    async def add_patients(self, entries: Iterable[Tuple[Patient, Classification]]):
+        '''
+        Adiciona vários pacientes e acorda até um consultório por paciente
+        '''
+        self._backend.add_patients(entries)
+        self._hand_off()
+
+    def get_next_patient_nowait(self) -> Optional[Patient]:
+        '''
+        Versão que não espera: retorna None se todas as filas estiverem vazias
+        '''
+        return self._backend.get_next_patient()
+
+    async def get_next_patient(self, timeout: Optional[float] = None) -> Optional[Patient]:
+        patient = self._backend.get_next_patient()
+        if patient is not None or timeout == 0:
+            return patient
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+
+        # O timeout resolve o Future com None (em vez de cancelar), então uma entrega e
+        # um timeout simultâneos nunca perdem o paciente
+        timer = None
+        if timeout is not None:
+            timer = loop.call_later(timeout, lambda: waiter.done() or waiter.set_result(None))
+
+        self._events.emit(EventLevel.DEBUG, "Repo", "Consultório aguardando paciente.")
+        try:
+            delivered = await waiter
+        except asyncio.CancelledError:
+            # Se o paciente já tinha sido entregue, ele volta para a fila (e para outro consultório)
+            if waiter.done() and not waiter.cancelled() and waiter.result() is not None:
+                self._requeue(*waiter.result())
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+        return delivered[0] if delivered is not None else None
+
+    def _requeue(self, patient: Patient, classification: Classification, arrival: int):
+        # Devolve à posição original um paciente entregue a um consultório que desistiu de esperar
+        self._events.emit(EventLevel.WARNING, "Repo", "Paciente '%s' devolvido: o consultório cancelou a espera.", patient.name)
+        self._backend.return_patient(patient, classification, arrival)
+        self._hand_off()
+
+    async def get_status(self) -> Dict[Classification, int]:
+        return self._backend.get_status()
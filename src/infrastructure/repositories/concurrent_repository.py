@@ -0,0 +1,154 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from src.domain.classification import Classification
+from src.domain.custom_queue import Fila
+from src.domain.patient import Patient
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_queue_repository import IQueueRepository
+
+class ConcurrentQueueRepository(IQueueRepository):
+    '''
+    Implementação de IQueueRepository segura para várias threads
+    (várias estações de triagem cadastrando e vários consultórios chamando)
+
+    Cada uma das 5 filas tem o seu próprio lock, então cadastros em cores
+    diferentes não disputam entre si. A chamada do próximo paciente verifica e
+    remove dentro do lock da fila, eliminando a corrida entre is_empty() e dequeue().
+    get_status lê os tamanhos sem lock (len() da fila interna é atômico)
+
+    Os ids em espera ficam em um conjunto com lock próprio (segurado só para
+    consultar e atualizar o conjunto), para que o mesmo paciente não espere em duas cores
+    '''
+
+    def __init__(self, events: Optional[EventSink] = None):
+        self._events = events if events is not None else NULL_SINK
+        self.queues: Dict[Classification, Fila] = {
+            cls: Fila(self._events) for cls in Classification
+        }
+        self._locks: Dict[Classification, threading.Lock] = {
+            cls: threading.Lock() for cls in Classification
+        }
+        self._waiting_ids: Set[Any] = set()
+        self._waiting_lock = threading.Lock()
+
+        # Tabela de despacho pré-calculada (Vermelho -> Azul) com a fila e o lock de cada cor
+        self._dispatch_table: List[Tuple[Classification, Fila, threading.Lock]] = [
+            (cls, self.queues[cls], self._locks[cls])
+            for cls in sorted(Classification, key=lambda c: c.priority)
+        ]
+        self._events.emit(EventLevel.INFO, "Repo", "Repositório concorrente inicializado com 5 filas.")
+
+    def add_patient(self, patient: Patient, classification: Classification):
+        '''
+        Adiciona um paciente à fila correta, segurando apenas o lock dessa fila
+
+        Raises:
+            KeyError: Se a classificação fornecida não for válida
+            ValueError: Se o paciente for None ou já estiver esperando em qualquer fila
+        '''
+        try:
+            queue = self.queues[classification]
+            lock = self._locks[classification]
+        except KeyError:
+            raise KeyError(f"Classificação '{classification}' inválida. Não existe fila para ela.")
+        if patient is None:
+            raise ValueError("Não é possível adicionar um item 'None'.")
+
+        with self._waiting_lock:
+            if patient.id in self._waiting_ids:
+                raise ValueError(f"O paciente '{patient.name}' (id {patient.id}) já está esperando.")
+            self._waiting_ids.add(patient.id)
+        try:
+            with lock:
+                queue.enqueue(patient)
+        except BaseException:
+            with self._waiting_lock:
+                self._waiting_ids.discard(patient.id)
+            raise
+
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "Paciente '%s' adicionado à fila %s.", patient.name, classification.name)
+
+    def add_patients(self, entries: Iterable[Tuple[Patient, Classification]]):
+        '''
+        Adiciona vários pacientes; o grupo de cada cor entra na fila de uma vez, sob o lock dela
+
+        O lote inteiro é validado (e os seus ids reservados) antes de qualquer fila
+        mudar, então um erro não deixa parte do lote nas filas
+
+        Raises:
+            KeyError: Se alguma classificação não for válida (nenhum paciente é adicionado)
+            ValueError: Se algum paciente for None, repetido no lote ou já estiver
+                esperando (nenhum paciente é adicionado)
+        '''
+        groups: Dict[Classification, List[Patient]] = {}
+        ids: Set[Any] = set()
+        for patient, classification in entries:
+            if classification not in self.queues:
+                raise KeyError(f"Classificação '{classification}' inválida. Não existe fila para ela.")
+            if patient is None:
+                raise ValueError("Não é possível adicionar um item 'None'.")
+            if patient.id in ids:
+                raise ValueError(f"O paciente '{patient.name}' (id {patient.id}) aparece mais de uma vez no lote.")
+            ids.add(patient.id)
+            groups.setdefault(classification, []).append(patient)
+
+        with self._waiting_lock:
+            already_waiting = ids & self._waiting_ids
+            if already_waiting:
+                raise ValueError(f"{len(already_waiting)} paciente(s) do lote já estão esperando "
+                                 f"(ex: id {next(iter(already_waiting))}).")
+            self._waiting_ids |= ids
+
+        # Com os ids reservados, nenhum enqueue_many abaixo encontra um id repetido
+        for classification, patients in groups.items():
+            with self._locks[classification]:
+                self.queues[classification].enqueue_many(patients)
+
+    def get_next_patient(self) -> Optional[Patient]:
+        '''
+        Remove e retorna, de forma atômica, o paciente mais urgente disponível
+
+        Filas vazias são puladas sem adquirir o lock; em uma fila com pacientes,
+        a verificação e a remoção acontecem dentro do lock dela
+        '''
+        for classification, queue, lock in self._dispatch_table:
+            if not len(queue):
+                continue
+            with lock:
+                if queue.size():
+                    patient = queue.dequeue()
+                    break
+        else:
+            self._events.emit(EventLevel.INFO, "Repo", "Todas as filas estão vazias.")
+            return None
+
+        with self._waiting_lock:
+            self._waiting_ids.discard(patient.id)
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "Chamando paciente '%s' da fila %s.", patient.name, classification.name)
+        return patient
+
+    def get_next_patients(self, count: int) -> List[Patient]:
+        '''
+        Remove e retorna até 'count' pacientes, esvaziando as filas em blocos
+        (Vermelho -> Azul), cada bloco sob o lock da sua fila
+        '''
+        patients: List[Patient] = []
+        for _, queue, lock in self._dispatch_table:
+            if len(patients) >= count:
+                break
+            if not len(queue):
+                continue
+            with lock:
+                patients.extend(queue.dequeue_many(count - len(patients)))
+        if patients:
+            with self._waiting_lock:
+                self._waiting_ids.difference_update(patient.id for patient in patients)
+        return patients
+
+    def get_status(self) -> Dict[Classification, int]:
+        '''
+        Retorna o tamanho de cada fila sem adquirir locks
+        '''
+        return {classification: len(queue) for classification, queue in self.queues.items()}
@@ -0,0 +1,243 @@
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, List, Optional
+from src.domain.classification import Classification
+from src.domain.patient import Patient
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_queue_repository import IQueueRepository
+
+# Políticas de despacho disponíveis
+POLICY_DEADLINE = "deadline"
+POLICY_STRICT = "strict"
+
+# Abaixo deste tamanho os heaps nunca são reconstruídos para descartar entradas mortas
+_MIN_REBUILD = 1024
+
+
+class _Waiting:
+    '''
+    Um paciente em espera: guarda a chegada, o prazo e a classificação atual
+    (que pode subir de cor por escalonamento)
+    '''
+    __slots__ = ("patient", "classification", "arrival", "deadline", "seq", "dispatched")
+
+    def __init__(self, patient: Patient, classification: Classification, arrival: float, seq: int):
+        self.patient = patient
+        self.classification = classification
+        self.arrival = arrival
+        self.deadline = arrival + classification.target_wait * 60
+        self.seq = seq
+        self.dispatched = False
+
+
+class DeadlineQueueRepository(IQueueRepository):
+    '''
+    Implementação de IQueueRepository orientada aos tempos-alvo do Protocolo de Manchester
+
+    Cada paciente recebe um carimbo de chegada e um prazo (chegada + tempo-alvo da sua cor).
+    Os pacientes ficam em um heap, com cadastro e chamada em O(log n) independente
+    de quantos estão esperando. Duas políticas:
+
+    - "deadline": chama primeiro quem tem o prazo mais próximo (Earliest Deadline First),
+      então um Azul que já esperou demais passa à frente dos Verdes que acabaram de chegar.
+      O Vermelho (atendimento imediato) fica fora dessa disputa: é sempre chamado antes
+      de qualquer outra cor, por mais atrasados que os demais estejam
+    - "strict": mantém a ordem estrita por cor (Vermelho -> Azul, FIFO dentro da cor)
+
+    Com o escalonamento ligado, quem estoura o tempo-alvo sobe uma cor (até Laranja).
+    Na política "strict" isso muda a ordem de chamada; na "deadline" a ordem já
+    respeita o prazo original, e o escalonamento se reflete no status e nos eventos.
+    Um segundo heap, ordenado por prazo, encontra os atrasados sem percorrer as filas
+
+    As entradas já chamadas ou escalonadas são descartadas de forma preguiçosa (marcadas e
+    puladas ao chegarem ao topo), e os heaps são reconstruídos quando acumulam muitas delas
+    '''
+
+    def __init__(self, policy: str = POLICY_DEADLINE, escalate: bool = True,
+                 clock: Callable[[], float] = time.monotonic, events: Optional[EventSink] = None):
+        '''
+        Args:
+            policy (str): "deadline" (prazo mais próximo) ou "strict" (ordem por cor)
+            escalate (bool): Se True, pacientes que estouram o tempo-alvo sobem uma cor
+            clock (Callable[[], float]): Relógio em segundos (injetável para simulações)
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
+
+        Raises:
+            ValueError: Se a política não for reconhecida
+        '''
+        if policy not in (POLICY_DEADLINE, POLICY_STRICT):
+            raise ValueError(f"Política '{policy}' inválida. Use '{POLICY_DEADLINE}' ou '{POLICY_STRICT}'.")
+
+        self.policy = policy
+        self.escalate = escalate
+        self._clock = clock
+        self._events = events if events is not None else NULL_SINK
+        self._seq = itertools.count()
+
+        # Heap de despacho: [não Vermelho (0/1), prazo, prioridade, seq, _Waiting] ou [prioridade, seq, _Waiting]
+        self._dispatch_heap: List[list] = []
+        self._stale_dispatch = 0
+        # Heap de escalonamento: [prazo, seq, _Waiting]; só entram cores que ainda podem subir
+        self._deadline_heap: List[list] = []
+
+        self._sizes: Dict[Classification, int] = {cls: 0 for cls in Classification}
+        self._total = 0
+        self.escalations = 0
+
+        # Cor imediatamente mais urgente de cada classificação (Vermelho não sobe, Laranja não vira Vermelho)
+        by_priority = sorted(Classification, key=lambda c: c.priority)
+        self._promotion: Dict[Classification, Classification] = {
+            cls: by_priority[cls.priority - 1] for cls in by_priority if cls.priority > 1
+        }
+        self._events.emit(EventLevel.INFO, "Repo", "Repositório por prazo inicializado (política '%s').", policy)
+
+    def _dispatch_key(self, waiting: _Waiting) -> list:
+        # Na política por prazo o Vermelho vem antes de tudo (um atrasado de outra cor tem prazo
+        # menor que o de um Vermelho recém-chegado); entre as demais cores a prioridade só desempata prazos iguais
+        if self.policy == POLICY_DEADLINE:
+            priority = waiting.classification.priority
+            return [0 if priority == 0 else 1, waiting.deadline, priority, waiting.seq, waiting]
+        return [waiting.classification.priority, waiting.seq, waiting]
+
+    def _is_live(self, item: list) -> bool:
+        # Uma entrada morre quando o paciente é chamado ou, na política "strict", quando
+        # ele sobe de cor (a entrada antiga fica com a prioridade desatualizada)
+        waiting = item[-1]
+        if waiting.dispatched:
+            return False
+        return self.policy == POLICY_DEADLINE or item[0] == waiting.classification.priority
+
+    def add_patient(self, patient: Patient, classification: Classification):
+        '''
+        Adiciona um paciente, carimbando a chegada com o relógio do repositório
+
+        Raises:
+            KeyError: Se a classificação fornecida não for válida
+            ValueError: Se o paciente for None
+        '''
+        if classification not in self._sizes:
+            raise KeyError(f"Classificação '{classification}' inválida. Não existe fila para ela.")
+        if patient is None:
+            raise ValueError("Não é possível adicionar um item 'None'.")
+
+        waiting = _Waiting(patient, classification, self._clock(), next(self._seq))
+        heapq.heappush(self._dispatch_heap, self._dispatch_key(waiting))
+        if classification in self._promotion:
+            heapq.heappush(self._deadline_heap, [waiting.deadline, waiting.seq, waiting])
+
+        self._sizes[classification] += 1
+        self._total += 1
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "Paciente '%s' adicionado à fila %s.", patient.name, classification.name)
+
+    def escalate_overdue(self, now: Optional[float] = None) -> int:
+        '''
+        Sobe uma cor cada paciente que passou do tempo-alvo da sua classificação atual
+
+        O novo prazo (para um eventual próximo escalonamento) conta a partir de agora,
+        com o tempo-alvo da nova cor
+
+        Args:
+            now (Optional[float]): Instante de referência (padrão: o relógio do repositório)
+
+        Returns:
+            int: Quantos pacientes foram escalonados
+        '''
+        if now is None:
+            now = self._clock()
+        heap = self._deadline_heap
+        promoted = 0
+        while heap and heap[0][0] < now:
+            _, _, waiting = heapq.heappop(heap)
+            if waiting.dispatched:
+                continue
+
+            old = waiting.classification
+            new = self._promotion[old]
+            waiting.classification = new
+            self._sizes[old] -= 1
+            self._sizes[new] += 1
+            promoted += 1
+
+            if self.policy == POLICY_STRICT:
+                # A entrada antiga morre no heap de despacho; a nova mantém a ordem de chegada
+                self._stale_dispatch += 1
+                heapq.heappush(self._dispatch_heap, self._dispatch_key(waiting))
+            if new in self._promotion:
+                heapq.heappush(heap, [now + new.target_wait * 60, waiting.seq, waiting])
+
+            if self._events.enabled_for(EventLevel.WARNING):
+                self._events.emit(EventLevel.WARNING, "Repo", "Paciente '%s' passou do tempo-alvo da fila %s e subiu para %s.",
+                                  waiting.patient.name, old.name, new.name)
+
+        self.escalations += promoted
+        self._maybe_rebuild()
+        return promoted
+
+    def get_next_patient(self) -> Optional[Patient]:
+        '''
+        Remove e retorna o próximo paciente segundo a política do repositório
+
+        Returns:
+            Optional[Patient]: O paciente encontrado, ou None se não houver ninguém esperando
+        '''
+        if self.escalate:
+            self.escalate_overdue()
+
+        heap = self._dispatch_heap
+        while heap:
+            item = heapq.heappop(heap)
+            if not self._is_live(item):
+                # Entrada substituída por um escalonamento
+                self._stale_dispatch -= 1
+                continue
+            waiting = item[-1]
+
+            waiting.dispatched = True
+            self._sizes[waiting.classification] -= 1
+            self._total -= 1
+            if self._events.enabled_for(EventLevel.INFO):
+                self._events.emit(EventLevel.INFO, "Repo", "Chamando paciente '%s' da fila %s.",
+                                  waiting.patient.name, waiting.classification.name)
+            return waiting.patient
+
+        self._events.emit(EventLevel.INFO, "Repo", "Todas as filas estão vazias.")
+        return None
+
+    def _maybe_rebuild(self):
+        # Reconstrói os heaps quando as entradas mortas passam das vivas (custo amortizado O(1))
+        if self._stale_dispatch > max(self._total, _MIN_REBUILD):
+            self._dispatch_heap = [item for item in self._dispatch_heap if self._is_live(item)]
+            heapq.heapify(self._dispatch_heap)
+            self._stale_dispatch = 0
+        if len(self._deadline_heap) > 2 * max(self._total, _MIN_REBUILD):
+            self._deadline_heap = [item for item in self._deadline_heap if not item[2].dispatched]
+            heapq.heapify(self._deadline_heap)
+
+    def oldest_wait(self, now: Optional[float] = None) -> Dict[Classification, float]:
+        '''
+        Retorna, por classificação atual, há quantos segundos espera o paciente mais antigo
+
+        Percorre o heap de despacho (O(n)); serve para relatórios, não para o despacho
+
+        Args:
+            now (Optional[float]): Instante de referência (padrão: o relógio do repositório)
+        '''
+        if now is None:
+            now = self._clock()
+        oldest: Dict[Classification, float] = {cls: 0.0 for cls in Classification}
+        for item in self._dispatch_heap:
+            if not self._is_live(item):
+                continue
+            waiting = item[-1]
+            oldest[waiting.classification] = max(oldest[waiting.classification], now - waiting.arrival)
+        return oldest
+
+    def get_status(self) -> Dict[Classification, int]:
+        '''
+        Retorna o número de pacientes por classificação atual (já considerando escalonamentos)
+        '''
+        if self.escalate:
+            self.escalate_overdue()
+        return dict(self._sizes)
@@ -1,22 +1,79 @@
-from typing import Dict, Optional
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from src.domain.classification import Classification
-from src.domain.custom_queue import Fila, EmptyQueueError
+from src.domain.custom_queue import Fila
 from src.domain.patient import Patient
-from src.application.interfaces.i_queue_repository import IQueueRepository
+from src.domain.arrival_index import ArrivalIndex
+from src.domain.queue_position import QueuePosition
+from src.domain.status_snapshot import StatusDelta, StatusSnapshot
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_searchable_queue_repository import ISearchableQueueRepository
+from src.application.interfaces.i_positioned_queue_repository import IPositionedQueueRepository
+from src.application.interfaces.i_versioned_status_repository import IVersionedStatusRepository
+from src.application.interfaces.i_hand_off_queue_repository import IHandOffQueueRepository
 
-class InMemoryQueueRepository(IQueueRepository):
+if TYPE_CHECKING:
+    # Só para as anotações: quem usa métricas já importou o módulo ao criar o QueueMetrics
+    from src.infrastructure.metrics.queue_metrics import QueueMetrics
+
+class InMemoryQueueRepository(ISearchableQueueRepository, IPositionedQueueRepository, IVersionedStatusRepository,
+                              IHandOffQueueRepository):
     '''
-    Implementação em memória da interface IQueueRepository
+    Implementação em memória da interface IQueueRepository (e das capacidades de
+    busca por id, posição, status versionado e entrega provisória)
     
     Gerencia 5 instâncias da classe Fila, uma para cada níveL de classificação do Protocolo de Manchester
+
+    Um índice id do paciente -> (classificação, ordem de chegada) permite encontrar,
+    remover e reclassificar um paciente em espera em O(1), sem percorrer as filas.
+    Cada fila tem ainda um ArrivalIndex com os números de chegada, que dá a posição
+    de um paciente (quantos estão à frente) em O(log n)
+
+    O status é versionado: cada alteração das filas incrementa um número de versão,
+    então get_status_if_changed responde "nada mudou" em O(1), e os assinantes
+    (subscribe_status) recebem só as filas que mudaram, uma entrega por operação
+
+    Com um QueueMetrics, cada cadastro, chamada, remoção e reclassificação é registrado
+    nele (tempo de espera, taxas e profundidade de cada fila)
     '''
 
-    def __init__(self):
-        # Inicializa o repositório criando 5 linhas vazias
+    def __init__(self, events: Optional[EventSink] = None, metrics: Optional["QueueMetrics"] = None):
+        # Inicializa o repositório criando 5 linhas vazias (o sink de eventos é repassado às filas)
+        self._events = events if events is not None else NULL_SINK
+        self._metrics = metrics
         self.queues: Dict[Classification, Fila] = {
-            cls: Fila() for cls in Classification
+            cls: Fila(self._events) for cls in Classification
         }
-        print("[Repo] Repositório em memória inicializado com 5 filas.")
+
+        # Tabela de despacho pré-calculada: posição i -> (classificação, fila), já ordenada
+        # por prioridade (Vermelho -> Azul). O bit i da máscara indica que a fila i tem pacientes
+        self._dispatch_table: List[Tuple[Classification, Fila]] = [
+            (cls, self.queues[cls]) for cls in sorted(Classification, key=lambda c: c.priority)
+        ]
+        self._position_of: Dict[Classification, int] = {
+            cls: index for index, (cls, _) in enumerate(self._dispatch_table)
+        }
+        self._bit_of: Dict[Classification, int] = {
+            cls: 1 << index for cls, index in self._position_of.items()
+        }
+        self._non_empty_mask = 0
+
+        # Índice dos pacientes em espera: id -> (número de chegada global << 3) | posição da fila
+        # na tabela de despacho. Um int em vez de uma tupla: menos memória e nada para o coletor de lixo
+        self._location: Dict[Any, int] = {}
+        self._next_arrival = 0
+        # Números de chegada de cada fila (mesma posição da tabela de despacho), para as consultas de posição
+        self._arrival_index: List[ArrivalIndex] = [ArrivalIndex() for _ in self._dispatch_table]
+
+        # Status versionado: versão atual, fotografia da última versão consultada, assinantes
+        # e os tamanhos da última entrega (para mandar só o que mudou)
+        self._status_version = 0
+        self._status_snapshot: Optional[StatusSnapshot] = None
+        self._subscribers: List[Callable[[StatusDelta], None]] = []
+        self._published_sizes: List[int] = [0] * len(self._dispatch_table)
+        self._status_hold = 0
+        self._events.emit(EventLevel.INFO, "Repo", "Repositório em memória inicializado com 5 filas.")
 
     def add_patient(self, patient: Patient, classification: Classification):
         '''
@@ -28,60 +85,455 @@ class InMemoryQueueRepository(IQueueRepository):
             
         Raises:
             KeyError: Se a classificação fornecida não for válida
+            ValueError: Se o paciente for None ou já estiver esperando em alguma fila
         '''
         try:
-            queue = self.queues[classification]
-            queue.enqueue(patient)
-            print(f"[Repo] Paciente '{patient.name}' adicionado à fila {classification.name}.")
+            position = self._position_of[classification]
+            if patient is not None and patient.id in self._location:
+                raise ValueError(f"O paciente '{patient.name}' (id {patient.id}) já está esperando.")
+            self._dispatch_table[position][1].enqueue(patient)
+            self._location[patient.id] = (self._next_arrival << 3) | position
+            self._arrival_index[position].append(self._next_arrival)
+            if self._metrics is not None:
+                self._metrics.record_arrival(position, self._next_arrival)
+            self._next_arrival += 1
+            self._non_empty_mask |= 1 << position
+            self._status_version += 1
+            if self._subscribers and not self._status_hold:
+                self._publish_status()
+            if self._events.enabled_for(EventLevel.INFO):
+                self._events.emit(EventLevel.INFO, "Repo", "Paciente '%s' adicionado à fila %s.", patient.name, classification.name)
         except KeyError:
             # Erro de programação: A classificação não existe mais no dict
             raise KeyError(f"Classificação '{classification}' inválida. Não existe fila para ela.")
         except ValueError as e:
             # Erro vindo do enqueue, ex: patient: None
-            print(f"Erro ao enfileirar: {e}")
+            self._events.emit(EventLevel.ERROR, "Repo", "Erro ao enfileirar: %s", e)
             raise
           
+    def _peek_next_classification(self) -> Optional[Classification]:
+        # Retorna a classificação da fila que será atendida a seguir (sem remover ninguém)
+        mask = self._non_empty_mask
+        if not mask:
+            return None
+        return self._dispatch_table[(mask & -mask).bit_length() - 1][0]
+
     def get_next_patient(self) -> Optional[Patient]:
         '''
         Busca o próximo paciente na ordem de prioridade (Vermelho -> Azul)
+
+        A fila mais urgente com pacientes é encontrada pelo bit menos significativo
+        ligado da máscara de filas não vazias, sem percorrer as classificações
         
         Returns:
             Optional[Patient]: O paciente encontrado, ou None se todas as
                                filas estiverem vazias
         '''
-        
-        for priority_level in sorted([cls.priority for cls in Classification]):
+        taken = self._dispatch_next()
+        return taken[0] if taken is not None else None
+
+    def take_next_patient(self) -> Optional[Tuple[Patient, Classification, int]]:
+        '''
+        Chama o próximo paciente como get_next_patient, retornando também a sua
+        classificação e o seu número de chegada (para return_patient)
+        '''
+        return self._dispatch_next()
+
+    def _dispatch_next(self) -> Optional[Tuple[Patient, Classification, int]]:
+        # Tira o paciente do início da fila mais urgente: (paciente, classificação, chegada)
+        mask = self._non_empty_mask
+        if not mask:
+            self._events.emit(EventLevel.INFO, "Repo", "Todas as filas estão vazias.")
+            return None
+
+        # Isola o bit menos significativo ligado (fila mais prioritária com pacientes)
+        lowest_bit = mask & -mask
+        position = lowest_bit.bit_length() - 1
+        classification, queue = self._dispatch_table[position]
+
+        patient = queue.dequeue()
+        arrival = self._location.pop(patient.id) >> 3
+        self._arrival_index[position].pop_front()
+        if queue.is_empty():
+            self._non_empty_mask = mask ^ lowest_bit
+        if self._metrics is not None:
+            self._metrics.record_dispatch(position, arrival)
+        self._status_version += 1
+        if self._subscribers and not self._status_hold:
+            self._publish_status()
+
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "Chamando paciente '%s' da fila %s.", patient.name, classification.name)
+        return patient, classification, arrival
+
+    def return_patient(self, patient: Patient, classification: Classification, arrival: int):
+        '''
+        Devolve um paciente retirado por take_next_patient à sua posição original
+
+        O paciente mantém o seu número de chegada e entra à frente de quem chegou
+        depois dele; a busca começa pelo início da fila, então devolver quem acabou
+        de sair do início é O(1)
+
+        Raises:
+            KeyError: Se a classificação não for válida
+            ValueError: Se o paciente já estiver esperando ou o número de chegada for inválido
+        '''
+        try:
+            position = self._position_of[classification]
+        except KeyError:
+            raise KeyError(f"Classificação '{classification}' inválida. Não existe fila para ela.")
+        if patient is None:
+            raise ValueError("Não é possível adicionar um item 'None'.")
+        if patient.id in self._location:
+            raise ValueError(f"O paciente '{patient.name}' (id {patient.id}) já está esperando.")
+        if not 0 <= arrival < self._next_arrival:
+            raise ValueError(f"Número de chegada inválido: {arrival}.")
+
+        location = self._location
+        self._dispatch_table[position][1].insert_ordered(
+            patient, lambda p: arrival if p is patient else location[p.id] >> 3, from_front=True)
+        self._arrival_index[position].insert(arrival)
+        location[patient.id] = (arrival << 3) | position
+        self._non_empty_mask |= 1 << position
+        if self._metrics is not None:
+            self._metrics.record_return(position, arrival)
+        self._status_changed()
+
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "Paciente '%s' devolvido à fila %s.", patient.name, classification.name)
+
+    def add_patients(self, entries: Iterable[Tuple[Patient, Classification]]):
+        '''
+        Adiciona vários pacientes de uma vez
+
+        Os pacientes são agrupados por classificação e cada fila recebe o seu
+        grupo em uma única operação, preservando a ordem de chegada
+
+        Args:
+            entries (Iterable[Tuple[Patient, Classification]]): Pares (paciente, classificação)
+
+        Raises:
+            KeyError: Se alguma classificação não for válida (nenhum paciente é adicionado)
+            ValueError: Se algum paciente for None ou já estiver esperando (nenhum paciente é adicionado)
+        '''
+        position_of = self._position_of
+        groups: List[List[Patient]] = [[] for _ in self._dispatch_table]
+        ids: List[Any] = []
+        positions: List[int] = []
+        for patient, classification in entries:
             try:
-                classification = Classification.get_by_priority(priority_level)
-                queue = self.queues[classification]
-                
-                if not queue.is_empty():
-                    # Fila mais prioritária com pacientes encontrada
-                    patient = queue.dequeue()
-                    print(f"[Repo] Chamando paciente '{patient.name}' da fila {classification.name}.")
-                    return patient
-                    
-            except EmptyQueueError:
-                continue
+                position = position_of[classification]
             except KeyError:
-                # Erro de programação, ex: prioridade 5 não existe
-                print(f"Erro: Nível de prioridade {priority_level} não encontrado.")
-                continue # Pula para a próxima prioridade
+                raise KeyError(f"Classificação '{classification}' inválida. Não existe fila para ela.")
+            if patient is None:
+                raise ValueError("Não é possível adicionar um item 'None'.")
+            groups[position].append(patient)
+            ids.append(patient.id)
+            positions.append(position)
+
+        if len(set(ids)) != len(ids) or not self._location.keys().isdisjoint(ids):
+            raise ValueError("Há pacientes repetidos no lote ou que já estão esperando.")
+
+        for position, patients in enumerate(groups):
+            if patients:
+                self._dispatch_table[position][1].enqueue_many(patients)
+                self._non_empty_mask |= 1 << position
+        # A ordem de chegada segue a ordem do lote, mesmo entre filas diferentes
+        first = self._next_arrival
+        self._location.update(zip(ids, [((first + offset) << 3) | position for offset, position in enumerate(positions)]))
+        self._next_arrival = first + len(ids)
+        arrivals: List[List[int]] = [[] for _ in self._dispatch_table]
+        for offset, position in enumerate(positions):
+            arrivals[position].append(first + offset)
+        for index, queue_arrivals in zip(self._arrival_index, arrivals):
+            index.extend(queue_arrivals)
+        if self._metrics is not None:
+            self._metrics.record_arrivals(positions, first)
+        if ids:
+            self._status_changed()
+
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "%d pacientes adicionados em lote.", len(ids))
+
+    def _restore_waiting(self, entries: List[Tuple[Patient, Classification, int]]):
+        '''
+        Carrega pacientes com números de chegada já atribuídos (recuperação de um
+        repositório persistente), em ordem crescente de chegada
 
-        # Se o loop terminar, todas as filas estão vazias
-        print("[Repo] Todas as filas estão vazias.")
-        return None
+        Diferente de add_patients, os números não são renumerados: quem grava as
+        operações seguintes referindo-se a eles continua coerente com as filas
+        '''
+        groups: List[List[Patient]] = [[] for _ in self._dispatch_table]
+        arrivals: List[List[int]] = [[] for _ in self._dispatch_table]
+        location = self._location
+        for patient, classification, arrival in entries:
+            position = self._position_of[classification]
+            groups[position].append(patient)
+            arrivals[position].append(arrival)
+            location[patient.id] = (arrival << 3) | position
+            if self._metrics is not None:
+                self._metrics.record_arrival(position, arrival)
+        for position, patients in enumerate(groups):
+            if patients:
+                self._dispatch_table[position][1].enqueue_many(patients)
+                self._arrival_index[position].extend(arrivals[position])
+                self._non_empty_mask |= 1 << position
+        if entries:
+            self._next_arrival = max(self._next_arrival, entries[-1][2] + 1)
+            self._status_changed()
+
+    def get_next_patients(self, count: int) -> List[Patient]:
+        '''
+        Chama até 'count' pacientes de uma vez, na ordem de prioridade (Vermelho -> Azul)
+
+        Cada fila é esvaziada em blocos, respeitando a mesma ordem de uma
+        sequência de chamadas a get_next_patient
+
+        Args:
+            count (int): Quantidade máxima de pacientes a chamar
+
+        Returns:
+            List[Patient]: Os pacientes chamados (vazia se todas as filas estiverem vazias)
+        '''
+        patients: List[Patient] = []
+        mask = self._non_empty_mask
+
+        while mask and len(patients) < count:
+            lowest_bit = mask & -mask
+            position = lowest_bit.bit_length() - 1
+            _, queue = self._dispatch_table[position]
+
+            called = queue.dequeue_many(count - len(patients))
+            self._arrival_index[position].pop_front_many(len(called))
+            if self._metrics is not None:
+                location = self._location
+                self._metrics.record_dispatches(position, [location[p.id] >> 3 for p in called])
+            patients.extend(called)
+            if queue.is_empty():
+                mask ^= lowest_bit
+
+        self._non_empty_mask = mask
+        location = self._location
+        for patient in patients:
+            del location[patient.id]
+        if patients:
+            self._status_changed()
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "%d pacientes chamados em lote.", len(patients))
+        return patients
+
+    def find_patient(self, patient_id: Any) -> Optional[Tuple[Patient, Classification]]:
+        '''
+        Procura um paciente em espera pelo id (O(1))
+
+        Returns:
+            Optional[Tuple[Patient, Classification]]: O paciente e a sua fila, ou None
+        '''
+        location = self._location.get(patient_id)
+        if location is None:
+            return None
+        classification, queue = self._dispatch_table[location & 7]
+        return queue.find(patient_id), classification
+
+    def _take(self, patient_id: Any) -> Tuple[Patient, Classification, int]:
+        '''
+        Tira o paciente da sua fila (mantendo a máscara em dia) e retorna
+        (paciente, classificação, número de chegada)
+        '''
+        try:
+            location = self._location.pop(patient_id)
+        except KeyError:
+            raise KeyError(f"Nenhum paciente com id '{patient_id}' está esperando.")
+
+        position = location & 7
+        classification, queue = self._dispatch_table[position]
+        patient = queue.remove(patient_id)
+        self._arrival_index[position].discard(location >> 3)
+        if queue.is_empty():
+            self._non_empty_mask &= ~(1 << position)
+        return patient, classification, location >> 3
+
+    def remove_patient(self, patient_id: Any) -> Patient:
+        '''
+        Remove um paciente em espera de qualquer posição da sua fila (O(1))
+
+        Raises:
+            KeyError: Se nenhum paciente com esse id estiver esperando
+        '''
+        patient, classification, arrival = self._take(patient_id)
+        if self._metrics is not None:
+            self._metrics.record_removal(self._position_of[classification], arrival)
+        self._status_changed()
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "Paciente '%s' removido da fila %s.", patient.name, classification.name)
+        return patient
+
+    def reclassify_patient(self, patient_id: Any, new_classification: Classification,
+                           keep_arrival_order: bool = False) -> Classification:
+        '''
+        Move um paciente em espera para a fila de outra classificação
+
+        Sem 'keep_arrival_order' o paciente vai para o fim da nova fila em O(1), como
+        uma nova chegada. Com ele, o paciente mantém o seu número de chegada e entra
+        na nova fila à frente de quem chegou depois dele: O(k), onde k é o número
+        desses pacientes (O(1) quando ele é o mais recente da nova fila)
+
+        Raises:
+            KeyError: Se nenhum paciente com esse id estiver esperando ou se a
+                      classificação não for válida
+        '''
+        if new_classification not in self.queues:
+            raise KeyError(f"Classificação '{new_classification}' inválida. Não existe fila para ela.")
+        location = self._location.get(patient_id)
+        if location is None:
+            raise KeyError(f"Nenhum paciente com id '{patient_id}' está esperando.")
+        old_classification = self._dispatch_table[location & 7][0]
+        if new_classification is old_classification:
+            return old_classification
+
+        patient, _, old_arrival = self._take(patient_id)
+        arrival = old_arrival
+        position = self._position_of[new_classification]
+        queue = self.queues[new_classification]
+        if keep_arrival_order:
+            # Cada fila está ordenada por número de chegada; o do paciente movido ainda não está no índice
+            location = self._location
+            queue.insert_ordered(patient, lambda p: arrival if p is patient else location[p.id] >> 3)
+            self._arrival_index[position].insert(arrival)
+        else:
+            arrival = self._next_arrival
+            self._next_arrival += 1
+            queue.enqueue(patient)
+            self._arrival_index[position].append(arrival)
+        self._location[patient_id] = (arrival << 3) | position
+        self._non_empty_mask |= self._bit_of[new_classification]
+        if self._metrics is not None:
+            # A espera continua contando desde o cadastro original
+            self._metrics.record_reclassification(self._position_of[old_classification], position, old_arrival, arrival)
+        self._status_changed()
+
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "Paciente '%s' reclassificado de %s para %s.",
+                              patient.name, old_classification.name, new_classification.name)
+        return old_classification
+
+    def get_position(self, patient_id: Any) -> Optional[QueuePosition]:
+        '''
+        Retorna quantos pacientes estão à frente de um paciente em espera, na sua
+        fila e no total (filas mais urgentes são chamadas antes), em O(log n)
+
+        Returns:
+            Optional[QueuePosition]: A posição, ou None se o paciente não estiver esperando
+        '''
+        location = self._location.get(patient_id)
+        if location is None:
+            return None
+        position = location & 7
+        ahead_in_queue = self._arrival_index[position].rank(location >> 3)
+        ahead_of_queue = sum(len(queue) for _, queue in self._dispatch_table[:position])
+        return QueuePosition(self._dispatch_table[position][0], ahead_in_queue, ahead_of_queue + ahead_in_queue)
+
+    def get_positions(self) -> Dict[Any, QueuePosition]:
+        '''
+        Retorna a posição de todos os pacientes em espera (id -> posição) em uma única passada pelas filas
+        '''
+        positions: Dict[Any, QueuePosition] = {}
+        ahead_of_queue = 0
+        for classification, queue in self._dispatch_table:
+            for ahead_in_queue, patient in enumerate(queue):
+                positions[patient.id] = QueuePosition(classification, ahead_in_queue, ahead_of_queue + ahead_in_queue)
+            ahead_of_queue += len(queue)
+        return positions
+
+    # Status versionado
+
+    def _status_changed(self):
+        # Uma operação alterou as filas: nova versão e, se houver assinantes, uma entrega
+        self._status_version += 1
+        if self._subscribers and not self._status_hold:
+            self._publish_status()
+
+    def _current_snapshot(self) -> StatusSnapshot:
+        # A fotografia é montada uma vez por versão e compartilhada entre os leitores
+        snapshot = self._status_snapshot
+        if snapshot is None or snapshot.version != self._status_version:
+            counts = {classification: len(queue) for classification, queue in self._dispatch_table}
+            snapshot = StatusSnapshot(self._status_version, MappingProxyType(counts))
+            self._status_snapshot = snapshot
+        return snapshot
+
+    def _publish_status(self):
+        # Entrega aos assinantes só as filas cujo tamanho mudou desde a última entrega
+        sizes = [len(queue) for _, queue in self._dispatch_table]
+        changes = {
+            classification: size
+            for (classification, _), size, published in zip(self._dispatch_table, sizes, self._published_sizes)
+            if size != published
+        }
+        if not changes:
+            return
+        self._published_sizes = sizes
+        delta = StatusDelta(self._status_version, MappingProxyType(changes), self._current_snapshot().counts)
+        for callback in list(self._subscribers):
+            try:
+                callback(delta)
+            except Exception as e:
+                # Um assinante com erro não pode desfazer nem interromper a operação nas filas
+                self._events.emit(EventLevel.ERROR, "Repo", "Erro em um assinante do status: %s", e)
+
+    def get_status_if_changed(self, since_version: int) -> Optional[StatusSnapshot]:
+        '''
+        Retorna o status com a sua versão, ou None se nada mudou desde 'since_version' (O(1))
+        '''
+        if since_version == self._status_version:
+            return None
+        return self._current_snapshot()
+
+    def subscribe_status(self, callback: Callable[[StatusDelta], None]) -> Callable[[], None]:
+        '''
+        Registra 'callback' para receber as alterações das filas (uma entrega por operação)
+
+        O estado inicial não é entregue: use get_status_if_changed(-1) ao assinar
+
+        Returns:
+            Callable[[], None]: Função que cancela a assinatura
+        '''
+        if not self._subscribers:
+            # Sem assinantes nada era entregue: a referência das próximas entregas é o estado atual
+            self._published_sizes = [len(queue) for _, queue in self._dispatch_table]
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+        return unsubscribe
+
+    @contextmanager
+    def hold_status_updates(self) -> Iterator[None]:
+        '''
+        Agrupa as entregas aos assinantes: as alterações feitas dentro do bloco
+        chegam em uma única entrega no fim dele (blocos podem ser aninhados)
+
+            with repo.hold_status_updates():
+                for patient, classification in chegadas:
+                    repo.add_patient(patient, classification)
+        '''
+        self._status_hold += 1
+        try:
+            yield
+        finally:
+            self._status_hold -= 1
+            if not self._status_hold and self._subscribers:
+                self._publish_status()
 
     def get_status(self) -> Dict[Classification, int]:
         '''
         Retorna o tamanho de cada fila.
-        
+
+        Copia a fotografia da versão atual (ver _current_snapshot), que só é
+        recalculada quando as filas mudam
+
         Returns:
             Dict[Classification, int]: Dicionário (Classificação -> tamanho).
         '''
-
-        status = {
-            classification: queue.size() 
-            for classification, queue in self.queues.items()
-        }
-        return status
+        return dict(self._current_snapshot().counts)
@@ -0,0 +1,583 @@
+import heapq
+import os
+import re
+import struct
+import threading
+import uuid
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.domain.classification import Classification
+from src.domain.patient import Patient, skip_used_ids
+from src.domain.event_sink import EventLevel, EventSink
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+from src.infrastructure.metrics.queue_metrics import QueueMetrics
+
+# Formato binário
+#
+# Journal e snapshot são sequências de registros emoldurados:
+#     [tamanho do payload: u32][crc32 do payload: u32][payload]
+# Um registro incompleto ou com CRC inválido no fim do journal é tratado como
+# escrita interrompida por uma queda e descartado na recuperação
+#
+# Payloads:
+#     ADD        : op, prioridade, chegada (u64), tipo do id, id, tamanho do nome (u16), nome (utf-8)
+#     POP        : op, prioridade
+#     POP_MANY   : op, prioridade, quantidade (u32)
+#     HEADER     : op, geração (u64), total de pacientes (u64)   (primeiro registro do snapshot)
+#     REMOVE     : op, prioridade, tipo do id, id
+#     RECLASSIFY : op, prioridade antiga, prioridade nova, mantém ordem de chegada (0/1), chegada (u64), tipo do id, id
+#     RETURN     : mesmos campos do ADD (paciente chamado que voltou para a fila, na posição em que estava)
+#
+# 'chegada' é o número de chegada do paciente no repositório em memória (o mesmo que
+# ordena cada fila), gravado como está: a reaplicação usa exatamente esses números,
+# então reclassificações que mantêm a ordem e devoluções reconstroem a mesma ordem
+#
+# O snapshot grava os registros ADD dos pacientes em espera na ordem global de chegada
+
+_OP_ADD, _OP_POP, _OP_POP_MANY, _OP_HEADER, _OP_REMOVE, _OP_RECLASSIFY, _OP_RETURN = 1, 2, 3, 4, 5, 6, 7
+_ID_INT, _ID_UUID, _ID_TEXT = 0, 1, 2
+
+_FRAME = struct.Struct("<II")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_U64 = struct.Struct("<Q")
+_HEADER = struct.Struct("<BQQ")
+
+_SNAPSHOT_MAGIC = b"MPSNAP02"
+_JOURNAL_NAME = re.compile(r"^journal-(\d{8})\.log$")
+_SNAPSHOT_NAME = re.compile(r"^snapshot-(\d{8})\.bin$")
+
+FSYNC_POLICIES = ("always", "batch", "never")
+
+
+def _encode_text(value: str, field: str) -> bytes:
+    # Texto com tamanho u16; acima do limite é um erro do chamador, não do journal
+    data = value.encode("utf-8")
+    if len(data) > 0xFFFF:
+        raise ValueError(f"O {field} do paciente tem {len(data)} bytes em UTF-8; o limite do journal é 65535.")
+    return _U16.pack(len(data)) + data
+
+def _encode_id(patient_id: Any) -> bytes:
+    if isinstance(patient_id, uuid.UUID):
+        return bytes((_ID_UUID,)) + patient_id.bytes
+    if isinstance(patient_id, int) and -(1 << 63) <= patient_id < (1 << 63):
+        return bytes((_ID_INT,)) + _I64.pack(patient_id)
+    return bytes((_ID_TEXT,)) + _encode_text(str(patient_id), "id")
+
+def _id_bytes(payload: bytes, offset: int) -> bytes:
+    # Retorna o id codificado (tipo + valor) que começa em 'offset', usado como chave na reaplicação
+    kind = payload[offset]
+    if kind == _ID_UUID:
+        return payload[offset:offset + 17]
+    if kind == _ID_INT:
+        return payload[offset:offset + 9]
+    return payload[offset:offset + 3 + _U16.unpack_from(payload, offset + 1)[0]]
+
+def _encode_patient(patient_id: Any, name: str) -> bytes:
+    # Parte de um payload ADD/RETURN que depende só do paciente (id + nome)
+    return _encode_id(patient_id) + _encode_text(name, "nome")
+
+def _encode_add(priority: int, arrival: int, encoded_patient: bytes, op: int = _OP_ADD) -> bytes:
+    return bytes((op, priority)) + _U64.pack(arrival) + encoded_patient
+
+def _decode_add(payload: bytes) -> Tuple[int, int, Any, str]:
+    # Retorna (prioridade, chegada, id, nome) de um payload ADD
+    priority, arrival, kind = payload[1], _U64.unpack_from(payload, 2)[0], payload[10]
+    offset = 11
+    if kind == _ID_UUID:
+        patient_id = uuid.UUID(bytes=payload[offset:offset + 16])
+        offset += 16
+    elif kind == _ID_INT:
+        patient_id = _I64.unpack_from(payload, offset)[0]
+        offset += 8
+    else:
+        length = _U16.unpack_from(payload, offset)[0]
+        patient_id = payload[offset + 2:offset + 2 + length].decode("utf-8")
+        offset += 2 + length
+    length = _U16.unpack_from(payload, offset)[0]
+    name = payload[offset + 2:offset + 2 + length].decode("utf-8")
+    return priority, arrival, patient_id, name
+
+def _frame(payload: bytes) -> bytes:
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+def _read_frames(data: bytes, start: int = 0) -> Tuple[List[bytes], int]:
+    '''
+    Lê os registros válidos de 'data' a partir de 'start'
+
+    Returns:
+        Tuple[List[bytes], int]: Os payloads lidos e a posição onde os dados
+                                 válidos terminam (o resto é um registro cortado)
+    '''
+    payloads = []
+    view = memoryview(data)
+    offset, end = start, len(data)
+    while offset + _FRAME.size <= end:
+        length, crc = _FRAME.unpack_from(data, offset)
+        body_start = offset + _FRAME.size
+        if body_start + length > end:
+            break
+        payload = bytes(view[body_start:body_start + length])
+        if zlib.crc32(payload) != crc:
+            break
+        payloads.append(payload)
+        offset = body_start + length
+    return payloads, offset
+
+def _fsync_directory(directory: str):
+    # Garante que renomeações/criações de arquivos no diretório sejam duráveis (POSIX)
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class _ReplayState:
+    '''
+    Estado das 5 filas reconstruído a partir de snapshot + journal
+
+    Guarda o payload ADD de cada paciente (indexado pelo id codificado e acompanhado
+    do número de chegada gravado nele), sem decodificar nem criar objetos Patient,
+    para ser usado tanto na recuperação quanto na compactação em segundo plano
+    (que grava os mesmos payloads no snapshot). Cada fila fica ordenada por
+    número de chegada, como as Filas do repositório em memória
+    '''
+
+    def __init__(self):
+        self.queues: Dict[int, "OrderedDict[bytes, Tuple[int, bytes]]"] = {
+            cls.priority: OrderedDict() for cls in Classification
+        }
+
+    def apply(self, payload: bytes):
+        op = payload[0]
+        if op == _OP_ADD:
+            self.queues[payload[1]][_id_bytes(payload, 10)] = (_U64.unpack_from(payload, 2)[0], payload)
+        elif op == _OP_POP:
+            self.queues[payload[1]].popitem(last=False)
+        elif op == _OP_POP_MANY:
+            queue = self.queues[payload[1]]
+            for _ in range(_U32.unpack_from(payload, 2)[0]):
+                queue.popitem(last=False)
+        elif op == _OP_REMOVE:
+            del self.queues[payload[1]][_id_bytes(payload, 2)]
+        elif op == _OP_RECLASSIFY:
+            self._reclassify(payload[1], payload[2], _U64.unpack_from(payload, 4)[0], _id_bytes(payload, 12))
+        elif op == _OP_RETURN:
+            self._return(payload[1], _U64.unpack_from(payload, 2)[0], _id_bytes(payload, 10),
+                         bytes((_OP_ADD,)) + payload[1:])
+        else:
+            raise ValueError(f"Registro de journal desconhecido (op={op}).")
+
+    def _reclassify(self, old_priority: int, new_priority: int, arrival: int, key: bytes):
+        _, add = self.queues[old_priority].pop(key)
+        # O ADD guardado passa a carregar a nova prioridade e a chegada na nova fila (é ele que vai para o snapshot)
+        add = bytes((_OP_ADD, new_priority)) + _U64.pack(arrival) + add[10:]
+
+        # Mesma inserção ordenada da Fila: procura a posição a partir do fim
+        # (O(1) sem 'keep_arrival_order', quando a chegada é a mais recente)
+        queue = self.queues[new_priority]
+        later = []
+        for other_key in reversed(queue):
+            if queue[other_key][0] <= arrival:
+                break
+            later.append(other_key)
+        queue[key] = (arrival, add)
+        for other_key in reversed(later):
+            queue.move_to_end(other_key)
+
+    def _return(self, priority: int, arrival: int, key: bytes, add: bytes):
+        # Recoloca o paciente pela chegada, procurando a posição a partir do início (como return_patient)
+        queue = self.queues[priority]
+        earlier = []
+        for other_key in queue:
+            if queue[other_key][0] >= arrival:
+                break
+            earlier.append(other_key)
+        queue[key] = (arrival, add)
+        queue.move_to_end(key, last=False)
+        for other_key in reversed(earlier):
+            queue.move_to_end(other_key, last=False)
+
+    def ordered_payloads(self) -> Iterator[bytes]:
+        # Payloads ADD de todos os pacientes em espera, na ordem global de chegada
+        for _, payload in heapq.merge(*(queue.values() for queue in self.queues.values())):
+            yield payload
+
+    def total(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+
+class JournaledQueueRepository(InMemoryQueueRepository):
+    '''
+    Repositório em memória que sobrevive a quedas do processo
+
+    Toda operação de escrita (add_patient, get_next_patient, as versões em lote,
+    remove_patient, reclassify_patient, take_next_patient e return_patient) é
+    gravada em um journal binário
+    somente-anexação. A cada 'snapshot_every' registros o journal é rotacionado,
+    e uma thread em segundo plano gera um snapshot compacto das 5 filas a partir
+    dos arquivos já fechados (ela nunca toca no estado em memória, então o despacho
+    não é bloqueado). A thread mantém sua própria cópia compacta das filas (os
+    payloads binários) entre compactações, então cada snapshot só reaplica o
+    journal mais recente
+
+    Na inicialização o estado é reconstruído a partir do último snapshot mais
+    o restante do journal
+
+    Política de fsync ('fsync_policy'):
+    - "always": cada operação é gravada e sincronizada com o disco antes de retornar
+    - "batch": as operações são gravadas e sincronizadas em grupos de 'group_size' (group commit)
+    - "never": gravadas em grupos, mas a sincronização fica a cargo do sistema operacional
+    Em "batch" e "never", uma queda pode perder até 'group_size' - 1 operações; use flush()
+    '''
+
+    def __init__(self,
+                 directory: str,
+                 fsync_policy: str = "batch",
+                 group_size: int = 64,
+                 snapshot_every: int = 100_000,
+                 background_compaction: bool = True,
+                 events: Optional[EventSink] = None,
+                 metrics: Optional[QueueMetrics] = None):
+        '''
+        Args:
+            directory (str): Diretório dos arquivos de journal e snapshot (criado se não existir)
+            fsync_policy (str): "always", "batch" ou "never"
+            group_size (int): Operações por grupo de gravação
+            snapshot_every (int): Registros por arquivo de journal antes de rotacionar (0 = nunca)
+            background_compaction (bool): Gera os snapshots em uma thread separada
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
+            metrics (Optional[QueueMetrics]): Métricas das filas (os pacientes recuperados
+                                              contam como chegadas no momento da recuperação)
+        '''
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Política de fsync inválida: '{fsync_policy}'. Use uma de {FSYNC_POLICIES}.")
+        if group_size < 1:
+            raise ValueError("group_size deve ser maior ou igual a 1.")
+        if snapshot_every < 0:
+            raise ValueError("snapshot_every não pode ser negativo.")
+
+        super().__init__(events, metrics)
+
+        self.directory = directory
+        self._fsync_policy = fsync_policy
+        self._group_size = 1 if fsync_policy == "always" else group_size
+        self._snapshot_every = snapshot_every
+        self._background_compaction = background_compaction
+
+        self._buffer = bytearray()
+        self._buffered = 0
+        self._journal_records = 0
+
+        self._compaction_lock = threading.Lock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._compaction_target = 0
+        self._compaction_state: Optional[_ReplayState] = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._snapshot_gen = 0
+        self._journal_gen = 0
+        self._journal = None
+        self._recover()
+
+    # Arquivos
+
+    def _journal_path(self, gen: int) -> str:
+        return os.path.join(self.directory, f"journal-{gen:08d}.log")
+
+    def _snapshot_path(self, gen: int) -> str:
+        return os.path.join(self.directory, f"snapshot-{gen:08d}.bin")
+
+    def _list_generations(self, pattern: "re.Pattern") -> List[int]:
+        generations = []
+        for name in os.listdir(self.directory):
+            match = pattern.match(name)
+            if match:
+                generations.append(int(match.group(1)))
+        return sorted(generations)
+
+    def _load_snapshot(self, gen: int) -> _ReplayState:
+        state = _ReplayState()
+        with open(self._snapshot_path(gen), "rb") as snapshot_file:
+            data = snapshot_file.read()
+
+        if not data.startswith(_SNAPSHOT_MAGIC):
+            raise ValueError(f"Snapshot '{self._snapshot_path(gen)}' inválido.")
+        payloads, _ = _read_frames(data, len(_SNAPSHOT_MAGIC))
+        if not payloads or payloads[0][0] != _OP_HEADER:
+            raise ValueError(f"Snapshot '{self._snapshot_path(gen)}' sem cabeçalho.")
+
+        _, _, expected_total = _HEADER.unpack(payloads[0])
+        for payload in payloads[1:]:
+            state.apply(payload)
+        if state.total() != expected_total:
+            raise ValueError(f"Snapshot '{self._snapshot_path(gen)}' incompleto.")
+        return state
+
+    def _replay_journal(self, gen: int, state: _ReplayState, truncate_tail: bool = False) -> int:
+        # Aplica um arquivo de journal ao estado e retorna quantos registros ele tinha
+        path = self._journal_path(gen)
+        with open(path, "rb") as journal_file:
+            data = journal_file.read()
+
+        payloads, valid_end = _read_frames(data)
+        for payload in payloads:
+            state.apply(payload)
+
+        if truncate_tail and valid_end < len(data):
+            # Descarta o registro cortado por uma queda durante a gravação
+            with open(path, "r+b") as journal_file:
+                journal_file.truncate(valid_end)
+            self._events.emit(EventLevel.WARNING, "Journal", "Registro incompleto descartado no fim de '%s'.", path)
+        return len(payloads)
+
+    # Recuperação
+
+    def _recover(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(".tmp"):
+                os.remove(os.path.join(self.directory, name))
+
+        snapshots = self._list_generations(_SNAPSHOT_NAME)
+        journals = self._list_generations(_JOURNAL_NAME)
+
+        self._snapshot_gen = snapshots[-1] if snapshots else 0
+        state = self._load_snapshot(self._snapshot_gen) if snapshots else _ReplayState()
+
+        pending = [gen for gen in journals if gen >= self._snapshot_gen]
+        self._journal_gen = pending[-1] if pending else self._snapshot_gen
+        for gen in pending:
+            records = self._replay_journal(gen, state, truncate_tail=(gen == self._journal_gen))
+            if gen == self._journal_gen:
+                self._journal_records = records
+
+        # Carrega as filas reconstruídas no repositório em memória, na ordem global de chegada
+        # (sem passar pelo add_patients desta classe, que gravaria tudo de novo no journal)
+        by_priority = {cls.priority: cls for cls in Classification}
+        entries = []
+        max_int_id = 0
+        for payload in state.ordered_payloads():
+            priority, arrival, patient_id, name = _decode_add(payload)
+            entries.append((Patient.restore(name, patient_id), by_priority[priority], arrival))
+            if type(patient_id) is int and patient_id > max_int_id:
+                max_int_id = patient_id
+        if entries:
+            # Os números de chegada gravados são mantidos: os próximos registros dependem deles
+            self._restore_waiting(entries)
+
+        # Com a estratégia de contador, os novos pacientes não podem reutilizar os ids recuperados
+        skip_used_ids(max_int_id)
+
+        self._compaction_target = self._snapshot_gen
+        self._journal = open(self._journal_path(self._journal_gen), "ab")
+        _fsync_directory(self.directory)
+
+        self._events.emit(EventLevel.INFO, "Journal", "Estado recuperado: %d pacientes (snapshot %d, %d journals).",
+                          state.total(), self._snapshot_gen, len(pending))
+
+    # Gravação do journal
+
+    def _append(self, payload: bytes):
+        self._buffer += _frame(payload)
+        self._buffered += 1
+        self._journal_records += 1
+
+        if self._buffered >= self._group_size:
+            self._write_buffer()
+        if self._snapshot_every and self._journal_records >= self._snapshot_every:
+            self._rotate()
+
+    def _write_buffer(self):
+        if self._buffer:
+            self._journal.write(self._buffer)
+            self._journal.flush()
+            if self._fsync_policy != "never":
+                os.fsync(self._journal.fileno())
+            self._buffer.clear()
+        self._buffered = 0
+
+    def flush(self):
+        '''
+        Grava e sincroniza com o disco as operações pendentes do grupo atual
+        '''
+        self._write_buffer()
+        os.fsync(self._journal.fileno())
+
+    def _rotate(self):
+        # Fecha o journal atual, abre o próximo e agenda o snapshot que cobre os anteriores
+        self.flush()
+        self._journal.close()
+        self._journal_gen += 1
+        self._journal_records = 0
+        self._journal = open(self._journal_path(self._journal_gen), "ab")
+        _fsync_directory(self.directory)
+        self._schedule_compaction(self._journal_gen)
+
+    # Compactação (snapshots)
+
+    def _schedule_compaction(self, target_gen: int):
+        with self._compaction_lock:
+            self._compaction_target = max(self._compaction_target, target_gen)
+            if not self._background_compaction:
+                run_now = True
+            elif self._compaction_thread is None:
+                self._compaction_thread = threading.Thread(target=self._compaction_loop, name="journal-compaction", daemon=True)
+                self._compaction_thread.start()
+                run_now = False
+            else:
+                run_now = False
+        if run_now:
+            self._compaction_loop()
+
+    def _compaction_loop(self):
+        while True:
+            with self._compaction_lock:
+                target = self._compaction_target
+                if target <= self._snapshot_gen:
+                    self._release_compaction_thread()
+                    return
+            try:
+                self._compact_to(target)
+            except Exception as e:
+                self._events.emit(EventLevel.ERROR, "Journal", "Falha na compactação para o snapshot %d: %s", target, e)
+                with self._compaction_lock:
+                    # O estado guardado pode ter sido alterado pela metade: recarrega do disco na próxima vez
+                    self._compaction_state = None
+                    self._release_compaction_thread()
+                return
+
+    def _release_compaction_thread(self):
+        # Chamado com o lock adquirido: permite que a próxima rotação inicie uma nova thread
+        if threading.current_thread() is self._compaction_thread:
+            self._compaction_thread = None
+
+    def _compact_to(self, target_gen: int):
+        '''
+        Gera o snapshot 'target_gen' (estado após todos os journals anteriores a ele)
+        usando apenas arquivos já fechados, e remove os arquivos que ele substitui
+        '''
+        base_gen = self._snapshot_gen
+        state = self._compaction_state
+        if state is None:
+            state = self._load_snapshot(base_gen) if os.path.exists(self._snapshot_path(base_gen)) else _ReplayState()
+        for gen in range(base_gen, target_gen):
+            if os.path.exists(self._journal_path(gen)):
+                self._replay_journal(gen, state)
+
+        temp_path = self._snapshot_path(target_gen) + ".tmp"
+        with open(temp_path, "wb") as snapshot_file:
+            snapshot_file.write(_SNAPSHOT_MAGIC)
+            snapshot_file.write(_frame(_HEADER.pack(_OP_HEADER, target_gen, state.total())))
+            snapshot_file.write(b"".join(map(_frame, state.ordered_payloads())))
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temp_path, self._snapshot_path(target_gen))
+        _fsync_directory(self.directory)
+
+        with self._compaction_lock:
+            self._snapshot_gen = target_gen
+            # Mantém o estado em memória: a próxima compactação só reaplica os journals novos
+            self._compaction_state = state
+
+        # Remove snapshots e journals cobertos pelo novo snapshot
+        for gen in self._list_generations(_SNAPSHOT_NAME):
+            if gen < target_gen:
+                os.remove(self._snapshot_path(gen))
+        for gen in self._list_generations(_JOURNAL_NAME):
+            if gen < target_gen:
+                os.remove(self._journal_path(gen))
+
+        self._events.emit(EventLevel.INFO, "Journal", "Snapshot %d gerado com %d pacientes.", target_gen, state.total())
+
+    def compact(self):
+        '''
+        Rotaciona o journal e gera um snapshot agora, aguardando o término
+        '''
+        self._rotate()
+        self.wait_for_compaction()
+
+    def wait_for_compaction(self):
+        # Aguarda a thread de compactação terminar (se houver uma em andamento)
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+
+    def close(self):
+        '''
+        Grava as operações pendentes, aguarda a compactação e fecha o journal
+        '''
+        if self._journal is not None and not self._journal.closed:
+            self.flush()
+            self.wait_for_compaction()
+            self._journal.close()
+
+    # IQueueRepository
+    #
+    # O paciente é codificado antes de alterar a memória: um id ou nome que não cabe no
+    # journal levanta ValueError sem deixar o paciente na fila sem o registro correspondente
+
+    def add_patient(self, patient: Patient, classification: Classification):
+        encoded = _encode_patient(patient.id, patient.name) if patient is not None else b""
+        super().add_patient(patient, classification)
+        self._append(_encode_add(classification.priority, self._location[patient.id] >> 3, encoded))
+
+    def add_patients(self, entries: Iterable[Tuple[Patient, Classification]]):
+        entries = list(entries)
+        encoded = [_encode_patient(patient.id, patient.name) if patient is not None else b"" for patient, _ in entries]
+        super().add_patients(entries)
+        location = self._location
+        for (patient, classification), encoded_patient in zip(entries, encoded):
+            self._append(_encode_add(classification.priority, location[patient.id] >> 3, encoded_patient))
+
+    def get_next_patient(self) -> Optional[Patient]:
+        classification = self._peek_next_classification()
+        patient = super().get_next_patient()
+        if patient is not None:
+            self._append(bytes((_OP_POP, classification.priority)))
+        return patient
+
+    def take_next_patient(self) -> Optional[Tuple[Patient, Classification, int]]:
+        taken = super().take_next_patient()
+        if taken is not None:
+            self._append(bytes((_OP_POP, taken[1].priority)))
+        return taken
+
+    def return_patient(self, patient: Patient, classification: Classification, arrival: int):
+        encoded = _encode_patient(patient.id, patient.name) if patient is not None else b""
+        super().return_patient(patient, classification, arrival)
+        self._append(_encode_add(classification.priority, arrival, encoded, _OP_RETURN))
+
+    def get_next_patients(self, count: int) -> List[Patient]:
+        sizes_before = {cls: queue.size() for cls, queue in self.queues.items()}
+        patients = super().get_next_patients(count)
+
+        # Um registro POP_MANY por fila que perdeu pacientes, na ordem de prioridade
+        for cls, _ in self._dispatch_table:
+            removed = sizes_before[cls] - self.queues[cls].size()
+            if removed:
+                self._append(bytes((_OP_POP_MANY, cls.priority)) + _U32.pack(removed))
+        return patients
+
+    def remove_patient(self, patient_id: Any) -> Patient:
+        found = self.find_patient(patient_id)
+        patient = super().remove_patient(patient_id)
+        self._append(bytes((_OP_REMOVE, found[1].priority)) + _encode_id(patient.id))
+        return patient
+
+    def reclassify_patient(self, patient_id: Any, new_classification: Classification,
+                           keep_arrival_order: bool = False) -> Classification:
+        old_classification = super().reclassify_patient(patient_id, new_classification, keep_arrival_order)
+        if old_classification is not new_classification:
+            patient = self.find_patient(patient_id)[0]
+            self._append(bytes((_OP_RECLASSIFY, old_classification.priority, new_classification.priority,
+                                int(keep_arrival_order))) + _U64.pack(self._location[patient.id] >> 3)
+                         + _encode_id(patient.id))
+        return old_classification
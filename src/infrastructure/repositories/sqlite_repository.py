@@ -0,0 +1,304 @@
+import sqlite3
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from src.domain.classification import Classification
+from src.domain.patient import Patient, skip_used_ids
+from src.domain.event_sink import EventLevel, EventSink, NULL_SINK
+from src.application.interfaces.i_queue_repository import IQueueRepository
+
+# Tipos de id guardados na coluna 'id_kind' (o Patient aceita ids de estratégias diferentes)
+_ID_INT, _ID_UUID, _ID_TEXT = 0, 1, 2
+
+_SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS waiting_patients (
+           seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+           priority   INTEGER NOT NULL,
+           patient_id BLOB NOT NULL,
+           id_kind    INTEGER NOT NULL,
+           name       TEXT NOT NULL
+       )''',
+    # Índice de despacho: o próximo paciente é a primeira entrada em (prioridade, chegada)
+    '''CREATE INDEX IF NOT EXISTS idx_waiting_priority_seq
+           ON waiting_patients (priority, seq)''',
+    # Contadores por fila, mantidos por triggers na mesma transação do INSERT/DELETE
+    '''CREATE TABLE IF NOT EXISTS queue_counters (
+           priority INTEGER PRIMARY KEY,
+           size     INTEGER NOT NULL
+       )''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_waiting_insert AFTER INSERT ON waiting_patients
+       BEGIN
+           UPDATE queue_counters SET size = size + 1 WHERE priority = NEW.priority;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_waiting_delete AFTER DELETE ON waiting_patients
+       BEGIN
+           UPDATE queue_counters SET size = size - 1 WHERE priority = OLD.priority;
+       END''',
+)
+
+# Instruções fixas: o sqlite3 mantém as instruções preparadas em cache pelo texto do SQL
+_SQL_INSERT = "INSERT INTO waiting_patients (priority, patient_id, id_kind, name) VALUES (?, ?, ?, ?)"
+_SQL_POP_NEXT = (
+    "DELETE FROM waiting_patients WHERE seq = "
+    "(SELECT seq FROM waiting_patients ORDER BY priority, seq LIMIT 1) "
+    "RETURNING priority, patient_id, id_kind, name"
+)
+_SQL_POP_MANY = (
+    "DELETE FROM waiting_patients WHERE seq IN "
+    "(SELECT seq FROM waiting_patients ORDER BY priority, seq LIMIT ?) "
+    "RETURNING seq, priority, patient_id, id_kind, name"
+)
+_SQL_COUNTERS = "SELECT priority, size FROM queue_counters"
+
+
+def _encode_id(patient_id: Any) -> Tuple[Any, int]:
+    # Converte o id do paciente para um valor que o SQLite guarda sem perda
+    if isinstance(patient_id, uuid.UUID):
+        return patient_id.bytes, _ID_UUID
+    if isinstance(patient_id, int) and -(1 << 63) <= patient_id < (1 << 63):
+        return patient_id, _ID_INT
+    return str(patient_id), _ID_TEXT
+
+def _decode_id(value: Any, kind: int) -> Any:
+    if kind == _ID_UUID:
+        return uuid.UUID(bytes=value)
+    return value
+
+
+class SqliteQueueRepository(IQueueRepository):
+    '''
+    Implementação durável da interface IQueueRepository usando sqlite3 (biblioteca padrão)
+
+    Os pacientes em espera ficam em uma única tabela, e o próximo paciente é
+    encontrado por uma consulta indexada em (prioridade, ordem de chegada).
+    O banco usa o modo WAL, e as escritas podem ser agrupadas em uma transação
+    a cada 'commit_every' operações (group commit)
+
+    Com commit_every > 1, uma queda do processo pode perder até commit_every - 1
+    operações ainda não confirmadas; use flush() para confirmar antes disso
+
+    Outras conexões (ou processos) podem usar o mesmo arquivo: os tamanhos das filas
+    vêm da tabela queue_counters, mantida por triggers, e a cópia em memória é relida
+    no início de cada transação de escrita e em get_status fora de uma transação.
+    Enquanto um grupo está aberto, esta conexão segura o lock de escrita do banco,
+    então a cópia não pode ficar desatualizada. Uma operação que falha é desfeita
+    (sozinha, se houver outras do grupo pendentes) e a exceção é repassada
+    '''
+
+    def __init__(self,
+                 path: str,
+                 commit_every: int = 1,
+                 synchronous: str = "NORMAL",
+                 events: Optional[EventSink] = None):
+        '''
+        Args:
+            path (str): Caminho do arquivo do banco (":memory:" para testes)
+            commit_every (int): Número de operações de escrita por transação
+            synchronous (str): PRAGMA synchronous ("OFF", "NORMAL" ou "FULL")
+            events (Optional[EventSink]): Destino dos eventos (padrão: desligado)
+        '''
+        if commit_every < 1:
+            raise ValueError("commit_every deve ser maior ou igual a 1.")
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Valor de synchronous inválido: '{synchronous}'.")
+
+        self._events = events if events is not None else NULL_SINK
+        self._commit_every = commit_every
+        self._pending_writes = 0
+
+        # isolation_level=None: as transações são controladas manualmente (BEGIN/COMMIT)
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO queue_counters (priority, size) VALUES (?, 0)",
+            [(cls.priority,) for cls in Classification]
+        )
+
+        self._by_priority: Dict[int, Classification] = {cls.priority: cls for cls in Classification}
+
+        # Cópia em memória dos contadores (relida a cada transação; ver _reload_counters)
+        self._sizes: Dict[int, int] = {}
+        self._total = 0
+        self._reload_counters()
+
+        # Com a estratégia de contador, os novos pacientes não podem reutilizar os ids já no banco
+        max_int_id = self._conn.execute(
+            "SELECT MAX(patient_id) FROM waiting_patients WHERE id_kind = ?", (_ID_INT,)
+        ).fetchone()[0]
+        if max_int_id is not None:
+            skip_used_ids(max_int_id)
+
+        self._events.emit(EventLevel.INFO, "Repo", "Repositório SQLite inicializado em '%s' (%d pacientes em espera).", path, self._total)
+
+    # Controle de transação (group commit)
+
+    def _reload_counters(self):
+        # Lê os contadores mantidos pelos triggers (incluem as escritas de outras conexões)
+        self._sizes = dict(self._conn.execute(_SQL_COUNTERS).fetchall())
+        self._total = sum(self._sizes.values())
+
+    @contextmanager
+    def _write(self):
+        '''
+        Envolve uma operação de escrita: abre a transação do grupo (relendo os contadores)
+        e, se a operação falhar, desfaz só ela e repassa a exceção. Quem usa chama
+        _end_write com o número de operações gravadas
+        '''
+        if not self._conn.in_transaction:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._reload_counters()
+        # Com outras operações do grupo pendentes, um savepoint preserva essas operações
+        savepoint = self._pending_writes > 0
+        if savepoint:
+            self._conn.execute("SAVEPOINT queue_write")
+        try:
+            yield
+        except BaseException:
+            try:
+                if savepoint:
+                    self._conn.execute("ROLLBACK TO queue_write")
+                    self._conn.execute("RELEASE queue_write")
+                    self._reload_counters()
+                elif self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                    self._pending_writes = 0
+            except sqlite3.Error as rollback_error:
+                self._events.emit(EventLevel.ERROR, "Repo", "Falha ao desfazer a operação: %s", rollback_error)
+            raise
+        if savepoint:
+            self._conn.execute("RELEASE queue_write")
+
+    def _end_write(self, operations: int = 1):
+        # Uma transação aberta sem nenhuma escrita (ex: filas vazias) também é encerrada
+        self._pending_writes += operations
+        if self._pending_writes >= self._commit_every or not self._pending_writes:
+            self.flush()
+
+    def flush(self):
+        '''
+        Confirma (COMMIT) as operações pendentes do grupo atual
+        '''
+        if self._conn.in_transaction:
+            self._conn.execute("COMMIT")
+        self._pending_writes = 0
+
+    def close(self):
+        '''
+        Confirma as operações pendentes e fecha a conexão
+        '''
+        self.flush()
+        self._conn.close()
+
+    # IQueueRepository
+
+    def add_patient(self, patient: Patient, classification: Classification):
+        '''
+        Adiciona um paciente à fila correta (uma linha na tabela de espera)
+
+        Raises:
+            KeyError: Se a classificação fornecida não for válida
+            ValueError: Se o paciente for None
+        '''
+        if not isinstance(classification, Classification):
+            raise KeyError(f"Classificação '{classification}' inválida. Não existe fila para ela.")
+        if patient is None:
+            raise ValueError("Não é possível adicionar um item 'None'.")
+
+        patient_id, id_kind = _encode_id(patient.id)
+        with self._write():
+            self._conn.execute(_SQL_INSERT, (classification.priority, patient_id, id_kind, patient.name))
+        self._sizes[classification.priority] += 1
+        self._total += 1
+        self._end_write()
+
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "Paciente '%s' adicionado à fila %s.", patient.name, classification.name)
+
+    def add_patients(self, entries: Iterable[Tuple[Patient, Classification]]):
+        '''
+        Adiciona vários pacientes em uma única instrução preparada (executemany)
+
+        Raises:
+            KeyError: Se alguma classificação não for válida (nenhum paciente é adicionado)
+            ValueError: Se algum paciente for None (nenhum paciente é adicionado)
+        '''
+        rows = []
+        for patient, classification in entries:
+            if not isinstance(classification, Classification):
+                raise KeyError(f"Classificação '{classification}' inválida. Não existe fila para ela.")
+            if patient is None:
+                raise ValueError("Não é possível adicionar um item 'None'.")
+            patient_id, id_kind = _encode_id(patient.id)
+            rows.append((classification.priority, patient_id, id_kind, patient.name))
+
+        if not rows:
+            return
+
+        with self._write():
+            self._conn.executemany(_SQL_INSERT, rows)
+        for priority, *_ in rows:
+            self._sizes[priority] += 1
+        self._total += len(rows)
+        self._end_write(len(rows))
+
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "%d pacientes adicionados em lote.", len(rows))
+
+    def get_next_patient(self) -> Optional[Patient]:
+        '''
+        Remove e retorna o próximo paciente (Vermelho -> Azul, por ordem de chegada)
+        com um único DELETE ... RETURNING sobre o índice (prioridade, chegada)
+        '''
+        with self._write():
+            row = self._conn.execute(_SQL_POP_NEXT).fetchone() if self._total else None
+        if row is None:
+            # Filas vazias (possivelmente esvaziadas por outra conexão)
+            self._end_write(0)
+            self._events.emit(EventLevel.INFO, "Repo", "Todas as filas estão vazias.")
+            return None
+
+        priority, patient_id, id_kind, name = row
+        self._sizes[priority] -= 1
+        self._total -= 1
+        self._end_write()
+
+        patient = Patient.restore(name, _decode_id(patient_id, id_kind))
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "Chamando paciente '%s' da fila %s.", name, self._by_priority[priority].name)
+        return patient
+
+    def get_next_patients(self, count: int) -> List[Patient]:
+        '''
+        Remove e retorna até 'count' pacientes em um único DELETE ... RETURNING
+        '''
+        if count <= 0:
+            return []
+
+        with self._write():
+            rows = self._conn.execute(_SQL_POP_MANY, (count,)).fetchall() if self._total else []
+        for _, priority, *_ in rows:
+            self._sizes[priority] -= 1
+        self._total -= len(rows)
+        self._end_write(len(rows))
+
+        # A ordem do RETURNING não é garantida: reordena por (prioridade, chegada)
+        rows.sort(key=lambda row: (row[1], row[0]))
+        patients = [Patient.restore(name, _decode_id(patient_id, id_kind)) for _, _, patient_id, id_kind, name in rows]
+
+        if self._events.enabled_for(EventLevel.INFO):
+            self._events.emit(EventLevel.INFO, "Repo", "%d pacientes chamados em lote.", len(patients))
+        return patients
+
+    def get_status(self) -> Dict[Classification, int]:
+        '''
+        Retorna o tamanho de cada fila a partir dos contadores mantidos (sem COUNT(*))
+
+        Fora de uma transação os contadores são relidos (5 linhas), para incluir as
+        escritas de outras conexões; dentro dela a cópia em memória já está em dia
+        '''
+        if not self._conn.in_transaction:
+            self._reload_counters()
+        return {cls: self._sizes[priority] for priority, cls in self._by_priority.items()}
@@ -0,0 +1,282 @@
+'''
+Gerador de carga sintética: exercita os casos de uso reais (cadastro, chamada e
+status) com tráfego em malha aberta e mostra as latências a cada segundo
+
+Malha aberta: cada fluxo (cadastros, chamadas, leituras de status) tem os seus
+instantes agendados pela taxa configurada, independente de quanto as operações
+anteriores demoraram. Se o sistema não der conta, as operações atrasam e o atraso
+aparece na latência de resposta (medida a partir do instante agendado), em vez de
+a carga diminuir sozinha
+
+Para cada tipo de operação são medidas duas latências, em histogramas no estilo HDR:
+- serviço: só a execução do caso de uso
+- resposta: do instante agendado até o fim da execução (inclui a espera na fila do gerador)
+
+Uso (na raiz do projeto):
+    python -m src.presentation.console.load_generator --rate 500 --call-rate 480 --duration 30
+    python -m src.presentation.console.load_generator --rate 2000 --mix grave --repository concurrent --preload 100000
+    python -m src.presentation.console.load_generator --rate 300 --mix 5:15:35:35:10 --arrivals uniform
+'''
+import argparse
+import heapq
+import random
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.domain.patient import Patient
+from src.domain.classification import Classification
+from src.application.interfaces.i_queue_repository import IQueueRepository
+from src.application.simulation.mixes import MIX_PRESETS
+from src.application.use_cases.register_patient import RegisterPatientUseCase
+from src.application.use_cases.call_next_patient import CallNextPatientUseCase
+from src.application.use_cases.get_queues_status import GetQueuesStatusUseCases
+from src.infrastructure.metrics.histogram import LatencyHistogram
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+from src.infrastructure.repositories.concurrent_repository import ConcurrentQueueRepository
+from src.infrastructure.repositories.deadline_repository import DeadlineQueueRepository
+
+REPOSITORIES: Dict[str, Callable[[], IQueueRepository]] = {
+    "in-memory": InMemoryQueueRepository,
+    "concurrent": ConcurrentQueueRepository,
+    "deadline": DeadlineQueueRepository,
+}
+
+# Tipos de operação (fluxos da carga)
+REGISTER = "cadastro"
+CALL = "chamada"
+STATUS = "status"
+OPERATIONS = (REGISTER, CALL, STATUS)
+
+_COLORS = tuple(sorted(Classification, key=lambda c: c.priority))
+
+
+def _parse_mix(text: str) -> Tuple[float, ...]:
+    # Aceita um nome predefinido ("típico", "grave", "leve") ou os 5 pesos "v:l:a:vd:az"
+    if text in MIX_PRESETS:
+        return MIX_PRESETS[text]
+    try:
+        weights = tuple(float(weight) for weight in text.split(":"))
+    except ValueError:
+        weights = ()
+    if len(weights) != len(_COLORS) or any(weight < 0 for weight in weights) or sum(weights) <= 0:
+        raise argparse.ArgumentTypeError(f"Distribuição '{text}' inválida. Use {sorted(MIX_PRESETS)} ou 5 pesos v:l:a:vd:az.")
+    return weights
+
+
+class _Stream:
+    # Um fluxo da carga: o tipo de operação e o sorteio do intervalo até a próxima (ns)
+    __slots__ = ("operation", "interval")
+
+    def __init__(self, operation: str, rate: float, poisson: bool, rng: random.Random):
+        self.operation = operation
+        mean_ns = 1e9 / rate
+        if poisson:
+            self.interval = lambda: int(rng.expovariate(1.0) * mean_ns)
+        else:
+            self.interval = lambda: int(mean_ns)
+
+
+class LoadGenerator:
+    '''
+    Executa a carga em malha aberta sobre os casos de uso e acumula as latências
+
+    Todas as operações rodam na thread atual, na ordem dos instantes agendados;
+    os histogramas do intervalo corrente são somados aos totais e zerados a cada relatório
+    '''
+
+    def __init__(self, queue_repo: IQueueRepository, rate: float, call_rate: float, status_rate: float,
+                 mix: Tuple[float, ...], poisson: bool = True, seed: int = 0):
+        '''
+        Args:
+            queue_repo (IQueueRepository): Repositório exercitado pelos casos de uso
+            rate (float): Cadastros por segundo
+            call_rate (float): Chamadas por segundo
+            status_rate (float): Leituras de status por segundo
+            mix (Tuple[float, ...]): Pesos das cores dos cadastros (Vermelho -> Azul)
+            poisson (bool): Intervalos exponenciais (Poisson) ou uniformes
+            seed (int): Semente dos sorteios
+        '''
+        self._rng = random.Random(seed)
+        self._register = RegisterPatientUseCase(queue_repo)
+        self._call_next = CallNextPatientUseCase(queue_repo)
+        self._status = GetQueuesStatusUseCases(queue_repo)
+        self._cumulative = list(accumulate(mix))
+        self._streams = [
+            _Stream(operation, operation_rate, poisson, self._rng)
+            for operation, operation_rate in ((REGISTER, rate), (CALL, call_rate), (STATUS, status_rate))
+            if operation_rate > 0
+        ]
+        if not self._streams:
+            raise ValueError("Pelo menos uma das taxas deve ser positiva.")
+
+        self.service = {operation: LatencyHistogram() for operation in OPERATIONS}
+        self.response = {operation: LatencyHistogram() for operation in OPERATIONS}
+        self.total_service = {operation: LatencyHistogram() for operation in OPERATIONS}
+        self.total_response = {operation: LatencyHistogram() for operation in OPERATIONS}
+        self.empty_calls = 0
+        # Atraso do gerador no intervalo: quanto a operação mais atrasada começou depois do agendado (ns)
+        self.max_lag = 0
+        self.final_lag = 0
+        self.last_status: Dict[Classification, int] = {}
+        self._registered = 0
+
+    def _classification(self) -> Classification:
+        return _COLORS[bisect_right(self._cumulative, self._rng.random() * self._cumulative[-1])]
+
+    def _execute(self, operation: str) -> int:
+        # Executa a operação e devolve o instante (ns) em que ela começou
+        if operation == REGISTER:
+            self._registered += 1
+            patient = Patient(f"Carga {self._registered}")
+            classification = self._classification()
+            start = time.perf_counter_ns()
+            self._register.execute(patient, classification)
+        elif operation == CALL:
+            start = time.perf_counter_ns()
+            if self._call_next.execute() is None:
+                self.empty_calls += 1
+        else:
+            start = time.perf_counter_ns()
+            self.last_status = self._status.execute()
+        return start
+
+    def run(self, duration: float, report: Optional[Callable[[float, "LoadGenerator"], None]] = None):
+        '''
+        Executa a carga por 'duration' segundos (Ctrl+C encerra antes, mantendo os totais)
+
+        Args:
+            duration (float): Duração da carga em segundos
+            report (Optional[Callable]): Chamado a cada segundo com (segundos decorridos, gerador),
+                                         antes de os histogramas do intervalo serem zerados
+        '''
+        clock = time.perf_counter_ns
+        begin = clock()
+        end = begin + int(duration * 1e9)
+        next_report = begin + 1_000_000_000
+        heap: List[Tuple[int, int]] = [(begin + stream.interval(), index) for index, stream in enumerate(self._streams)]
+        heapq.heapify(heap)
+
+        try:
+            while heap[0][0] < end:
+                scheduled, index = heap[0]
+                now = clock()
+                if now >= end:
+                    # Sistema não acompanhou a taxa: o que ainda estava agendado fica como atraso final
+                    self.final_lag = now - scheduled
+                    break
+                if now >= next_report:
+                    self._close_interval(now - begin, report)
+                    next_report += 1_000_000_000
+                    continue
+                if scheduled > now:
+                    wait = min(scheduled, next_report) - now
+                    # Abaixo de 0,2 ms o sleep do sistema erra mais do que a espera: repete o laço
+                    if wait > 200_000:
+                        time.sleep(wait / 1e9)
+                    continue
+
+                stream = self._streams[index]
+                heapq.heapreplace(heap, (scheduled + stream.interval(), index))
+                start = self._execute(stream.operation)
+                done = clock()
+                if start - scheduled > self.max_lag:
+                    self.max_lag = start - scheduled
+                self.service[stream.operation].record(done - start)
+                self.response[stream.operation].record(done - scheduled)
+        except KeyboardInterrupt:
+            pass
+        self._close_interval(clock() - begin, report)
+
+    def _close_interval(self, elapsed_ns: int, report: Optional[Callable[[float, "LoadGenerator"], None]]):
+        if report is not None:
+            report(elapsed_ns / 1e9, self)
+        for operation in OPERATIONS:
+            self.total_service[operation].merge(self.service[operation])
+            self.total_response[operation].merge(self.response[operation])
+            self.service[operation].reset()
+            self.response[operation].reset()
+        self.max_lag = 0
+
+
+def _micros(value_ns: int) -> str:
+    return f"{value_ns / 1000:.1f}"
+
+
+def _latency_cells(histogram: LatencyHistogram) -> str:
+    if histogram.count == 0:
+        return f"{'—':>29}"
+    p50, p90, p99 = histogram.percentiles(50, 90, 99)
+    return f"{_micros(p50):>6} {_micros(p90):>6} {_micros(p99):>7} {_micros(histogram.max):>8}"
+
+
+def _print_header():
+    groups = " | ".join(f"{operation + ' p50/p90/p99/máx (µs)':^29}" for operation in OPERATIONS)
+    print(f"{'t (s)':>6} | {'ops':>6} | {groups} | {'em espera':>9} | {'atraso máx (ms)':>15}")
+    print("-" * (43 + 32 * len(OPERATIONS)))
+
+
+def _print_second(elapsed: float, generator: LoadGenerator):
+    operations = sum(generator.service[operation].count for operation in OPERATIONS)
+    cells = " | ".join(_latency_cells(generator.service[operation]) for operation in OPERATIONS)
+    waiting = sum(generator.last_status.values()) if generator.last_status else "—"
+    print(f"{elapsed:>6.1f} | {operations:>6} | {cells} | {waiting:>9} | {generator.max_lag / 1e6:>15.2f}", flush=True)
+
+
+def _print_summary(generator: LoadGenerator, elapsed: float):
+    print(f"\nResumo ({elapsed:.1f}s)")
+    print(f"{'Operação':<10} {'Latência':<9} {'total':>9} {'ops/s':>9} {'p50':>8} {'p90':>8} {'p99':>8} {'p99.9':>9} {'máx':>10}  (µs)")
+    print("-" * 90)
+    for operation in OPERATIONS:
+        for label, histogram in (("serviço", generator.total_service[operation]), ("resposta", generator.total_response[operation])):
+            if histogram.count == 0:
+                continue
+            p50, p90, p99, p999 = histogram.percentiles(50, 90, 99, 99.9)
+            print(f"{operation:<10} {label:<9} {histogram.count:>9,} {histogram.count / elapsed:>9,.0f} "
+                  f"{_micros(p50):>8} {_micros(p90):>8} {_micros(p99):>8} {_micros(p999):>9} {_micros(histogram.max):>10}")
+    # Alguns ms de atraso no fim são só a granularidade do sleep
+    if generator.final_lag > 10_000_000:
+        print(f"\nO sistema não acompanhou a taxa: a carga terminou {generator.final_lag / 1e9:.2f}s atrasada.")
+    if generator.empty_calls:
+        print(f"\n{generator.empty_calls:,} chamadas encontraram todas as filas vazias.")
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Gerador de carga em malha aberta sobre os casos de uso")
+    parser.add_argument("--rate", type=float, default=200.0, help="cadastros por segundo")
+    parser.add_argument("--call-rate", type=float, default=None, help="chamadas por segundo (padrão: igual a --rate)")
+    parser.add_argument("--status-rate", type=float, default=10.0, help="leituras de status por segundo")
+    parser.add_argument("--mix", type=_parse_mix, default=MIX_PRESETS["típico"],
+                        help=f"distribuição de cores: {', '.join(MIX_PRESETS)} ou v:l:a:vd:az")
+    parser.add_argument("--arrivals", choices=("poisson", "uniform"), default="poisson",
+                        help="intervalos entre operações de cada fluxo")
+    parser.add_argument("--duration", type=float, default=10.0, help="segundos de carga")
+    parser.add_argument("--repository", choices=sorted(REPOSITORIES), default="in-memory")
+    parser.add_argument("--preload", type=int, default=0, help="pacientes já na fila antes da carga")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    call_rate = args.rate if args.call_rate is None else args.call_rate
+    if min(args.rate, call_rate, args.status_rate) < 0 or args.duration <= 0:
+        parser.error("As taxas não podem ser negativas e a duração deve ser positiva.")
+
+    repo = REPOSITORIES[args.repository]()
+    if args.preload:
+        rng = random.Random(args.seed + 1)
+        colors = rng.choices(_COLORS, args.mix, k=args.preload)
+        repo.add_patients((Patient(f"Inicial {i}"), color) for i, color in enumerate(colors))
+
+    generator = LoadGenerator(repo, args.rate, call_rate, args.status_rate, args.mix,
+                              poisson=args.arrivals == "poisson", seed=args.seed)
+    print(f"Carga em malha aberta: {args.rate:g} cadastros/s, {call_rate:g} chamadas/s, {args.status_rate:g} status/s "
+          f"({args.arrivals}, repositório {args.repository}, {args.preload:,} pré-carregados). Ctrl+C encerra.\n")
+    _print_header()
+
+    start = time.perf_counter()
+    generator.run(args.duration, _print_second)
+    _print_summary(generator, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
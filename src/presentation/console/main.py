@@ -2,24 +2,21 @@ import sys
 import os
 from typing import Dict, Tuple
 
-current_file_path = os.path.abspath(__file__)
-console_dir = os.path.dirname(current_file_path)
-presentation_dir = os.path.dirname(console_dir)
-src_dir = os.path.dirname(presentation_dir)
-project_root = os.path.dirname(src_dir)
-
-if project_root not in sys.path:
-    sys.path.append(project_root)
+if not __package__:
+    # Executado como script (python src/presentation/console/main.py): a raiz do projeto
+    # (três níveis acima deste diretório) entra no path. Com 'python -m' isso não é necessário
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
 
 from src.domain.patient import Patient
 from src.domain.classification import Classification
 from src.domain.triage_node import NodoArvore
 from src.infrastructure.triage_builder import montar_arvore
 from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+from src.infrastructure.event_sinks import StdoutEventSink
 
 from src.application.use_cases.register_patient import RegisterPatientUseCase
 from src.application.use_cases.call_next_patient import CallNextPatientUseCase
-from src.application.use_cases.get_queues_status import GetQueuesStatusUseCase
+from src.application.use_cases.get_queues_status import GetQueuesStatusUseCases
 from src.application.services.triage_service import triagem_console
 
 
@@ -72,7 +69,7 @@ def _handle_call_patient(use_case: CallNextPatientUseCase):
     except SystemError as e:
         print(f"\nERRO NO SISTEMA: {e}")
         
-def _handle_show_status(use_case: GetQueuesStatusUseCase):
+def _handle_show_status(use_case: GetQueuesStatusUseCases):
     print("\n[Opção 3: Status das Filas]")
     try:
         status_dict = use_case.execute()
@@ -92,21 +89,24 @@ def _handle_show_status(use_case: GetQueuesStatusUseCase):
     except SystemError as e:
         print(f"\nERRO NO SISTEMA: {e}")
         
-def setup_application() -> Tuple[RegisterPatientUseCase, CallNextPatientUseCase, GetQueuesStatusUseCase, NodoArvore]:
+def setup_application() -> Tuple[RegisterPatientUseCase, CallNextPatientUseCase, GetQueuesStatusUseCases, NodoArvore]:
     print("Inicializando o Manchester Protocol Simulator...")
     
     try:
         print("[Setup] Montando árvore de triagem...")
         triage_tree = montar_arvore()
         
+        # Eventos do repositório e dos casos de uso vão para o console
+        events = StdoutEventSink()
+
         print("[Setup] Criando repositório de filas em memória...")
-        queue_repo = InMemoryQueueRepository()
+        queue_repo = InMemoryQueueRepository(events)
         
         print("[Setup] Injetando dependências nos casos de uso...")
         
-        register_use_case = RegisterPatientUseCase(queue_repo) 
-        call_use_case = CallNextPatientUseCase(queue_repo)
-        status_use_case = GetQueuesStatusUseCase(queue_repo)
+        register_use_case = RegisterPatientUseCase(queue_repo, events) 
+        call_use_case = CallNextPatientUseCase(queue_repo, events)
+        status_use_case = GetQueuesStatusUseCases(queue_repo, events)
         
         print("Sistema pronto para operar.\n")
         
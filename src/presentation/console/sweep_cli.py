@@ -0,0 +1,110 @@
+'''
+Varredura de dimensionamento: quantos consultórios mantêm cada cor dentro do tempo-alvo?
+
+Executa réplicas da simulação para cada combinação de taxa de chegada x número de
+consultórios x distribuição de cores, em paralelo (um processo por núcleo), e mostra
+as médias com intervalos de confiança e a recomendação de consultórios
+
+Uso (na raiz do projeto):
+    python -m src.presentation.console.sweep_cli --arrivals 15 20 25 --doctors 3 4 5 6 --replicas 20
+    python -m src.presentation.console.sweep_cli --mix típico --mix "inverno=3:12:30:40:15" --days 14
+'''
+import argparse
+import math
+import time
+from typing import List, Sequence, Tuple
+
+from src.domain.classification import Classification
+from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+from src.application.simulation.mixes import MIX_PRESETS
+from src.application.simulation.sweep import COLORS, Interval, ScenarioSummary, build_grid, recommend_doctors, run_sweep
+
+
+def _parse_mix(text: str) -> Tuple[str, Tuple[float, ...]]:
+    # Aceita um nome predefinido ("típico") ou "nome=v:l:a:vd:az"
+    if text in MIX_PRESETS:
+        return text, MIX_PRESETS[text]
+    name, separator, weights = text.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Distribuição '{text}' desconhecida. Use {sorted(MIX_PRESETS)} ou nome=v:l:a:vd:az.")
+    try:
+        values = tuple(float(weight) for weight in weights.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Pesos inválidos em '{text}'.")
+    if len(values) != len(COLORS):
+        raise argparse.ArgumentTypeError(f"'{text}' precisa de 5 pesos (Vermelho -> Azul).")
+    return name, values
+
+
+def _format_interval(interval: Interval, percent: bool = False) -> str:
+    # "média ±meia largura" (só a média se não houver intervalo; "—" se não houver dado)
+    if math.isnan(interval.mean):
+        return "—"
+    scale = 100 if percent else 1
+    text = f"{interval.mean * scale:5.1f}{'%' if percent else ''}"
+    if not math.isnan(interval.high):
+        text += f" ±{(interval.high - interval.mean) * scale:4.1f}"
+    return text
+
+
+def _print_summaries(summaries: Sequence[ScenarioSummary]):
+    header = " | ".join(f"{cls.name:^14}" for cls in COLORS)
+    print(f"\n{'Distribuição':<12} {'Cheg./h':>7} {'Cons.':>5} {'Utiliz.':>7} | {header}")
+    print("-" * (36 + 17 * len(COLORS)))
+    for summary in summaries:
+        scenario = summary.scenario
+        cells = " | ".join(f"{_format_interval(summary.within_target[cls], percent=True):>14}" for cls in COLORS)
+        print(f"{scenario.mix_name:<12} {scenario.arrivals_per_hour:>7.1f} {scenario.doctors:>5} "
+              f"{summary.utilization.mean:>7.1%} | {cells}")
+    print("\n(células: fração atendida dentro do tempo-alvo, média ± meia largura do intervalo de confiança)")
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Varredura de dimensionamento de consultórios (Monte Carlo)")
+    parser.add_argument("--arrivals", type=float, nargs="+", default=[15.0, 20.0], help="chegadas por hora")
+    parser.add_argument("--doctors", type=int, nargs="+", default=[3, 4, 5, 6], help="consultórios por turno")
+    parser.add_argument("--mix", type=_parse_mix, action="append", help="distribuição de cores (pode repetir)")
+    parser.add_argument("--replicas", type=int, default=20)
+    parser.add_argument("--days", type=float, default=7, help="dias simulados por réplica")
+    parser.add_argument("--warmup-hours", type=float, default=24)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--required-share", type=float, default=0.9,
+                        help="fração mínima atendida dentro do tempo-alvo para recomendar")
+    parser.add_argument("--ignore-red", action="store_true",
+                        help="não exige a meta do Vermelho (alvo 0: só é cumprida com consultório livre)")
+    parser.add_argument("--workers", type=int, default=None, help="processos (padrão: núcleos da máquina)")
+    args = parser.parse_args(argv)
+
+    mixes = dict(args.mix) if args.mix else {"típico": MIX_PRESETS["típico"]}
+    scenarios = build_grid(args.arrivals, args.doctors, mixes)
+
+    start = time.perf_counter()
+    summaries = run_sweep(
+        scenarios,
+        InMemoryQueueRepository,
+        replicas=args.replicas,
+        duration=args.days * 24 * 60,
+        warmup=args.warmup_hours * 60,
+        base_seed=args.seed,
+        confidence=args.confidence,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - start
+
+    _print_summaries(summaries)
+
+    colors = [cls for cls in COLORS if not (args.ignore_red and cls is Classification.RED)]
+    print(f"\nRecomendação (todas as cores {'exceto Vermelho ' if args.ignore_red else ''}"
+          f"com >= {args.required_share:.0%} dentro do alvo, pelo limite inferior do intervalo):")
+    for (arrivals, mix_name), doctors in recommend_doctors(summaries, args.required_share, colors).items():
+        answer = f"{doctors} consultórios" if doctors is not None else "nenhum número de consultórios da grade basta"
+        print(f"  {mix_name:<12} {arrivals:>6.1f} chegadas/h -> {answer}")
+
+    total_events = sum(summary.events for summary in summaries)
+    print(f"\n{len(scenarios) * args.replicas} simulações, {total_events:,} eventos em {elapsed:.1f}s "
+          f"({total_events / elapsed * 60 / 1e6:.1f} milhões de eventos/minuto)")
+
+
+if __name__ == "__main__":
+    main()
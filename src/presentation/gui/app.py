@@ -1,29 +1,27 @@
 import sys
 import os
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Optional
 
-current_file_path = os.path.abspath(__file__)
-gui_dir = os.path.dirname(current_file_path)
-presentation_dir = os.path.dirname(gui_dir)
-src_dir = os.path.dirname(presentation_dir)
-project_root = os.path.dirname(src_dir)
-
-if project_root not in sys.path:
-    sys.path.append(project_root)
+if not __package__:
+    # Executado como script (python src/presentation/gui/app.py): a raiz do projeto
+    # (três níveis acima deste diretório) entra no path. Com 'python -m' isso não é necessário
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
 
 import customtkinter
 
-from src.infrastructure.triage_builder import montar_arvore
-from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
-
-from src.application.use_cases.register_patient import RegisterPatientUseCase
-from src.application.use_cases.call_next_patient import CallNextPatientUseCase
-from src.application.use_cases.get_queues_status import GetQueuesStatusUseCases
+from src.presentation.gui.background import BackgroundDispatcher
+from src.presentation.gui.fonts import font
 
-from src.domain.triage_node import NodoArvore
-from src.presentation.gui.triage_window import TriageWindow
-from src.presentation.gui.status_window import StatusWindow
-from src.presentation.gui.call_result_window import CallResultWindow
+if TYPE_CHECKING:
+    # Só para as anotações: os módulos das janelas e do back-end são importados
+    # quando usados, para a janela principal aparecer o quanto antes
+    from src.application.use_cases.register_patient import RegisterPatientUseCase
+    from src.application.use_cases.call_next_patient import CallNextPatientUseCase
+    from src.application.use_cases.get_queues_status import GetQueuesStatusUseCases
+    from src.domain.triage_node import NodoArvore
+    from src.presentation.gui.triage_window import TriageWindow
+    from src.presentation.gui.status_window import StatusWindow
+    from src.presentation.gui.call_result_window import CallResultWindow
 
 customtkinter.set_appearance_mode("System")
 customtkinter.set_default_color_theme("blue")
@@ -33,12 +31,15 @@ class App(customtkinter.CTk):
     '''
     Classe principal da Interface Gráfica
     '''
+
+    CALL_TEXT = "2. Chamar Próximo Paciente"
+    CALL_PENDING_TEXT = "Chamando..."
     
     def __init__(self, 
-                 register_uc: RegisterPatientUseCase, 
-                 call_uc: CallNextPatientUseCase, 
-                 status_uc: GetQueuesStatusUseCases,
-                 triage_tree: NodoArvore): # Recebe a árvore
+                 register_uc: "RegisterPatientUseCase", 
+                 call_uc: "CallNextPatientUseCase", 
+                 status_uc: "GetQueuesStatusUseCases",
+                 triage_tree: "NodoArvore"): # Recebe a árvore
         
         super().__init__()
 
@@ -48,10 +49,13 @@ class App(customtkinter.CTk):
         self.status_use_case = status_uc
         self.triage_tree = triage_tree # Armazenar a árvore
 
-        # Armazenar a referência da janela de triagem
-        self.triage_window: Optional[TriageWindow] = None
-        self.status_window: Optional[StatusWindow] = None
-        self.call_window: Optional[CallResultWindow] = None
+        # Janelas "popup": criadas uma vez e reaproveitadas (escondidas entre os usos)
+        self.triage_window: Optional["TriageWindow"] = None
+        self.status_window: Optional["StatusWindow"] = None
+        self.call_window: Optional["CallResultWindow"] = None
+
+        # Os casos de uso rodam fora da thread do Tk (a janela não congela com back-ends lentos)
+        self.background = BackgroundDispatcher(self)
 
         # Configurar a janela principal
         self.title("Manchester Protocol Simulator (GUI)")
@@ -60,6 +64,11 @@ class App(customtkinter.CTk):
 
         # Criar os componentes da tela
         self.setup_ui()
+        self.protocol("WM_DELETE_WINDOW", self.quit_app)
+
+        # Pré-montar as janelas de cadastro e de chamada assim que a principal estiver
+        # pronta, para que os cliques só precisem exibi-las
+        self.after_idle(self.prebuild_windows)
 
     def setup_ui(self):
         # Criar e posicionar os elementos na janela
@@ -74,32 +83,32 @@ class App(customtkinter.CTk):
         title_label = customtkinter.CTkLabel(
             main_frame, 
             text="Menu Principal", 
-            font=customtkinter.CTkFont(size=24, weight="bold")
+            font=font(24, "bold")
         )
         title_label.grid(row=0, column=0, padx=30, pady=(20, 20))
 
         register_button = customtkinter.CTkButton(
             main_frame,
             text="1. Cadastrar Paciente (Iniciar Triagem)",
-            font=customtkinter.CTkFont(size=14),
+            font=font(14),
             height=40,
             command=self.open_register_window
         )
         register_button.grid(row=1, column=0, padx=30, pady=10, sticky="ew")
 
-        call_button = customtkinter.CTkButton(
+        self.call_button = customtkinter.CTkButton(
             main_frame,
-            text="2. Chamar Próximo Paciente",
-            font=customtkinter.CTkFont(size=14),
+            text=self.CALL_TEXT,
+            font=font(14),
             height=40,
             command=self.call_next_patient
         )
-        call_button.grid(row=2, column=0, padx=30, pady=10, sticky="ew")
+        self.call_button.grid(row=2, column=0, padx=30, pady=10, sticky="ew")
 
         status_button = customtkinter.CTkButton(
             main_frame,
             text="3. Mostrar Status das Filas",
-            font=customtkinter.CTkFont(size=14),
+            font=font(14),
             height=40,
             command=self.show_status_window
         )
@@ -108,7 +117,7 @@ class App(customtkinter.CTk):
         exit_button = customtkinter.CTkButton(
             main_frame,
             text="0. Sair",
-            font=customtkinter.CTkFont(size=14),
+            font=font(14),
             height=40,
             command=self.quit_app,
             fg_color=("#F56565", "#C53030"),
@@ -116,82 +125,114 @@ class App(customtkinter.CTk):
         )
         exit_button.grid(row=4, column=0, padx=30, pady=(10, 20), sticky="ew")
 
+    def prebuild_windows(self):
+        # Cria (escondidas) as janelas que ainda não existem
+        self.get_triage_window()
+        self.get_call_window()
+
+    def get_triage_window(self) -> "TriageWindow":
+        if self.triage_window is None or not self.triage_window.winfo_exists():
+            from src.presentation.gui.triage_window import TriageWindow
+
+            # Criar a janela, passando as dependências
+            self.triage_window = TriageWindow(
+                master=self, 
+                register_uc=self.register_use_case,
+                triage_tree=self.triage_tree, # Passar a árvore
+                background=self.background
+            )
+        return self.triage_window
+
+    def get_call_window(self) -> "CallResultWindow":
+        if self.call_window is None or not self.call_window.winfo_exists():
+            from src.presentation.gui.call_result_window import CallResultWindow
+
+            self.call_window = CallResultWindow(master=self)
+        return self.call_window
+
     # Funções de ações dos botões
     
     def open_register_window(self):
         '''
         Ação para o botão 'Cadastrar'
-        Criar a janela de triagem, passando as dependências
+        Exibir a janela de triagem (pré-montada) pronta para um novo paciente
         '''
         print("[GUI] Clicou em 'Cadastrar'.")
         
-        # Verificar se a janela já não está aberta
-        if self.triage_window is None or not self.triage_window.winfo_exists():
-            # Criar a nova janela, passando as dependências
-            self.triage_window = TriageWindow(
-                master=self, 
-                register_uc=self.register_use_case,
-                triage_tree=self.triage_tree # Passar a árvore
-            )
-            self.triage_window.grab_set() # Focar na nova janela
+        triage_window = self.get_triage_window()
+        if triage_window.winfo_viewable():
+            triage_window.focus() # Focar se já estiver aberta (sem perder o atendimento)
         else:
-            self.triage_window.focus() # Focar se já existir
+            triage_window.show()
 
     def call_next_patient(self):
-        # Ação para o botão 'Chamar'
-        try:
-            # Executar caso de uso
-            patient = self.call_use_case.execute()
-            
-            # Abrir a janela de resultado
-            if self.call_window is None or not self.call_window.winfo_exists():
-                self.call_window = CallResultWindow(
-                    master=self,
-                    patient=patient
-                )
-                self.call_window.grab_set()
-            else:
-                self.call_window.focus()
-                
-        except SystemError as e:
-            print(f"Erro no caso de uso 'Chamar': {e}")
+        # Ação para o botão 'Chamar': executa o caso de uso no worker
+        # Cliques enquanto a chamada anterior não terminou são ignorados
+        if not self.background.submit("call", self.call_use_case.execute,
+                                      self._show_call_result, self._call_failed):
+            return
+        self.call_button.configure(state="disabled", text=self.CALL_PENDING_TEXT)
+
+    def _show_call_result(self, patient):
+        # Resultado do caso de uso 'Chamar' (thread do Tk)
+        self.call_button.configure(state="normal", text=self.CALL_TEXT)
+
+        # Exibir a janela de resultado (pré-montada)
+        self.get_call_window().show(patient)
+
+    def _call_failed(self, error: BaseException):
+        self.call_button.configure(state="normal", text=self.CALL_TEXT)
+        print(f"Erro no caso de uso 'Chamar': {error}")
 
     def show_status_window(self):
         # Ação para o botão 'Status'
         print("[GUI] Clicou em 'Status'.")
 
+        # A janela é criada uma vez e reaproveitada: fechar só a esconde
+        # Sem grab_set: o painel atualiza ao vivo enquanto a recepção usa a janela principal
         if self.status_window is None or not self.status_window.winfo_exists():
+            from src.presentation.gui.status_window import StatusWindow
+
             self.status_window = StatusWindow(
                 master=self,
-                status_uc=self.status_use_case
+                status_uc=self.status_use_case,
+                background=self.background
             )
-            self.status_window.grab_set()
-        else:
-            self.status_window.focus()
+        self.status_window.show()
             
     def quit_app(self):
         # Fechar aplicação
         print("[GUI] Clicou em 'Sair'. Encerrando...")
+        self.background.shutdown()
         self.destroy()
 
 
-# Ponto de entrada principal da aplicação
-if __name__ == "__main__":
+def main():
     print("[App GUI] Inicializando a aplicação...")
     
-    # Configurar o back-end
+    # Configurar o back-end (importado aqui: só o ponto de entrada precisa dele)
     try:
+        from src.infrastructure.triage_builder import montar_arvore
+        from src.infrastructure.repositories.in_memory_repository import InMemoryQueueRepository
+        from src.infrastructure.event_sinks import StdoutEventSink
+        from src.application.use_cases.register_patient import RegisterPatientUseCase
+        from src.application.use_cases.call_next_patient import CallNextPatientUseCase
+        from src.application.use_cases.get_queues_status import GetQueuesStatusUseCases
+
         print("[Setup] Montando árvore de triagem...")
         triage_tree = montar_arvore()
         
+        # Eventos do repositório e dos casos de uso vão para o console
+        events = StdoutEventSink()
+
         print("[Setup] Criando repositório de filas em memória...")
-        queue_repo = InMemoryQueueRepository()
+        queue_repo = InMemoryQueueRepository(events)
         
         print("[Setup] Injetando dependências nos casos de uso...")
         
-        register_uc = RegisterPatientUseCase(queue_repo) 
-        call_uc = CallNextPatientUseCase(queue_repo)
-        status_uc = GetQueuesStatusUseCases(queue_repo)
+        register_uc = RegisterPatientUseCase(queue_repo, events) 
+        call_uc = CallNextPatientUseCase(queue_repo, events)
+        status_uc = GetQueuesStatusUseCases(queue_repo, events)
         
         print("[App GUI] Back-end configurado com sucesso.")
 
@@ -213,3 +254,8 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n[ERRO DESCONHECIDO NA INICIALIZAÇÃO]: {e}")
         sys.exit(1)
+
+
+# Ponto de entrada principal da aplicação
+if __name__ == "__main__":
+    main()
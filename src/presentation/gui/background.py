@@ -0,0 +1,104 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Intervalo (ms) entre as verificações da fila de resultados enquanto há trabalho pendente
+POLL_MS = 20
+
+# Resultado de uma tarefa: (chave, valor, exceção)
+_Outcome = Tuple[str, Any, Optional[BaseException]]
+
+
+class BackgroundDispatcher:
+    '''
+    Executa os casos de uso fora da thread do Tk e entrega os resultados de volta a ela
+
+    Um único worker executa as tarefas na ordem em que foram pedidas, então o
+    repositório continua sendo acessado por uma thread só (a do worker) e as
+    operações da GUI não se intercalam. O worker coloca cada resultado em uma
+    queue.Queue (thread-safe), que é esvaziada na thread do Tk por um after();
+    os callbacks, portanto, podem mexer nos widgets livremente
+
+    Cada tarefa tem uma chave: enquanto uma tarefa com a mesma chave estiver
+    pendente, novos pedidos são ignorados (ex: duplo clique em "Chamar")
+    '''
+
+    def __init__(self, root, poll_ms: int = POLL_MS):
+        '''
+        Args:
+            root: Widget do Tk usado para agendar a leitura dos resultados (after)
+            poll_ms (int): Intervalo entre as leituras enquanto há tarefas pendentes
+        '''
+        self._root = root
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gui-usecase")
+        self._results: "queue.Queue[_Outcome]" = queue.Queue()
+        self._pending: Dict[str, Tuple[Callable[[Any], None], Optional[Callable[[BaseException], None]]]] = {}
+        self._after_id: Optional[str] = None
+        self._closed = False
+
+    def submit(self,
+               key: str,
+               work: Callable[[], Any],
+               on_done: Callable[[Any], None],
+               on_error: Optional[Callable[[BaseException], None]] = None) -> bool:
+        '''
+        Agenda 'work' no worker; 'on_done(resultado)' ou 'on_error(exceção)' roda depois na thread do Tk
+
+        Returns:
+            bool: False se já havia uma tarefa pendente com a mesma chave (pedido ignorado)
+        '''
+        if self._closed or key in self._pending:
+            return False
+        self._pending[key] = (on_done, on_error)
+        self._executor.submit(self._run, key, work)
+        if self._after_id is None:
+            self._after_id = self._root.after(self.poll_ms, self._drain)
+        return True
+
+    def is_pending(self, key: str) -> bool:
+        return key in self._pending
+
+    def _run(self, key: str, work: Callable[[], Any]):
+        # Executa no worker: nunca toca em widgets, só publica o resultado
+        try:
+            self._results.put((key, work(), None))
+        except BaseException as e:
+            self._results.put((key, None, e))
+
+    def _drain(self):
+        # Executa na thread do Tk: entrega todos os resultados prontos
+        self._after_id = None
+        try:
+            while True:
+                try:
+                    key, value, error = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                on_done, on_error = self._pending.pop(key)
+                # Um callback que falha (ex: TclError de uma janela já destruída) não pode
+                # impedir a entrega dos demais resultados nem deixar chaves presas em _pending
+                try:
+                    if error is None:
+                        on_done(value)
+                    elif on_error is not None:
+                        on_error(error)
+                    else:
+                        print(f"[GUI] Erro na tarefa '{key}': {error}")
+                except Exception as e:
+                    print(f"[GUI] Erro ao entregar o resultado da tarefa '{key}': {e}")
+        finally:
+            # Só continua verificando enquanto houver trabalho em andamento
+            if self._pending and not self._closed and self._after_id is None:
+                self._after_id = self._root.after(self.poll_ms, self._drain)
+
+    def shutdown(self):
+        '''
+        Para de aceitar tarefas, descarta as que ainda não começaram e cancela a leitura
+        '''
+        self._closed = True
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pending.clear()
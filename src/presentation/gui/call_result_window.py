@@ -1,63 +1,89 @@
 import customtkinter
 from typing import Optional
 from src.domain.patient import Patient
+from src.presentation.gui.fonts import font
 
 class CallResultWindow(customtkinter.CTkToplevel):
     '''
     Janela "popup" para exibir o resultado da chamada do
     próximo paciente (Botão 2)
+
+    Os widgets dos dois resultados (paciente chamado / filas vazias) são criados
+    uma vez; show(patient) preenche e exibe os do resultado atual. Fechar apenas
+    esconde a janela, que a App reaproveita na próxima chamada
     '''
-    def __init__(self, 
-                 master: customtkinter.CTk, 
-                 patient: Optional[Patient]):
-        
+    def __init__(self,
+                 master: customtkinter.CTk):
+
         super().__init__(master)
-        
+
         # Configurações da janela
         self.title("2. Próximo Paciente")
         self.geometry("400x200")
         self.minsize(350, 180)
-        
+
         # Frame principal
         main_frame = customtkinter.CTkFrame(self, fg_color="transparent")
         main_frame.pack(padx=20, pady=20, fill="both", expand=True)
         main_frame.grid_columnconfigure(0, weight=1)
 
-        # A lógica da UI depende do resultado
-        if patient:
-            # Paciente encontrado
-            title_label = customtkinter.CTkLabel(
-                main_frame, 
-                text="Próximo Paciente:",
-                font=customtkinter.CTkFont(size=16)
-            )
-            title_label.grid(row=0, column=0, padx=10, pady=(10, 5))
-
-            # Exibir o nome do paciente em destaque
-            patient_name_label = customtkinter.CTkLabel(
-                main_frame,
-                text=patient.name.upper(),
-                font=customtkinter.CTkFont(size=24, weight="bold"),
-                text_color="#3182CE"
-            )
-            patient_name_label.grid(row=1, column=0, padx=10, pady=(5, 20))
+        # Paciente encontrado
+        self.title_label = customtkinter.CTkLabel(
+            main_frame,
+            text="Próximo Paciente:",
+            font=font(16)
+        )
+
+        # Exibir o nome do paciente em destaque
+        self.patient_name_label = customtkinter.CTkLabel(
+            main_frame,
+            text="",
+            font=font(24, "bold"),
+            text_color="#3182CE"
+        )
+
+        # Filas vazias
+        self.empty_label = customtkinter.CTkLabel(
+            main_frame,
+            text="Todas as filas estão vazias.",
+            font=font(18, "bold")
+        )
+
+        self.info_label = customtkinter.CTkLabel(
+            main_frame,
+            text="Nenhum paciente para chamar.",
+            font=font(14)
+        )
 
-        else:
-            # Filas vazias
-            title_label = customtkinter.CTkLabel(
-                main_frame, 
-                text="Todas as filas estão vazias.",
-                font=customtkinter.CTkFont(size=18, weight="bold")
-            )
-            title_label.grid(row=0, column=0, padx=10, pady=(10, 20))
-            
-            info_label = customtkinter.CTkLabel(
-                main_frame,
-                text="Nenhum paciente para chamar.",
-                font=customtkinter.CTkFont(size=14)
-            )
-            info_label.grid(row=1, column=0, padx=10, pady=(0, 20))
-        
         # Botão de Fechar
-        close_button = customtkinter.CTkButton(self, text="OK", command=self.destroy, width=100)
+        close_button = customtkinter.CTkButton(self, text="OK", command=self.hide, width=100)
         close_button.pack(pady=(0, 20), side="bottom")
+
+        self.protocol("WM_DELETE_WINDOW", self.hide)
+        self.withdraw()
+
+    def show(self, patient: Optional[Patient]):
+        '''
+        Exibe o resultado de uma chamada (None = filas vazias)
+        '''
+        # A lógica da UI depende do resultado
+        if patient:
+            self.empty_label.grid_remove()
+            self.info_label.grid_remove()
+            self.patient_name_label.configure(text=patient.name.upper())
+            self.title_label.grid(row=0, column=0, padx=10, pady=(10, 5))
+            self.patient_name_label.grid(row=1, column=0, padx=10, pady=(5, 20))
+        else:
+            self.title_label.grid_remove()
+            self.patient_name_label.grid_remove()
+            self.empty_label.grid(row=0, column=0, padx=10, pady=(10, 20))
+            self.info_label.grid(row=1, column=0, padx=10, pady=(0, 20))
+
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+
+    def hide(self):
+        # Esconde a janela sem destruir os widgets
+        self.grab_release()
+        self.withdraw()
@@ -0,0 +1,32 @@
+import customtkinter
+from typing import Dict, Optional, Tuple
+
+# Fontes já criadas, por (família, tamanho, peso)
+_FONTS: Dict[Tuple[Optional[str], Optional[int], str], customtkinter.CTkFont] = {}
+
+# Família usada nos textos com emoji (cores da classificação)
+EMOJI_FAMILY = "Segoe UI Emoji"
+
+
+def font(size: Optional[int] = None, weight: str = "normal", family: Optional[str] = None) -> customtkinter.CTkFont:
+    '''
+    Retorna a CTkFont compartilhada para a combinação pedida, criando-a na primeira vez
+
+    Uma CTkFont pode ser usada por vários widgets ao mesmo tempo, então as janelas
+    não precisam criar (e registrar no Tk) as mesmas fontes a cada abertura.
+    Só deve ser chamada depois que a janela principal (CTk) existir
+    '''
+    key = (family, size, weight)
+    cached = _FONTS.get(key)
+    if cached is None:
+        options = {"weight": weight}
+        if size is not None:
+            options["size"] = size
+        if family is not None:
+            options["family"] = family
+        cached = _FONTS[key] = customtkinter.CTkFont(**options)
+    return cached
+
+
+def emoji_font(size: int, weight: str = "normal") -> customtkinter.CTkFont:
+    return font(size, weight, EMOJI_FAMILY)
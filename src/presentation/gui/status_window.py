@@ -1,37 +1,62 @@
 import customtkinter
-from typing import Optional, Dict
+from typing import Optional, Dict, Mapping, Tuple
 from src.domain.classification import Classification
 from src.application.use_cases.get_queues_status import GetQueuesStatusUseCases
+from src.presentation.gui.background import BackgroundDispatcher
+from src.presentation.gui.fonts import font, emoji_font
+
+# Intervalo (ms) entre as consultas do status enquanto a janela está visível
+REFRESH_MS = 250
 
 class StatusWindow(customtkinter.CTkToplevel):
     '''
     Janela "popup" para exibir o status (tamanho) de todas as filas
+
+    A tabela é montada uma única vez; depois, um timer (after) consulta o status
+    versionado a cada 'refresh_ms' e só reconfigura os labels cujas contagens
+    mudaram. Não importa quantas vezes as filas mudem por segundo: há no máximo
+    uma atualização por intervalo, e cada uma toca só as linhas alteradas.
+    As consultas rodam no worker do BackgroundDispatcher, fora da thread do Tk
+
+    Fechar a janela apenas a esconde (withdraw) e para o timer; show() a reexibe
     '''
-    def __init__(self, 
-                 master: customtkinter.CTk, 
-                 status_uc: GetQueuesStatusUseCases):
-        
+    def __init__(self,
+                 master: customtkinter.CTk,
+                 status_uc: GetQueuesStatusUseCases,
+                 background: BackgroundDispatcher,
+                 refresh_ms: int = REFRESH_MS):
+
         super().__init__(master)
-        
+
         # Configurações da janela
         self.title("3. Status das Filas")
         self.geometry("350x400")
         self.minsize(300, 350)
         self.status_use_case = status_uc
-        
+        self.background = background
+        self.refresh_ms = refresh_ms
+
+        # Estado da atualização ao vivo
+        self._version = -1                                  # Última versão exibida
+        self._versioned = status_uc.supports_versions       # False: consulta completa a cada intervalo
+        self._shown: Dict[Classification, int] = {}         # Contagens atualmente nos labels
+        self._size_labels: Dict[Classification, customtkinter.CTkLabel] = {}
+        self._after_id: Optional[str] = None
+        self._error_visible = False
+
         # Frame principal
         main_frame = customtkinter.CTkFrame(self)
         main_frame.pack(padx=20, pady=20, fill="both", expand=True)
         main_frame.grid_columnconfigure(0, weight=1)
         main_frame.grid_columnconfigure(1, weight=1)
-        
+
         title_label = customtkinter.CTkLabel(
-            main_frame, 
-            text="Pacientes na Fila", 
-            font=customtkinter.CTkFont(size=20, weight="bold")
+            main_frame,
+            text="Pacientes na Fila",
+            font=font(20, "bold")
         )
         title_label.grid(row=0, column=0, columnspan=2, padx=10, pady=(10, 20))
-        
+
         # Cabeçalho da Tabela
         header_frame = customtkinter.CTkFrame(main_frame, fg_color="gray20")
         header_frame.grid(row=1, column=0, columnspan=2, padx=10, pady=(0, 5), sticky="ew")
@@ -39,77 +64,151 @@ class StatusWindow(customtkinter.CTkToplevel):
         header_frame.grid_columnconfigure(1, weight=1)
 
         header_label_1 = customtkinter.CTkLabel(
-            header_frame, 
-            text="Classificação", 
-            font=customtkinter.CTkFont(weight="bold"),
+            header_frame,
+            text="Classificação",
+            font=font(weight="bold"),
             text_color="white"
         )
         header_label_1.grid(row=0, column=0, padx=10, pady=5, sticky="w")
-        
+
         header_label_2 = customtkinter.CTkLabel(
-            header_frame, 
-            text="Qtd.", 
-            font=customtkinter.CTkFont(weight="bold"),
+            header_frame,
+            text="Qtd.",
+            font=font(weight="bold"),
             text_color="white"
         )
         header_label_2.grid(row=0, column=1, padx=10, pady=5, sticky="e")
 
-        # Carregar e exibir os dados
-        
-        try:
-            # Chamar o Caso de Uso para buscar os dados
-            status_dict = self.status_use_case.execute()
-            
-            # Ordenar os dados por prioridade
-            sorted_status = sorted(status_dict.items(), key=lambda item: item[0].priority)
-            
-            total = 0
-            current_row = 2
-            
-            emoji_font = customtkinter.CTkFont(family="Segoe UI Emoji", size=14)
-
-            for classification, size in sorted_status:
-                total += size
-
-                class_label = customtkinter.CTkLabel(
-                    main_frame, 
-                    text=f"{classification.color} {classification.name}",
-                    font=emoji_font,
-                    text_color=classification.hex_color
-                )
-                class_label.grid(row=current_row, column=0, padx=20, pady=8, sticky="w")
-                
-                # Label da Contagem
-                size_label = customtkinter.CTkLabel(
-                    main_frame, 
-                    text=str(size),
-                    font=customtkinter.CTkFont(size=14, weight="bold")
-                )
-                size_label.grid(row=current_row, column=1, padx=20, pady=8, sticky="e")
-                
-                current_row += 1
-            
-            # Linha do total
-            total_frame = customtkinter.CTkFrame(main_frame, fg_color="transparent")
-            total_frame.grid(row=current_row, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="ew")
-            total_frame.grid_columnconfigure(0, weight=1)
-
-            total_label_text = customtkinter.CTkLabel(total_frame, text="TOTAL DE PACIENTES:", font=customtkinter.CTkFont(weight="bold"))
-            total_label_text.grid(row=0, column=0, sticky="w", padx=10)
-            
-            total_label_num = customtkinter.CTkLabel(total_frame, text=str(total), font=customtkinter.CTkFont(size=16, weight="bold"))
-            total_label_num.grid(row=0, column=1, sticky="e", padx=10)
-            
-        except SystemError as e:
-            # Mostrar erro se o back-end falhar
-            error_label = customtkinter.CTkLabel(
-                main_frame, 
-                text=f"Erro ao carregar dados:\n{e}", 
-                text_color="red",
-                wraplength=250
+        # Uma linha por classificação, em ordem de prioridade (criadas uma vez, reaproveitadas)
+        current_row = 2
+        class_font = emoji_font(14)
+        size_font = font(14, "bold")
+
+        for classification in sorted(Classification, key=lambda c: c.priority):
+            class_label = customtkinter.CTkLabel(
+                main_frame,
+                text=f"{classification.color} {classification.name}",
+                font=class_font,
+                text_color=classification.hex_color
             )
-            error_label.grid(row=2, column=0, columnspan=2, padx=10, pady=20)
-        
-        # Botão de Fechar
-        close_button = customtkinter.CTkButton(self, text="Fechar", command=self.destroy, width=100)
+            class_label.grid(row=current_row, column=0, padx=20, pady=8, sticky="w")
+
+            # Label da Contagem
+            size_label = customtkinter.CTkLabel(main_frame, text="-", font=size_font)
+            size_label.grid(row=current_row, column=1, padx=20, pady=8, sticky="e")
+            self._size_labels[classification] = size_label
+
+            current_row += 1
+
+        # Linha do total
+        total_frame = customtkinter.CTkFrame(main_frame, fg_color="transparent")
+        total_frame.grid(row=current_row, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="ew")
+        total_frame.grid_columnconfigure(0, weight=1)
+
+        total_label_text = customtkinter.CTkLabel(total_frame, text="TOTAL DE PACIENTES:", font=font(weight="bold"))
+        total_label_text.grid(row=0, column=0, sticky="w", padx=10)
+
+        self._total_label = customtkinter.CTkLabel(total_frame, text="-", font=font(16, "bold"))
+        self._total_label.grid(row=0, column=1, sticky="e", padx=10)
+
+        # Mensagem de erro (só aparece se o back-end falhar)
+        self._error_label = customtkinter.CTkLabel(
+            main_frame,
+            text="",
+            text_color="red",
+            wraplength=250
+        )
+        self._error_row = current_row + 1
+
+        # Botão de Fechar (esconde a janela para ser reaproveitada)
+        close_button = customtkinter.CTkButton(self, text="Fechar", command=self.hide, width=100)
         close_button.pack(pady=(0, 20), side="bottom")
+        self.protocol("WM_DELETE_WINDOW", self.hide)
+        self.withdraw()
+
+    # Exibição
+
+    def show(self):
+        '''
+        Exibe a janela, atualiza a tabela imediatamente e liga o timer
+        '''
+        self.deiconify()
+        self.lift()
+        self.focus()
+        self._cancel_timer()
+        self.refresh()
+        self._after_id = self.after(self.refresh_ms, self._tick)
+
+    def hide(self):
+        # Esconde a janela sem destruir os widgets e para as consultas
+        self._cancel_timer()
+        self.withdraw()
+
+    def destroy(self):
+        self._cancel_timer()
+        super().destroy()
+
+    def _cancel_timer(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        self.refresh()
+        self._after_id = self.after(self.refresh_ms, self._tick)
+
+    # Atualização
+
+    def refresh(self):
+        '''
+        Pede o status ao worker; a tabela é atualizada quando a resposta chegar
+
+        Se a consulta anterior ainda não voltou (back-end lento), o pedido é
+        ignorado em vez de acumular consultas na fila do worker
+        '''
+        version = self._version
+        self.background.submit("status",
+                               lambda: self._fetch(version),
+                               self._on_fetched,
+                               lambda e: self._show_error(f"Erro ao carregar dados:\n{e}"))
+
+    def _fetch(self, since_version: int) -> Tuple[int, Optional[Mapping[Classification, int]]]:
+        # Executa no worker: retorna (versão, contagens ou None se nada mudou)
+        if self._versioned:
+            snapshot = self.status_use_case.execute_if_changed(since_version)
+            if snapshot is None:
+                return since_version, None
+            return snapshot.version, snapshot.counts
+        # Repositório sem status versionado: consulta completa e compara na exibição
+        return since_version, self.status_use_case.execute()
+
+    def _on_fetched(self, result: Tuple[int, Optional[Mapping[Classification, int]]]):
+        if not self.winfo_exists():
+            return
+        self._version, counts = result
+        if counts is not None:
+            self._apply(counts)
+
+    def _apply(self, counts: Mapping[Classification, int]):
+        # Reconfigura apenas os labels cuja contagem mudou
+        if self._error_visible:
+            self._error_label.grid_remove()
+            self._error_visible = False
+
+        changed = False
+        for classification, size in counts.items():
+            if self._shown.get(classification) != size:
+                self._shown[classification] = size
+                self._size_labels[classification].configure(text=str(size))
+                changed = True
+
+        if changed:
+            self._total_label.configure(text=str(sum(self._shown.values())))
+
+    def _show_error(self, message: str):
+        if not self.winfo_exists():
+            return
+        self._error_label.configure(text=message)
+        if not self._error_visible:
+            self._error_label.grid(row=self._error_row, column=0, columnspan=2, padx=10, pady=20)
+            self._error_visible = True
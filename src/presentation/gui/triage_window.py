@@ -1,19 +1,28 @@
 import customtkinter
+from tkinter import messagebox
 from typing import Optional
 from src.domain.patient import Patient
 from src.domain.classification import Classification
 from src.domain.triage_node import NodoArvore
 from src.application.use_cases.register_patient import RegisterPatientUseCase
 from src.application.services.triage_service import TriageNavigator
+from src.presentation.gui.background import BackgroundDispatcher
+from src.presentation.gui.fonts import font, emoji_font
 
 class TriageWindow(customtkinter.CTkToplevel):
     '''
     Janela "popup" para o processo de cadastro e triagem
+
+    A App cria a janela uma vez (escondida) e a reaproveita: show() limpa o
+    estado do atendimento anterior e a exibe; fechar apenas a esconde. Enquanto
+    o cadastro está sendo salvo a janela não pode ser fechada, para que o
+    resultado (ou o erro) sempre chegue a quem fez a triagem
     '''
     def __init__(self, 
                  master: customtkinter.CTk, 
                  register_uc: RegisterPatientUseCase, 
-                 triage_tree: NodoArvore):
+                 triage_tree: NodoArvore,
+                 background: BackgroundDispatcher):
         
         super().__init__(master)
         
@@ -24,10 +33,13 @@ class TriageWindow(customtkinter.CTkToplevel):
         
         self.register_use_case = register_uc
         self.triage_tree = triage_tree
+        self.background = background
         self.navigator: Optional[TriageNavigator] = None
         self.patient: Optional[Patient] = None
+        self._session = 0 # Muda a cada show(): descarta resultados de um atendimento anterior
+        self._saving = False # Cadastro enviado ao worker e ainda sem resposta
         
-        self.emoji_font = customtkinter.CTkFont(family="Segoe UI Emoji", size=18, weight="bold")
+        self.emoji_font = emoji_font(18, "bold")
         
         # Frame de Cadastro
         self.name_frame = customtkinter.CTkFrame(self)
@@ -35,6 +47,7 @@ class TriageWindow(customtkinter.CTkToplevel):
         
         self.name_label = customtkinter.CTkLabel(self.name_frame, text="Nome do Paciente:")
         self.name_label.pack(pady=(5, 5))
+        self._label_color = self.name_label.cget("text_color")
         
         self.name_entry = customtkinter.CTkEntry(self.name_frame, width=250)
         self.name_entry.pack(pady=(0, 10))
@@ -45,7 +58,7 @@ class TriageWindow(customtkinter.CTkToplevel):
         # Frame de Triagem (Perguntas)
         self.triage_frame = customtkinter.CTkFrame(self, fg_color="transparent")
         
-        self.question_label = customtkinter.CTkLabel(self.triage_frame, text="Pergunta...", font=customtkinter.CTkFont(size=16), wraplength=380)
+        self.question_label = customtkinter.CTkLabel(self.triage_frame, text="Pergunta...", font=font(16), wraplength=380)
         self.question_label.pack(pady=(10, 20))
 
         self.button_frame = customtkinter.CTkFrame(self.triage_frame, fg_color="transparent")
@@ -60,12 +73,53 @@ class TriageWindow(customtkinter.CTkToplevel):
         # Frame de Resultado
         self.result_frame = customtkinter.CTkFrame(self, fg_color="transparent")
 
-        self.result_label = customtkinter.CTkLabel(self.result_frame, text="Resultado:", font=customtkinter.CTkFont(size=18, weight="bold"))
+        self.result_font = font(18, "bold")
+        self.result_label = customtkinter.CTkLabel(self.result_frame, text="Resultado:", font=self.result_font)
         self.result_label.pack(pady=(10, 10))
         
-        self.close_button = customtkinter.CTkButton(self.result_frame, text="Fechar", command=self.destroy)
+        self.close_button = customtkinter.CTkButton(self.result_frame, text="Fechar", command=self.hide)
         self.close_button.pack(pady=10)
 
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.withdraw()
+
+    def show(self):
+        '''
+        Volta a janela ao passo inicial (nome do paciente) e a exibe
+        '''
+        self.reset()
+        self.deiconify()
+        self.lift()
+        self.grab_set() # Focar na janela
+        self.name_entry.focus_set()
+
+    def hide(self):
+        # Esconde a janela sem destruir os widgets
+        self.grab_release()
+        self.withdraw()
+
+    def _on_close(self):
+        # Botão de fechar do gerenciador de janelas: ignorado enquanto o cadastro é salvo
+        if self._saving:
+            self.bell()
+            return
+        self.hide()
+
+    def reset(self):
+        # Limpa o estado do atendimento anterior
+        self._session += 1
+        self.navigator = None
+        self.patient = None
+
+        self.triage_frame.pack_forget()
+        self.result_frame.pack_forget()
+        self.name_frame.pack(padx=20, pady=20, fill="x")
+
+        self.name_entry.delete(0, "end")
+        self.name_label.configure(text="Nome do Paciente:", text_color=self._label_color)
+        self.question_label.configure(text="Pergunta...")
+        self.result_label.configure(text="Resultado:", font=self.result_font, text_color=self._label_color)
+        self.close_button.configure(state="normal")
 
     def start_triage(self):
         # Iniciar o processo de triagem após pegar o nome
@@ -106,21 +160,44 @@ class TriageWindow(customtkinter.CTkToplevel):
     def show_result(self):
         # Mostrar o resultado final da triagem
         classification = self.navigator.get_final_classification()
-        
-        # Salvar no repositório
-        try:
-            self.register_use_case.execute(self.patient, classification)
-            
-            # Atualiza a UI com o resultado
-            self.triage_frame.pack_forget()
-            self.result_frame.pack(padx=20, pady=20, fill="both", expand=True)
-            
-            self.result_label.configure(
-                text=f"Paciente: {self.patient.name}\n\n"
-                     f"{classification.color} {classification.description}",
-                font=self.emoji_font,
-                text_color=classification.hex_color
-            )
-            
-        except (ValueError, SystemError) as e:
-            self.result_label.configure(text=f"Erro ao salvar: {e}", text_color="red")
+        patient = self.patient
+        session = self._session
+
+        # Salvar no repositório (no worker); a janela mostra que está salvando
+        if not self.background.submit("register",
+                                      lambda: self.register_use_case.execute(patient, classification),
+                                      lambda _: self._registered(session, patient, classification),
+                                      lambda e: self._register_failed(session, patient, e)):
+            return
+        self._saving = True
+        self.triage_frame.pack_forget()
+        self.result_frame.pack(padx=20, pady=20, fill="both", expand=True)
+        self.result_label.configure(text="Salvando...", text_color=self._label_color)
+        self.close_button.configure(state="disabled")
+
+    def _registered(self, session: int, patient: Patient, classification: Classification):
+        # Atualiza a UI com o resultado (thread do Tk)
+        self._saving = False
+        if session != self._session or not self.winfo_exists():
+            return
+        self.close_button.configure(state="normal")
+        self.result_label.configure(
+            text=f"Paciente: {patient.name}\n\n"
+                 f"{classification.color} {classification.description}",
+            font=self.emoji_font,
+            text_color=classification.hex_color
+        )
+
+    def _register_failed(self, session: int, patient: Patient, error: BaseException):
+        self._saving = False
+        if session != self._session or not self.winfo_exists():
+            # O atendimento já não está na tela: a falha não pode passar em silêncio
+            messagebox.showerror("Erro ao salvar",
+                                 f"O paciente '{patient.name}' não foi cadastrado:\n{error}",
+                                 parent=self.master)
+            return
+        self.close_button.configure(state="normal")
+        if isinstance(error, (ValueError, SystemError)):
+            self.result_label.configure(text=f"Erro ao salvar: {error}", text_color="red")
+        else:
+            self.result_label.configure(text=f"Erro inesperado: {error}", text_color="red")